@@ -1,12 +1,16 @@
 import sys
 import os
 import json
+import shutil
+import time
 
 os.chdir(os.getenv("BACKEND_PROJECT_PATH"))
 sys.dont_write_bytecode = True
 
 from run_simulation import Simulation
 from run_extraction import OdbDataExtractor
+from extract_profiles import OdbProfileExtractor
+from job_paths import job_name, job_working_dir, log_file_path, model_config_path
 
 class Command:
     def __init__(self):
@@ -22,7 +26,7 @@ class Command:
     def _create_directories(self):
         self.backend_project_path = os.getenv("BACKEND_PROJECT_PATH")
         self.log_dir_path = os.path.join(self.backend_project_path, "log")
-        self.log_file_path = os.path.join(self.log_dir_path, "abaqus_log.txt")
+        self.log_file_path = log_file_path(self.backend_project_path)
         self.config_dir_path = os.path.join(self.backend_project_path, "model_config")
         self.data_dir_path = os.path.join(self.backend_project_path, "data")
         self.files_dir_path = os.path.join(self.backend_project_path, "files")
@@ -52,8 +56,7 @@ class Command:
             f.write(message + "\n")
 
     def _read_model_config(self):
-        config_file_path = os.path.join(self.config_dir_path, "model_config.json")
-        with open(config_file_path, 'r') as file:
+        with open(model_config_path(self.backend_project_path), 'r') as file:
             config_data = json.load(file)
             
         return config_data
@@ -71,11 +74,40 @@ class Command:
         self.log("    [Extraction] Starting extraction.", self.log_file_path)
         
         config_data = self._read_model_config()
-        extraction = OdbDataExtractor(config_data, self.data_dir_path)
+        model_name = list(config_data.keys())[0]
+        engine = config_data[model_name]['odbExtractor'].get('engine', 'session')
+
+        if engine == 'odbAccess':
+            extraction = OdbProfileExtractor(config_data, self.data_dir_path)
+        else:
+            extraction = OdbDataExtractor(config_data, self.data_dir_path)
         extraction.run()
         
         self.log("    [Extraction] The extraction was completed.", self.log_file_path)
 
+    def _collect_job_files(self):
+        config_data = self._read_model_config()
+        model_name = list(config_data.keys())[0]
+        model_builder = config_data[model_name]['modelBuilder']
+        name = job_name(model_name, model_builder)
+        work_dir_path = job_working_dir(self.backend_project_path, model_builder, name)
+
+        if os.path.normcase(os.path.abspath(work_dir_path)) == os.path.normcase(os.path.abspath(self.files_job_dir_path)):
+            return
+        if not os.path.exists(work_dir_path):
+            return
+
+        keep_odb = model_builder['job'].get('keepOdb', True)
+        kept_extensions = ['.msg', '.sta', '.dat'] + (['.odb'] if keep_odb else [])
+
+        for file_name in os.listdir(work_dir_path):
+            if os.path.splitext(file_name)[1].lower() in kept_extensions:
+                shutil.move(os.path.join(work_dir_path, file_name), os.path.join(self.files_job_dir_path, file_name))
+
+        os.chdir(self.backend_project_path)
+        shutil.rmtree(work_dir_path, ignore_errors=True)
+        self.log("    [Command] Job files collected from scratch: {}".format(work_dir_path), self.log_file_path)
+
     def run(self):
         self._create_directories()
         if os.path.exists(self.log_file_path):
@@ -83,8 +115,19 @@ class Command:
         
         self.log("[Command] Starting execution...", self.log_file_path)
         
-        self._run_simulation()
-        self._run_extraction()  
+        timings = {}
+        try:
+            start_time = time.time()
+            self._run_simulation()
+            timings['simulation'] = time.time() - start_time
+
+            start_time = time.time()
+            self._run_extraction()
+            timings['extraction'] = time.time() - start_time
+        finally:
+            self._collect_job_files()
+            with open(os.path.splitext(self.log_file_path)[0] + "_timings.json", "w") as f:
+                json.dump(timings, f)
         self.log("[Command] End.", self.log_file_path)
 
 if __name__ == "__main__":
@@ -96,12 +139,12 @@ if __name__ == "__main__":
 
         backend_project_path = os.getenv("BACKEND_PROJECT_PATH")
         log_dir = os.path.join(backend_project_path, "log")
-        log_file_path = os.path.join(log_dir, "abaqus_log.txt")
+        error_log_path = os.getenv("ABAQUS_LOG_FILE") or os.path.join(log_dir, "abaqus_log.txt")
 
         if not os.path.exists(log_dir):
             os.makedirs(log_dir)
 
-        with open(log_file_path, "a") as f:
+        with open(error_log_path, "a") as f:
             f.write("\n====================================================\n")
             f.write("\n[COMMAND ERROR] An exception occurred during execution:\n")
             traceback.print_exc(file=f)
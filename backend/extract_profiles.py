@@ -0,0 +1,237 @@
+import argparse
+import glob
+import hashlib
+import json
+import os
+import sys
+
+import numpy as np
+from abaqusConstants import ELEMENT_NODAL, NODAL
+from odbAccess import openOdb
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from job_paths import batch_members, job_name, job_working_dir, log_file_path
+from profile_paths import average_to_nodes, resolve_point_paths, sample_path
+
+
+# Only needs odbAccess and NumPy, so it runs under `abaqus python` without a CAE session.
+class OdbProfileExtractor:
+    def __init__(self, model_config, path_data_dir):
+        self.fullConfig = model_config
+        self.odbName = str(list(self.fullConfig.keys())[0])
+        self.modelBuilder = self.fullConfig[self.odbName]['modelBuilder']
+        self.particleNumber = self.modelBuilder['particleNumber']
+        self.iterationNumber = self.modelBuilder['iterationNumber']
+        self.odbExtractor = self.fullConfig[self.odbName]['odbExtractor']
+        self.instanceName = str(self.odbExtractor.get('instanceName', 'WORKPIECE-1'))
+        self.elementSetName = str(self.odbExtractor.get('elementSetName', 'SETSECTIONJOHNSONCOOK'))
+        self.pathTolerance = self.odbExtractor.get('pathTolerance', 1e-4)
+        self.snapshotConfig = self.odbExtractor.get('snapshot', {})
+        self.extractedData = {}
+        self.pathDataDir = path_data_dir
+        self.backendPath = os.path.dirname(self.pathDataDir)
+        self.logFilePath = log_file_path(self.backendPath)
+
+    def log(self, msg, log_file_path):
+        log_dir = os.path.dirname(log_file_path)
+        if not os.path.exists(log_dir):
+            os.makedirs(log_dir)
+
+        with open(log_file_path, "a") as f:
+            f.write(msg + "\n")
+            f.flush()
+
+    def run(self, odb_paths=None):
+        if not odb_paths:
+            odb_name = job_name(self.odbName, self.modelBuilder)
+            odb_dir = job_working_dir(self.backendPath, self.modelBuilder, odb_name)
+            odb_paths = [os.path.join(odb_dir, "{}.odb".format(odb_name))]
+
+        for odb_path in odb_paths:
+            self.process_odb(odb_path)
+
+        self.save_to_json()
+
+    def process_odb(self, odb_path):
+        odb_name = os.path.splitext(os.path.basename(odb_path))[0]
+        self.log("      - Processing ODB (odbAccess): {}...".format(odb_name), self.logFilePath)
+
+        odb = openOdb(path=odb_path, readOnly=True)
+        try:
+            step_name = str(self.odbExtractor["stepName"])
+            frame = odb.steps[step_name].frames[-1]
+            for member in batch_members(self.modelBuilder):
+                # Batch jobs hold one workpiece instance per member, each saved as its own run.
+                data_name = self.odbName + '_' + member['runName'] if member['suffix'] else odb_name
+                instance = self.get_instance(odb, member['suffix'])
+
+                node_coordinates = self.get_node_coordinates(instance)
+                self.extractedData[data_name] = self.frame_profiles(
+                    frame, instance, node_coordinates, member['yOffset']
+                )
+
+                if self.snapshotConfig.get('enabled', False):
+                    self.export_snapshot(data_name, frame, instance, member['yOffset'])
+        finally:
+            odb.close()
+
+    def frame_profiles(self, frame, instance, node_coordinates, y_offset=0.0):
+        node_labels, nodal_s11 = self._get_nodal_component(frame, instance, 'S', 'S11')
+        coordinates = np.array([node_coordinates[label] for label in node_labels])
+
+        profiles = {}
+        paths = resolve_point_paths(self.odbExtractor, self.modelBuilder["geometry"], y_offset)
+        for path_name, (start, end) in paths.items():
+            profiles[path_name] = sample_path(coordinates, nodal_s11, start, end, self.pathTolerance)
+
+        return profiles
+
+    def get_instance(self, odb, suffix=''):
+        instances = odb.rootAssembly.instances
+        if suffix:
+            base_name, _, number = self.instanceName.rpartition('-')
+            return instances[base_name + suffix.upper() + '-' + number]
+        if self.instanceName in instances.keys():
+            return instances[self.instanceName]
+
+        return instances[list(instances.keys())[0]]
+
+    def get_node_coordinates(self, instance):
+        return dict((node.label, node.coordinates) for node in instance.nodes)
+
+    def _get_nodal_component(self, frame, instance, field_name, component):
+        field = frame.fieldOutputs[field_name]
+        component_index = list(field.componentLabels).index(component)
+
+        region = instance.elementSets[self.elementSetName]
+        subset = field.getSubset(region=region, position=ELEMENT_NODAL)
+
+        labels = []
+        values = []
+        for block in subset.bulkDataBlocks:
+            labels.append(np.asarray(block.nodeLabels))
+            values.append(np.asarray(block.data)[:, component_index])
+
+        return average_to_nodes(np.concatenate(labels), np.concatenate(values))
+
+    def export_snapshot(self, odb_name, frame, instance, y_offset=0.0):
+        snapshot_dir = os.path.join(self.pathDataDir, self.snapshotConfig.get('directory', 'snapshots'))
+        if not os.path.exists(snapshot_dir):
+            os.makedirs(snapshot_dir)
+
+        mesh_file_name = self._export_mesh(snapshot_dir, instance, y_offset)
+        region = instance.elementSets[self.elementSetName]
+
+        arrays = {
+            'mesh_file': np.array(mesh_file_name),
+            'frame_time': np.array(frame.frameValue, dtype=np.float32),
+        }
+        for field_name in self.snapshotConfig.get('fields', ['S', 'PEEQ', 'U']):
+            field_name = str(field_name)
+            if field_name not in frame.fieldOutputs.keys():
+                self.log("      - Field {} not found, skipped in snapshot.".format(field_name), self.logFilePath)
+                continue
+
+            field = frame.fieldOutputs[field_name]
+            position = NODAL if field.locations[0].position == NODAL else ELEMENT_NODAL
+            subset = field.getSubset(region=region, position=position)
+
+            node_labels = []
+            element_labels = []
+            data = []
+            for block in subset.bulkDataBlocks:
+                node_labels.append(np.asarray(block.nodeLabels))
+                if position == ELEMENT_NODAL:
+                    element_labels.append(np.asarray(block.elementLabels))
+                data.append(np.asarray(block.data, dtype=np.float32))
+
+            arrays[field_name + '/nodeLabels'] = np.concatenate(node_labels).astype(np.int32)
+            arrays[field_name + '/data'] = np.concatenate(data)
+            arrays[field_name + '/componentLabels'] = np.array([str(c) for c in field.componentLabels])
+            if element_labels:
+                arrays[field_name + '/elementLabels'] = np.concatenate(element_labels).astype(np.int32)
+
+        run_suffix = odb_name[len(self.odbName) + 1:]
+        snapshot_path = os.path.join(snapshot_dir, "snapshot_{}.npz".format(run_suffix))
+        np.savez_compressed(snapshot_path, **arrays)
+        self.log("      - Snapshot saved: {}".format(snapshot_path), self.logFilePath)
+
+    def _export_mesh(self, snapshot_dir, instance, y_offset=0.0):
+        mesh_items = [self.modelBuilder['geometry'], self.modelBuilder['mesh'], self.elementSetName]
+        if y_offset:
+            mesh_items.append(y_offset)
+        mesh_key = json.dumps(mesh_items, sort_keys=True)
+        mesh_file_name = "mesh_{}.npz".format(hashlib.md5(mesh_key.encode('utf-8')).hexdigest()[:8])
+        mesh_path = os.path.join(snapshot_dir, mesh_file_name)
+        if os.path.exists(mesh_path):
+            return mesh_file_name
+
+        elements = instance.elementSets[self.elementSetName].elements
+        max_nodes = max(len(element.connectivity) for element in elements)
+        connectivity = np.full((len(elements), max_nodes), -1, dtype=np.int32)
+        for i, element in enumerate(elements):
+            connectivity[i, :len(element.connectivity)] = element.connectivity
+
+        np.savez_compressed(
+            mesh_path,
+            nodeLabels=np.array([node.label for node in instance.nodes], dtype=np.int32),
+            coordinates=np.array([node.coordinates for node in instance.nodes], dtype=np.float32),
+            elementLabels=np.array([element.label for element in elements], dtype=np.int32),
+            elementTypes=np.array([str(element.type) for element in elements]),
+            connectivity=connectivity,
+            geometry=np.array(json.dumps(self.modelBuilder['geometry'])),
+            yOffset=np.array(y_offset, dtype=np.float32),
+        )
+        self.log("      - Mesh saved: {}".format(mesh_path), self.logFilePath)
+        return mesh_file_name
+
+    def save_to_json(self, output_path=None, split=True):
+        self.log("      - Saving data to JSON...", self.logFilePath)
+
+        if split:
+            for odb_name, profiles in self.extractedData.items():
+                run_suffix = odb_name[len(self.odbName) + 1:]
+                run_path = os.path.join(self.pathDataDir, "data_{}.json".format(run_suffix))
+                with open(run_path, "w") as f:
+                    json.dump({odb_name: profiles}, f, indent=4)
+                self.log("      - File saved: {}".format(run_path), self.logFilePath)
+
+        if output_path is not None:
+            with open(output_path, "w") as f:
+                json.dump(self.extractedData, f, indent=4)
+            self.log("      - File saved: {}".format(output_path), self.logFilePath)
+
+
+def _parse_arguments(argv):
+    parser = argparse.ArgumentParser(description="Batch S11 profile extraction with odbAccess.")
+    parser.add_argument("odbs", nargs="+", help="ODB files or glob patterns.")
+    parser.add_argument("--config", default=os.path.join("backend", "model_config", "model_config.json"))
+    parser.add_argument("--data-dir", default=os.path.join("backend", "data"))
+    parser.add_argument("--output", default=None, help="Single JSON file with the profiles of every ODB.")
+    parser.add_argument("--no-split", action="store_true", help="Do not write one data_*.json file per ODB.")
+    parser.add_argument("--snapshot", action="store_true", help="Also export last-frame field snapshots (.npz).")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = _parse_arguments(sys.argv[1:] if argv is None else argv)
+
+    odb_paths = []
+    for pattern in args.odbs:
+        odb_paths.extend(sorted(glob.glob(pattern)) or [pattern])
+
+    with open(args.config, "r") as f:
+        model_config = json.load(f)
+
+    extractor = OdbProfileExtractor(model_config, os.path.abspath(args.data_dir))
+    if args.snapshot:
+        extractor.snapshotConfig['enabled'] = True
+    for odb_path in odb_paths:
+        extractor.process_odb(odb_path)
+    extractor.save_to_json(args.output, split=not args.no_split)
+
+    print("Extracted {} ODB(s).".format(len(extractor.extractedData)))
+
+
+if __name__ == "__main__":
+    main()
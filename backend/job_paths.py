@@ -0,0 +1,52 @@
+import os
+
+
+def run_name(model_builder):
+    if model_builder.get('runName'):
+        return str(model_builder['runName'])
+
+    return 'i{}_p{}'.format(model_builder['iterationNumber'], model_builder['particleNumber'])
+
+
+def job_name(model_name, model_builder):
+    return model_name + '_' + run_name(model_builder)
+
+
+def job_working_dir(backend_path, model_builder, name):
+    scratch_dir = model_builder['job'].get('scratchDir')
+    if scratch_dir:
+        return os.path.join(os.path.expandvars(os.path.expanduser(scratch_dir)), name)
+
+    return os.path.join(backend_path, 'files', 'job')
+
+
+def log_file_path(backend_path):
+    return os.getenv("ABAQUS_LOG_FILE") or os.path.join(backend_path, "log", "abaqus_log.txt")
+
+
+def model_config_path(backend_path):
+    return os.getenv("MODEL_CONFIG_FILE") or os.path.join(backend_path, "model_config", "model_config.json")
+
+
+def batch_members(model_builder):
+    members = model_builder.get('batchMembers')
+    if not members:
+        return [{
+            'suffix': '',
+            'yOffset': 0.0,
+            'runName': run_name(model_builder),
+            'material': model_builder['material'],
+            'pulse': model_builder['pulse'],
+        }]
+
+    # Members are stacked along the symmetry axis with a gap, so their workpieces never touch.
+    geometry = model_builder['geometry']
+    spacing = geometry['heightFiniteCube'] + geometry['infiniteBorder'] + geometry.get('batchGap', geometry['infiniteBorder'])
+
+    return [{
+        'suffix': '_m{}'.format(k),
+        'yOffset': k * spacing,
+        'runName': str(member['runName']),
+        'material': member['material'],
+        'pulse': member['pulse'],
+    } for k, member in enumerate(members)]
@@ -0,0 +1,54 @@
+import numpy as np
+
+
+def resolve_point_paths(odb_config, geometry_config, y_offset=0.0):
+    height_model = geometry_config["heightFiniteCube"] + geometry_config["infiniteBorder"] + y_offset
+
+    surface_point_path = odb_config["surfacePointPath"]
+    depth_point_path = odb_config["depthPointPath"]
+
+    surface_start = (surface_point_path[0][0], height_model)
+    surface_end = (surface_point_path[1][0], height_model)
+
+    depth_start = (depth_point_path[0][0], height_model)
+    depth_end = (depth_point_path[1][0], depth_point_path[1][1] + height_model)
+
+    return {
+        "surface": (surface_start, surface_end),
+        "depth": (depth_start, depth_end),
+    }
+
+
+def average_to_nodes(node_labels, values):
+    node_labels = np.asarray(node_labels).ravel()
+    values = np.asarray(values, dtype=float)
+
+    unique_labels, inverse = np.unique(node_labels, return_inverse=True)
+    sums = np.zeros((len(unique_labels),) + values.shape[1:])
+    np.add.at(sums, inverse, values)
+    counts = np.bincount(inverse).reshape((-1,) + (1,) * (values.ndim - 1))
+
+    return unique_labels, sums / counts
+
+
+def sample_path(node_coordinates, nodal_values, start, end, tolerance=1e-4):
+    coordinates = np.asarray(node_coordinates, dtype=float)[:, :2]
+    nodal_values = np.asarray(nodal_values, dtype=float)
+    start = np.asarray(start, dtype=float)
+    end = np.asarray(end, dtype=float)
+
+    direction = end - start
+    length = np.linalg.norm(direction)
+    direction = direction / length
+
+    relative = coordinates - start
+    distance_along = relative.dot(direction)
+    distance_off = np.abs(relative[:, 0] * direction[1] - relative[:, 1] * direction[0])
+
+    on_path = (distance_off <= tolerance) & (distance_along >= -tolerance) & (distance_along <= length + tolerance)
+    order = np.argsort(distance_along[on_path])
+
+    distances = np.clip(distance_along[on_path][order], 0.0, length)
+    values = nodal_values[on_path][order]
+
+    return [[float(d), float(v)] for d, v in zip(distances, values)]
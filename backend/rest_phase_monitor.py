@@ -0,0 +1,146 @@
+import json
+import os
+import time
+
+import numpy as np
+from abaqusConstants import ABORTED, COMPLETED, TERMINATED
+from odbAccess import openOdb
+
+from extract_profiles import OdbProfileExtractor
+from job_paths import log_file_path
+
+# Steps are numbered in the .sta file: 1 is ShotPhase, 2 is RestPhase.
+REST_PHASE_STEP = 2
+
+# Final job states; ABORTED also covers failures before the analysis starts (e.g. in the packager).
+FINISHED_STATES = (COMPLETED, ABORTED, TERMINATED)
+
+
+class RestPhaseMonitor:
+    def __init__(self, model_config, path_data_dir, job_dir, job_name):
+        self.fullConfig = model_config
+        self.modelName = str(list(self.fullConfig.keys())[0])
+        self.modelBuilder = self.fullConfig[self.modelName]['modelBuilder']
+        self.stepName = str(self.fullConfig[self.modelName]['odbExtractor']['stepName'])
+
+        settings = self.modelBuilder.get('restPhaseMonitor', {})
+        self.kineticEnergyRatio = settings.get('kineticEnergyRatio', 0.01)
+        self.s11Tolerance = settings.get('s11Tolerance', 0.01)
+        self.window = settings.get('window', 3)
+        self.minRestFraction = settings.get('minRestFraction', 0.1)
+        self.pollInterval = settings.get('pollInterval', 5.0)
+
+        step_params = self.modelBuilder['step']
+        self.restStart = step_params['durationShotPhase']
+        self.restDuration = step_params['durationRestPhase']
+
+        self.jobName = job_name
+        self.staPath = os.path.join(job_dir, job_name + '.sta')
+        self.odbPath = os.path.join(job_dir, job_name + '.odb')
+
+        self.extractor = OdbProfileExtractor(model_config, path_data_dir)
+        self.backendPath = os.path.dirname(path_data_dir)
+        self.logFilePath = log_file_path(self.backendPath)
+        self.reportPath = os.path.splitext(self.logFilePath)[0] + '_early_stop.json'
+
+    def log(self, msg, log_file_path):
+        with open(log_file_path, "a") as f:
+            f.write(msg + "\n")
+            f.flush()
+
+    def _read_text(self, path):
+        if not os.path.exists(path):
+            return ''
+        with open(path, 'r') as f:
+            return f.read()
+
+    def _job_finished(self, job):
+        if job.status in FINISHED_STATES:
+            return True
+        return 'THE ANALYSIS HAS' in self._read_text(self.staPath)
+
+    def _read_energies(self):
+        records = []
+        step = 1
+        for line in self._read_text(self.staPath).splitlines():
+            tokens = line.split()
+            if len(tokens) >= 2 and tokens[0] == 'STEP' and tokens[1].isdigit():
+                step = int(tokens[1])
+            # Explicit increment rows: increment, step time, total time, wall clock, stable increment,
+            # critical element, kinetic energy, total energy, ...
+            elif len(tokens) >= 8 and tokens[0].isdigit() and ':' in tokens[3]:
+                try:
+                    records.append((step, float(tokens[2]), float(tokens[6])))
+                except ValueError:
+                    pass
+
+        return records
+
+    def _kinetic_energy_settled(self, records):
+        rest_records = [record for record in records if record[0] == REST_PHASE_STEP]
+        if len(rest_records) < self.window:
+            return False
+        if rest_records[-1][1] - self.restStart < self.minRestFraction * self.restDuration:
+            return False
+
+        peak = max(record[2] for record in records)
+        if peak <= 0.0:
+            return False
+
+        return all(record[2] <= self.kineticEnergyRatio * peak for record in rest_records[-self.window:])
+
+    def _s11_settled(self):
+        try:
+            odb = openOdb(path=self.odbPath, readOnly=True)
+        except Exception as e:
+            self.log("      - [Monitor] ODB not readable yet: {}".format(e), self.logFilePath)
+            return False
+
+        try:
+            frames = odb.steps[self.stepName].frames
+            if len(frames) < self.window + 1:
+                return False
+
+            instance = self.extractor.get_instance(odb)
+            node_coordinates = self.extractor.get_node_coordinates(instance)
+            profiles = [
+                np.array(self.extractor.frame_profiles(frames[i], instance, node_coordinates)['surface'])[:, 1]
+                for i in range(len(frames) - self.window - 1, len(frames))
+            ]
+        except Exception as e:
+            self.log("      - [Monitor] S11 profile not available: {}".format(e), self.logFilePath)
+            return False
+        finally:
+            odb.close()
+
+        scale = max(np.max(np.abs(profiles[-1])), 1e-12)
+        changes = [np.sqrt(np.mean((after - before) ** 2)) / scale for before, after in zip(profiles[:-1], profiles[1:])]
+        return max(changes) <= self.s11Tolerance
+
+    def _write_report(self, stopped, stop_time):
+        report = {'stopped': stopped, 'restDuration': self.restDuration}
+        if stopped:
+            report['stopTime'] = stop_time
+            report['restTime'] = stop_time - self.restStart
+            report['restFraction'] = (stop_time - self.restStart) / self.restDuration
+
+        with open(self.reportPath, 'w') as f:
+            json.dump(report, f, indent=4)
+
+    def watch(self, job):
+        while not self._job_finished(job):
+            time.sleep(self.pollInterval)
+
+            records = self._read_energies()
+            if not self._kinetic_energy_settled(records) or not self._s11_settled():
+                continue
+
+            stop_time = records[-1][1]
+            self.log("      - [Monitor] Kinetic energy and S11 profile settled at t = {:.3e} s, stopping job.".format(
+                stop_time), self.logFilePath)
+            job.kill()
+            self._write_report(True, stop_time)
+            return True
+
+        self._write_report(False, None)
+        return False
@@ -3,12 +3,14 @@ import os
 from abaqus import session
 from abaqusConstants import *
 from odbAccess import openOdb
+from job_paths import batch_members, job_name, job_working_dir, log_file_path
+from profile_paths import resolve_point_paths
 
 
 class OdbDataExtractor:
     def __init__(self, model_config, path_data_dir):
         self.fullConfig = model_config
-        self.odbName = str(self.fullConfig.keys()[0])
+        self.odbName = str(list(self.fullConfig.keys())[0])
         self.modelBuilder = self.fullConfig[self.odbName]['modelBuilder']
         self.particleNumber = self.modelBuilder['particleNumber']
         self.iterationNumber = self.modelBuilder['iterationNumber']
@@ -16,15 +18,14 @@ class OdbDataExtractor:
         self.extractedData = {}
         self.pathDataDir = path_data_dir
         self.backendPath = os.path.dirname(self.pathDataDir)
-        self.logFilePath = os.path.join(self.backendPath, "log", "abaqus_log.txt")
+        self.logFilePath = log_file_path(self.backendPath)
         
     def log(self, msg, log_file_path):
         log_dir = os.path.dirname(log_file_path)
         if not os.path.exists(log_dir):
             os.makedirs(log_dir)
-        log_path = os.path.join(log_dir, "abaqus_log.txt")
 
-        with open(log_path, "a") as f:
+        with open(log_file_path, "a") as f:
             f.write(msg + "\n")
             f.flush()
 
@@ -35,72 +36,50 @@ class OdbDataExtractor:
     def process_odb(self, odb_name, odb_config, model_config):
         self.log("      - Processing ODB: {}...".format(odb_name), self.logFilePath)
 
-        odb_name = odb_name + "_i{}_p{}".format(self.iterationNumber, self.particleNumber)
-        odb_path = os.path.join(self.backendPath, "files", "job", "{}.odb".format(odb_name))
+        odb_name = job_name(odb_name, model_config)
+        odb_dir = job_working_dir(self.backendPath, model_config, odb_name)
+        odb_path = os.path.join(odb_dir, "{}.odb".format(odb_name))
         self.odb = openOdb(path=odb_path)
         session.viewports['Viewport: 1'].setValues(displayedObject=self.odb)
 
         step_name = str(odb_config["stepName"])
         last_frame_index = len(self.odb.steps[step_name].frames) - 1
 
-        surface_point_path = odb_config["surfacePointPath"]
-        height_model = model_config["geometry"]["heightFiniteCube"] + model_config["geometry"]["infiniteBorder"]
-        surface_point_path[0][1] = height_model
-        surface_point_path[1][1] = height_model
+        # Batch jobs hold one workpiece per member; their paths are shifted to that member's surface.
+        for member in batch_members(model_config):
+            data_name = self.odbName + '_' + member['runName'] if member['suffix'] else odb_name
+            paths = resolve_point_paths(odb_config, model_config["geometry"], member['yOffset'])
+            self.extractedData[data_name] = {}
 
-        depth_point_path = odb_config["depthPointPath"]
-        depth_point_path[0][1] = height_model
-        depth_point_path[1][1] = depth_point_path[1][1] + height_model
+            for path_name, (start, end) in paths.items():
+                path_obj_name = "{}_path_{}".format(path_name, data_name)
+                path_points = (tuple(start) + (0.0, ), tuple(end) + (0.0, ))
+                point_path = session.Path(
+                        name=path_obj_name,
+                        type=POINT_LIST,
+                        expression=path_points
+                    )
 
-        path_obj_name = "surface_path_{}".format(odb_name)
-        path_points = tuple(tuple(p) for p in surface_point_path)
-        surface_path = session.Path(
-                name=path_obj_name,
-                type=POINT_LIST,
-                expression=path_points
-            )
-        
-        path_obj_name = "depth_path_{}".format(odb_name)
-        path_points = tuple(tuple(p) for p in depth_point_path)
-        depth_path = session.Path(
-                name=path_obj_name,
-                type=POINT_LIST,
-                expression=path_points
-            )
-        
-        self.extractedData[odb_name] = {}
-    
-        xy_data_obj = session.XYDataFromPath(
-            name="temp_xy_data",
-            path=surface_path,
-            frame=last_frame_index,
-            step=1,
-            includeIntersections=True,
-            shape=UNDEFORMED,
-            labelType=TRUE_DISTANCE,
-            variable=('S', INTEGRATION_POINT, ((COMPONENT, 'S11'),)),
-            pathStyle=PATH_POINTS
-        )
-        self.extractedData[odb_name]['surface'] = xy_data_obj.data
-
-        xy_data_obj = session.XYDataFromPath(
-            name="temp_xy_data",
-            path=depth_path,
-            frame=last_frame_index,
-            step=1,
-            includeIntersections=True,
-            shape=UNDEFORMED,
-            labelType=TRUE_DISTANCE,
-            variable=('S', INTEGRATION_POINT, ((COMPONENT, 'S11'),)),
-            pathStyle=PATH_POINTS
-        )
-        self.extractedData[odb_name]['depth'] = xy_data_obj.data
+                xy_data_obj = session.XYDataFromPath(
+                    name="temp_xy_data",
+                    path=point_path,
+                    frame=last_frame_index,
+                    step=1,
+                    includeIntersections=True,
+                    shape=UNDEFORMED,
+                    labelType=TRUE_DISTANCE,
+                    variable=('S', INTEGRATION_POINT, ((COMPONENT, 'S11'),)),
+                    pathStyle=PATH_POINTS
+                )
+                self.extractedData[data_name][path_name] = xy_data_obj.data
         
     def save_to_json(self):
         self.log("      - Saving data to JSON...", self.logFilePath)
-        output_path = os.path.join(self.pathDataDir, "data_i{}_p{}.json".format(self.iterationNumber, self.particleNumber))
+        for member in batch_members(self.modelBuilder):
+            data_name = self.odbName + '_' + member['runName'] if member['suffix'] else job_name(self.odbName, self.modelBuilder)
+            output_path = os.path.join(self.pathDataDir, "data_{}.json".format(member['runName']))
 
-        with open(output_path, "w") as f:
-            json.dump(self.extractedData, f, indent=4)
+            with open(output_path, "w") as f:
+                json.dump({data_name: self.extractedData[data_name]}, f, indent=4)
 
-        self.log("      - File saved: {}".format(output_path), self.logFilePath)
+            self.log("      - File saved: {}".format(output_path), self.logFilePath)
@@ -15,17 +15,25 @@ from visualization import *
 from connectorBehavior import *
 from abaqus import *
 from abaqusConstants import *
+import abaqusConstants
+from job_paths import batch_members, job_name as build_job_name, job_working_dir, log_file_path
+from rest_phase_monitor import RestPhaseMonitor
+
+# Values accepted by mdb.Job for the two precision options of solverControls.
+EXPLICIT_PRECISIONS = ('SINGLE', 'FORCE_SINGLE', 'DOUBLE', 'DOUBLE_CONSTRAINT_ONLY', 'DOUBLE_PLUS_PACK')
+NODAL_OUTPUT_PRECISIONS = ('SINGLE', 'FULL')
 
 class Simulation:
     def __init__(self, model_config, path_data_dir):
         self.fullConfig = model_config
-        self.modelName = str(self.fullConfig.keys()[0])
+        self.modelName = str(list(self.fullConfig.keys())[0])
         self.modelBuilder = self.fullConfig[self.modelName]['modelBuilder']
         self.particleNumber = self.modelBuilder['particleNumber']
         self.iterationNumber = self.modelBuilder['iterationNumber']
         self.pathDataDir = path_data_dir
         self.backendPath = os.path.dirname(self.pathDataDir)
-        self.logFilePath = os.path.join(self.backendPath, "log", "abaqus_log.txt")
+        self.logFilePath = log_file_path(self.backendPath)
+        self.members = batch_members(self.modelBuilder)
         
         Mdb()
         session.journalOptions.setValues(replayGeometry=INDEX, recoverGeometry=INDEX)
@@ -36,30 +44,43 @@ class Simulation:
         log_dir = os.path.dirname(log_file_path)
         if not os.path.exists(log_dir):
             os.makedirs(log_dir)
-        log_path = os.path.join(log_dir, "abaqus_log.txt")
 
-        with open(log_path, "a") as f:
+        with open(log_file_path, "a") as f:
             f.write(msg + "\n")
             f.flush()
 
     def run(self):
-        self._create_materials()
-        self._create_parts()
-        self._create_sections()
+        self._create_assembly()
         self._create_steps()
-        self._create_partitions()
-        self._create_loads()
-        self._create_mesh()
-        self._create_boundary_conditions()
+        for member in self.members:
+            if member['suffix']:
+                self.log("    [Batch] Creating workpiece for {}...".format(member['runName']), self.logFilePath)
+            self._create_materials(member)
+            self._create_parts(member)
+            self._create_sections(member)
+            self._create_partitions(member)
+            self._create_loads(member)
+            self._create_mesh(member)
+            self._create_boundary_conditions(member)
         self._create_job()
 
-    def _create_materials(self):
+    def _create_assembly(self):
+        self.rootAssembly = self.model.rootAssembly
+        self.rootAssembly.DatumCsysByThreePoints(
+            coordSysType=CYLINDRICAL, 
+            origin=(0.0, 0.0, 0.0), 
+            point1=(1.0, 0.0, 0.0), 
+            point2=(0.0, 0.0, -1.0)
+            )
+
+    def _create_materials(self, member):
         self.log("      - Creating materials...", self.logFilePath)
-        mat_params = self.modelBuilder['material']
+        suffix = member['suffix']
+        mat_params = member['material']
         jc_params = mat_params['johnsonCook']
         elastic_params = mat_params['elastic']
         
-        self.materialJohnsonCook = self.model.Material(name='johnsonCook')
+        self.materialJohnsonCook = self.model.Material(name='johnsonCook' + suffix)
 
         self.materialJohnsonCook.Plastic(hardening=JOHNSON_COOK, table=((
             jc_params['a'], 
@@ -78,15 +99,16 @@ class Simulation:
         
         self.materialJohnsonCook.Density(table=((mat_params['density'], ), ))
 
-        self.materialElastic = self.model.Material(name='elastic')
+        self.materialElastic = self.model.Material(name='elastic' + suffix)
 
         self.materialElastic.Elastic(table=((
             elastic_params['youngModulus'], 
             elastic_params['poissonRatio']), ))
         self.materialElastic.Density(table=((mat_params['density'], ), ))
 
-    def _create_parts(self):
+    def _create_parts(self, member):
         self.log("      - Creating parts...", self.logFilePath)
+        suffix = member['suffix']
         geo_params = self.modelBuilder['geometry']
 
         length_finite_cube = geo_params['lengthFiniteCube']
@@ -96,54 +118,53 @@ class Simulation:
         point1_finite_cube = (0.0, infinite_border)
         point2_finite_cube = (length_finite_cube, infinite_border + height_finite_cube)
 
-        sketch_finite_cube = self.model.ConstrainedSketch(name='sketch_finite_cube', sheetSize=200.0)
+        sketch_finite_cube = self.model.ConstrainedSketch(name='sketch_finite_cube' + suffix, sheetSize=200.0)
         sketch_finite_cube.sketchOptions.setValues(viewStyle=AXISYM)
         sketch_finite_cube.ConstructionLine(point1=(0.0, 0.0), point2=(0.0, 1.0))
         sketch_finite_cube.rectangle(point1=point1_finite_cube, point2=point2_finite_cube)
 
-        finite_cube_part = self.model.Part(dimensionality=AXISYMMETRIC, name='finiteCube', type=DEFORMABLE_BODY)
+        finite_cube_part = self.model.Part(dimensionality=AXISYMMETRIC, name='finiteCube' + suffix, type=DEFORMABLE_BODY)
         finite_cube_part.BaseShell(sketch=sketch_finite_cube)
 
         point1_infinite_cube = (0.0, 0.0)
         point2_infinite_cube = (length_finite_cube + infinite_border, infinite_border + height_finite_cube)
 
-        sketch_infinite_cube = self.model.ConstrainedSketch(name='sketch_infinite_cube', sheetSize=200.0)
+        sketch_infinite_cube = self.model.ConstrainedSketch(name='sketch_infinite_cube' + suffix, sheetSize=200.0)
         sketch_infinite_cube.sketchOptions.setValues(viewStyle=AXISYM)
         sketch_infinite_cube.ConstructionLine(point1=(0.0, 0.0), point2=(0.0, 1.0))
         sketch_infinite_cube.rectangle(point1=point1_infinite_cube, point2=point2_infinite_cube)
 
-        infinite_cube_part = self.model.Part(dimensionality=AXISYMMETRIC, name='infiniteCube', type=DEFORMABLE_BODY)
+        infinite_cube_part = self.model.Part(dimensionality=AXISYMMETRIC, name='infiniteCube' + suffix, type=DEFORMABLE_BODY)
         infinite_cube_part.BaseShell(sketch=sketch_infinite_cube)
 
-        self.rootAssembly = self.model.rootAssembly
-        self.rootAssembly.DatumCsysByThreePoints(
-            coordSysType=CYLINDRICAL, 
-            origin=(0.0, 0.0, 0.0), 
-            point1=(1.0, 0.0, 0.0), 
-            point2=(0.0, 0.0, -1.0)
-            )
-        
-        finite_cube_instance = self.rootAssembly.Instance(dependent=ON, name='finiteCubeInstance', part=finite_cube_part)
-        infinite_cube_instance = self.rootAssembly.Instance(dependent=ON, name='infiniteCubeInstance', part=infinite_cube_part)
+        finite_cube_instance = self.rootAssembly.Instance(dependent=ON, name='finiteCubeInstance' + suffix, part=finite_cube_part)
+        infinite_cube_instance = self.rootAssembly.Instance(dependent=ON, name='infiniteCubeInstance' + suffix, part=infinite_cube_part)
         
         self.rootAssembly.InstanceFromBooleanMerge(
             domain=GEOMETRY, 
             instances=(finite_cube_instance, infinite_cube_instance), 
             keepIntersections=ON, 
-            name='workpiece', 
+            name='workpiece' + suffix, 
             originalInstances=DELETE
             )
+
+        if member['yOffset']:
+            self.rootAssembly.translate(
+                instanceList=('workpiece' + suffix + '-1', ), 
+                vector=(0.0, member['yOffset'], 0.0)
+                )
         
         del finite_cube_part
         del infinite_cube_part
 
-    def _create_sections(self):
+    def _create_sections(self, member):
         self.log("      - Creating sections...", self.logFilePath)
-        self.workpiecePart = self.model.parts['workpiece']
+        suffix = member['suffix']
+        self.workpiecePart = self.model.parts['workpiece' + suffix]
         geo_params = self.modelBuilder['geometry']
         
-        self.model.HomogeneousSolidSection(material='elastic', name='SectionElastic', thickness=None)
-        self.model.HomogeneousSolidSection(material='johnsonCook', name='SectionJohnsonCook', thickness=None)
+        self.model.HomogeneousSolidSection(material='elastic' + suffix, name='SectionElastic' + suffix, thickness=None)
+        self.model.HomogeneousSolidSection(material='johnsonCook' + suffix, name='SectionJohnsonCook' + suffix, thickness=None)
         
         faces_jc = self.workpiecePart.faces.findAt(((
             geo_params['lengthFiniteCube'] / 2.0, 
@@ -151,7 +172,7 @@ class Simulation:
             0.0),))
         set_section_jhonson_cook = self.workpiecePart.Set(faces=faces_jc, name='SetSectionJohnsonCook')
         self.workpiecePart.SectionAssignment(offset=0.0, offsetField='', offsetType=MIDDLE_SURFACE, 
-                                         region=set_section_jhonson_cook, sectionName='SectionJohnsonCook', 
+                                         region=set_section_jhonson_cook, sectionName='SectionJohnsonCook' + suffix, 
                                          thicknessAssignment=FROM_SECTION)
         
         faces_elastic = self.workpiecePart.faces.findAt(((
@@ -160,7 +181,7 @@ class Simulation:
              0.0),))
         set_section_elastic = self.workpiecePart.Set(faces=faces_elastic, name='SetSectionElastic')
         self.workpiecePart.SectionAssignment(offset=0.0, offsetField='', offsetType=MIDDLE_SURFACE, 
-                                         region=set_section_elastic, sectionName='SectionElastic', 
+                                         region=set_section_elastic, sectionName='SectionElastic' + suffix, 
                                          thicknessAssignment=FROM_SECTION)
 
     def _create_steps(self):
@@ -170,16 +191,50 @@ class Simulation:
         self.model.ExplicitDynamicsStep(
             name='ShotPhase', 
             previous='Initial', 
-            timePeriod=step_params['durationShotPhase']
+            timePeriod=step_params['durationShotPhase'],
+            **self._step_controls('ShotPhase')
         )
         
         self.model.ExplicitDynamicsStep(
             name='RestPhase', 
             previous='ShotPhase',
-            timePeriod=step_params['durationRestPhase']
+            timePeriod=step_params['durationRestPhase'],
+            **self._step_controls('RestPhase')
         )
 
-    def _create_partitions(self):
+    def _precision(self, solver_controls, key, allowed):
+        value = str(solver_controls.get(key, 'SINGLE'))
+        if value not in allowed:
+            raise ValueError("solverControls.{} must be one of {}, got {}".format(key, ', '.join(allowed), value))
+        return getattr(abaqusConstants, value)
+
+    def _solver_controls(self):
+        controls = self.modelBuilder.get('solverControls', {})
+        return controls if controls.get('enabled', False) else {}
+
+    def _step_controls(self, step_name):
+        controls = self._solver_controls()
+        options = {}
+
+        if 'bulkViscosity' in controls:
+            options['linearBulkViscosity'] = controls['bulkViscosity']['linear']
+            options['quadBulkViscosity'] = controls['bulkViscosity']['quadratic']
+        if 'timeScaleFactor' in controls:
+            options['scaleFactor'] = controls['timeScaleFactor']
+
+        mass_scaling = controls.get('massScaling', {})
+        if mass_scaling.get('enabled', False) and step_name in mass_scaling.get('steps', ['RestPhase']):
+            # Semi-automatic scaling of the elements whose stable increment is below the target.
+            frequency = getattr(abaqusConstants, str(mass_scaling.get('frequency', 'AT_BEGINNING')))
+            options['massScaling'] = ((
+                SEMI_AUTOMATIC, MODEL, frequency, 0.0, mass_scaling['targetIncrement'], BELOW_MIN,
+                mass_scaling.get('intervals', 0), 0, 0.0, 0.0, 0, None), )
+
+        if options:
+            self.log("      - Solver controls for {}: {}".format(step_name, sorted(options)), self.logFilePath)
+        return options
+
+    def _create_partitions(self, member):
         self.log("      - Creating partitions...", self.logFilePath)
         geo_params = self.modelBuilder['geometry']
         height_finite_cube = geo_params['heightFiniteCube']
@@ -217,11 +272,12 @@ class Simulation:
             point2= self.workpiecePart.datums[6]
             )
         
-    def _create_loads(self):
+    def _create_loads(self, member):
         self.log("      - Creating loads...", self.logFilePath)
-        pulse_params = self.modelBuilder['pulse']
+        suffix = member['suffix']
+        pulse_params = member['pulse']
         geo_params = self.modelBuilder['geometry']
-        total_height = geo_params['heightFiniteCube'] + geo_params['infiniteBorder']
+        total_height = geo_params['heightFiniteCube'] + geo_params['infiniteBorder'] + member['yOffset']
         p0 = pulse_params['p0']
         pMax = pulse_params['pMax']
         rMax = pulse_params['rMax']
@@ -229,7 +285,7 @@ class Simulation:
         timeMax = pulse_params['timeMax']
 
         self.model.MappedField(description='', fieldDataType=SCALAR, 
-            localCsys=None, name='pulseLoadSpatialProfile', partLevelData=False, 
+            localCsys=None, name='pulseLoadSpatialProfile' + suffix, partLevelData=False, 
             pointDataFormat=XYZ, regionType=POINT, 
             xyzPointData=(
                 (0.0, total_height, 0.0, p0), 
@@ -240,29 +296,29 @@ class Simulation:
         
         self.model.TabularAmplitude(
             data=((0.0, 0.0), (timeMax / 2.0, 1.0), (timeMax, 0.0)), 
-            name='pulseLoadTemporalProfile',
+            name='pulseLoadTemporalProfile' + suffix,
             smooth=SOLVER_DEFAULT, 
             timeSpan=STEP
             )
         
         self.model.rootAssembly.Surface(
-            name='loadSurface', 
-            side1Edges= self.rootAssembly.instances['workpiece-1'].edges[10:11]
+            name='loadSurface' + suffix, 
+            side1Edges= self.rootAssembly.instances['workpiece' + suffix + '-1'].edges[10:11]
             )
         
         load = self.model.Pressure(
-            amplitude='pulseLoadTemporalProfile', 
+            amplitude='pulseLoadTemporalProfile' + suffix, 
             createStepName='ShotPhase', 
             distributionType=FIELD, 
-            field='pulseLoadSpatialProfile', 
+            field='pulseLoadSpatialProfile' + suffix, 
             magnitude=1.0, 
-            name='pulseLoad', 
-            region= self.rootAssembly.surfaces['loadSurface']
+            name='pulseLoad' + suffix, 
+            region= self.rootAssembly.surfaces['loadSurface' + suffix]
             )
                 
         load.deactivate('RestPhase')
         
-    def _create_mesh(self):
+    def _create_mesh(self, member):
         self.log("      - Generating mesh...", self.logFilePath)
         workpiece_edges = self.workpiecePart.edges
         workpiece_faces = self.workpiecePart.faces
@@ -355,27 +411,33 @@ class Simulation:
         workpiece_part.generateMesh()
         self.model.rootAssembly.regenerate()
 
-    def _create_boundary_conditions(self):
+    def _create_boundary_conditions(self, member):
         self.log("      - Creating boundary conditions...", self.logFilePath)
+        suffix = member['suffix']
         root_assembly = self.model.rootAssembly
+        workpiece_instance = root_assembly.instances['workpiece' + suffix + '-1']
 
         root_assembly.Set(edges=
-            root_assembly.instances['workpiece-1'].edges[13:14]+\
-            root_assembly.instances['workpiece-1'].edges[17:18]+\
-            root_assembly.instances['workpiece-1'].edges[20:21]
-            , name='SetAxissymmetryEdges')
+            workpiece_instance.edges[13:14]+\
+            workpiece_instance.edges[17:18]+\
+            workpiece_instance.edges[20:21]
+            , name='SetAxissymmetryEdges' + suffix)
         
         self.model.DisplacementBC(amplitude=UNSET, createStepName=
             'Initial', distributionType=UNIFORM, fieldName='', localCsys=None, name=
-            'axisSymmetry', region=root_assembly.sets['SetAxissymmetryEdges'], 
+            'axisSymmetry' + suffix, region=root_assembly.sets['SetAxissymmetryEdges' + suffix], 
             u1=SET, u2=UNSET, ur3=UNSET)
 
     def _create_job(self):
         self.log("      - Creating job and processing input file...", self.logFilePath)
-        job_name = self.modelName + '_i{}_p{}'.format(self.iterationNumber, self.particleNumber)
+        job_name = build_job_name(self.modelName, self.modelBuilder)
+        mock_job_name = 'JobMock_' + job_name
         step_params = self.modelBuilder['step']
         total_frames = step_params['totalFrames']
         num_cpus = self.modelBuilder['job']['numCPUs']
+        solver_controls = self._solver_controls()
+        explicit_precision = self._precision(solver_controls, 'precision', EXPLICIT_PRECISIONS)
+        nodal_output_precision = self._precision(solver_controls, 'nodalOutputPrecision', NODAL_OUTPUT_PRECISIONS)
         
         self.model.fieldOutputRequests['F-Output-1'].setValues(
             variables=('S', 'U', 'PEEQ'), numIntervals=total_frames)
@@ -383,47 +445,55 @@ class Simulation:
         mdb.Job(activateLoadBalancing=False, atTime=None, contactPrint=OFF, 
                 description='', echoPrint=OFF, explicitPrecision=SINGLE, historyPrint=OFF, 
                 memory=90, memoryUnits=PERCENTAGE, model=self.modelName, modelPrint=OFF, 
-                multiprocessingMode=DEFAULT, name='JobMock', nodalOutputPrecision=SINGLE, 
+                multiprocessingMode=DEFAULT, name=mock_job_name, nodalOutputPrecision=SINGLE, 
                 numCpus=1, numDomains=1, parallelizationMethodExplicit=DOMAIN, queue=None, 
                 resultsFormat=ODB, scratch='', type=ANALYSIS, userSubroutine='', waitHours=0, waitMinutes=0)
         
         files_path = os.path.join(self.backendPath, 'files')
         inp_path = os.path.join(files_path, 'inp')
-        job_path = os.path.join(files_path, 'job')
+        job_path = job_working_dir(self.backendPath, self.modelBuilder, job_name)
+        scratch_path = job_path if self.modelBuilder['job'].get('scratchDir') else ''
         cae_path = os.path.join(files_path, 'cae')
 
         if not os.path.exists(inp_path):
             os.makedirs(inp_path)
         if not os.path.exists(job_path):
             os.makedirs(job_path)
+        if not os.path.exists(cae_path):
+            os.makedirs(cae_path)
 
         os.chdir(inp_path)
-        mdb.jobs['JobMock'].writeInput()
+        mdb.jobs[mock_job_name].writeInput()
         self.log("      - Input file for the job created successfully.", self.logFilePath)
 
-        inp_file_path = os.path.join(inp_path, 'JobMock.inp')
+        inp_file_path = os.path.join(inp_path, mock_job_name + '.inp')
         self._modify_element_type(inp_file_path, "ACAX4", "CINAX4")
 
         os.chdir(cae_path)
-        mdb.saveAs(self.modelName + '_i{}_p{}'.format(self.iterationNumber, self.particleNumber) + '.cae')
+        mdb.saveAs(job_name + '.cae')
 
         os.chdir(job_path)
         mdb.ModelFromInputFile(name=self.modelName + '_infinite', inputFileName= inp_file_path)
         self.log("      - Model created from input file successfully.", self.logFilePath)
 
-        del mdb.jobs['JobMock']
+        del mdb.jobs[mock_job_name]
 
         job = mdb.Job(activateLoadBalancing=False, atTime=None, contactPrint=OFF, 
-            description='', echoPrint=OFF, explicitPrecision=SINGLE, historyPrint=OFF, 
+            description='', echoPrint=OFF, explicitPrecision=explicit_precision, historyPrint=OFF, 
             memory=90, memoryUnits=PERCENTAGE, model=self.modelName + '_infinite', modelPrint=OFF, 
-            multiprocessingMode=DEFAULT, name=job_name, nodalOutputPrecision=SINGLE, 
+            multiprocessingMode=DEFAULT, name=job_name, nodalOutputPrecision=nodal_output_precision, 
             numCpus=num_cpus, numDomains=num_cpus, parallelizationMethodExplicit=DOMAIN, queue=None, 
-            resultsFormat=ODB, scratch='', type=ANALYSIS, userSubroutine='', waitHours=
+            resultsFormat=ODB, scratch=scratch_path, type=ANALYSIS, userSubroutine='', waitHours=
             0, waitMinutes=0)
         
         job.submit()
         self.log("      - Job submitted successfully.", self.logFilePath)
 
+        if self.modelBuilder.get('restPhaseMonitor', {}).get('enabled', False):
+            monitor = RestPhaseMonitor(self.fullConfig, self.pathDataDir, job_path, job_name)
+            if monitor.watch(job):
+                self.log("      - RestPhase stopped early, the last written frame will be extracted.", self.logFilePath)
+
         job.waitForCompletion()
         self.log("      - Job completed successfully.", self.logFilePath)
 
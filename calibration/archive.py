@@ -0,0 +1,178 @@
+import json
+import os
+import shutil
+import time
+from numbers import Number
+
+import numpy as np
+
+
+class CalibrationArchive:
+    def __init__(self, archive_config, parameter_names, bounds_min, bounds_max):
+        self.enabled = archive_config.get('enabled', False)
+        self.archive_dir = archive_config.get('directory', os.path.join('calibration', 'archive'))
+        self.metadata = archive_config.get('metadata', {})
+        self.warm_start = archive_config.get('warm_start', False)
+        self.n_runs = archive_config.get('n_runs', 3)
+        self.n_seeds = archive_config.get('n_seeds', 8)
+        self.max_distance = archive_config.get('max_distance')
+        self.seed_cache = archive_config.get('seed_cache', False)
+        self.store_profiles = archive_config.get('store_profiles', True)
+
+        self.parameter_names = list(parameter_names)
+        self.bounds_min = np.asarray(bounds_min, dtype=float)
+        self.bounds_max = np.asarray(bounds_max, dtype=float)
+        self.index_path = os.path.join(self.archive_dir, 'index.json')
+
+    def run_metadata(self, fixed_parameters, experiments):
+        metadata = dict(self.metadata)
+        metadata.update(fixed_parameters)
+        for experiment in experiments:
+            for key, value in experiment.get('parameters', {}).items():
+                metadata[f"{experiment['name']}.{key}"] = value
+        return metadata
+
+    def load_index(self):
+        if not os.path.exists(self.index_path):
+            return []
+        with open(self.index_path, 'r') as f:
+            return json.load(f)
+
+    def load_run(self, run_id):
+        with open(os.path.join(self.archive_dir, run_id, 'run.json'), 'r') as f:
+            return json.load(f)
+
+    @staticmethod
+    def distance(metadata, other):
+        keys = set(metadata) | set(other)
+        if not keys:
+            return 0.0
+
+        total = 0.0
+        for key in keys:
+            a, b = metadata.get(key), other.get(key)
+            if isinstance(a, Number) and isinstance(b, Number):
+                scale = max(abs(a), abs(b))
+                total += min(1.0, abs(a - b) / scale) if scale > 0 else 0.0
+            else:
+                total += 0.0 if a == b else 1.0
+        return total / len(keys)
+
+    def _covers_parameters(self, entry):
+        known = set(entry['parameter_names']) | set(entry.get('fixed_parameters', {}))
+        return all(name in known for name in self.parameter_names)
+
+    def closest_runs(self, metadata):
+        candidates = []
+        for entry in self.load_index():
+            if not self._covers_parameters(entry):
+                continue
+            distance = self.distance(metadata, entry['metadata'])
+            if self.max_distance is None or distance <= self.max_distance:
+                candidates.append((distance, entry))
+
+        candidates.sort(key=lambda candidate: candidate[0])
+        return candidates[:self.n_runs]
+
+    def _to_current(self, entry, position):
+        # Archived positions follow their own parameter order; anything not free there was fixed.
+        values = dict(entry.get('fixed_parameters', {}))
+        values.update(zip(entry['parameter_names'], position))
+        return np.array([values[name] for name in self.parameter_names], dtype=float)
+
+    def seed_positions(self, metadata, n_seeds):
+        runs = self.closest_runs(metadata)
+        if not runs:
+            print("[Archive] No archived run is close enough to warm-start from.")
+            return np.empty((0, len(self.parameter_names)))
+
+        # Costs of runs with different targets are not comparable, so runs contribute in turns.
+        ranked_lists = []
+        for distance, entry in runs:
+            run = self.load_run(entry['run_id'])
+            evaluations = sorted(
+                # Failed runs carry a finite penalty cost, so only successful ones may become seeds.
+                (record for record in run['evaluations'] if record['status'] == 'ok'),
+                key=lambda record: record['cost']
+            )
+            positions = [entry['best_position']] + [record['position'] for record in evaluations]
+            ranked_lists.append([self._to_current(entry, position) for position in positions])
+            print(f"[Archive] Using {entry['run_id']} (distance {distance:.3f}, best cost {entry['best_cost']:.4f})")
+
+        seeds = []
+        seen = set()
+        for rank in range(max(len(positions) for positions in ranked_lists)):
+            for positions in ranked_lists:
+                if rank >= len(positions) or len(seeds) >= n_seeds:
+                    continue
+                position = np.clip(positions[rank], self.bounds_min, self.bounds_max)
+                key = tuple(np.round((position - self.bounds_min) / (self.bounds_max - self.bounds_min), 6))
+                if key not in seen:
+                    seen.add(key)
+                    seeds.append(position)
+
+        return np.array(seeds).reshape(-1, len(self.parameter_names))
+
+    def seed_store(self, metadata, store, contexts):
+        # Only simulations of the very same model inputs can be served, i.e. same free parameters and context.
+        added = 0
+        for _, entry in self.closest_runs(metadata):
+            if entry['parameter_names'] != self.parameter_names:
+                continue
+            for record in self.load_run(entry['run_id'])['evaluations']:
+                if record['status'] != 'ok' or record.get('context', '') not in contexts:
+                    continue
+                if not os.path.exists(record['data_file']):
+                    continue
+                if store.lookup(record['position'], record.get('context', '')) is None:
+                    store.add(dict(record, archived_from=entry['run_id']))
+                    added += 1
+
+        print(f"[Archive] Added {added} archived simulation(s) to the evaluation cache.")
+        return added
+
+    def _archive_evaluations(self, run_dir, records):
+        evaluations = []
+        for record in records:
+            record = dict(record)
+            if self.store_profiles and record['status'] == 'ok' and os.path.exists(record['data_file']):
+                # Data files are overwritten when run names are reused, so the archive keeps its own copy.
+                archived_path = os.path.join(run_dir, 'data', os.path.basename(record['data_file']))
+                os.makedirs(os.path.dirname(archived_path), exist_ok=True)
+                shutil.copyfile(record['data_file'], archived_path)
+                record['data_file'] = archived_path
+            evaluations.append(record)
+        return evaluations
+
+    def save(self, metadata, fixed_parameters, best_pos, best_cost, history, records, stop_reason):
+        if not self.enabled or best_pos is None:
+            return None
+
+        run_id = time.strftime('%Y%m%d_%H%M%S')
+        run_dir = os.path.join(self.archive_dir, run_id)
+        os.makedirs(run_dir, exist_ok=True)
+
+        entry = {
+            'run_id': run_id,
+            'created': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'metadata': metadata,
+            'parameter_names': self.parameter_names,
+            'fixed_parameters': fixed_parameters,
+            'bounds_min': self.bounds_min.tolist(),
+            'bounds_max': self.bounds_max.tolist(),
+            'best_position': [float(v) for v in best_pos],
+            'best_cost': float(best_cost),
+            'n_evaluations': len(records),
+            'stop_reason': stop_reason,
+        }
+
+        with open(os.path.join(run_dir, 'run.json'), 'w') as f:
+            json.dump(dict(entry, history=history, evaluations=self._archive_evaluations(run_dir, records)), f, indent=4)
+
+        index = [existing for existing in self.load_index() if existing['run_id'] != run_id]
+        index.append(entry)
+        with open(self.index_path, 'w') as f:
+            json.dump(index, f, indent=4)
+
+        print(f"[Archive] Calibration archived as {run_id} in {self.archive_dir}")
+        return run_id
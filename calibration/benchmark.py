@@ -0,0 +1,119 @@
+import json
+import os
+
+import numpy as np
+from scipy.stats import qmc
+
+# Model overrides of the (reference, candidate) runs compared by each benchmark mode.
+BENCHMARK_MODES = {
+    'early_stop': ({'restPhaseMonitor': {'enabled': False}}, {'restPhaseMonitor': {'enabled': True}}),
+    'solver_controls': ({'solverControls': {'enabled': False}}, {'solverControls': {'enabled': True}}),
+}
+
+
+class ComparisonBenchmark:
+    def __init__(self, reference, candidate, benchmark_config, bounds_min, bounds_max, mode):
+        self.reference = reference
+        self.candidate = candidate
+        self.n_samples = benchmark_config.get('n_samples', 4)
+        self.seed = benchmark_config.get('seed', 1)
+        self.positions = benchmark_config.get('positions', 'lhs')
+        self.tolerance = benchmark_config.get('tolerance', {})
+        self.mode = mode
+
+        self.bounds_min = np.asarray(bounds_min, dtype=float)
+        self.bounds_max = np.asarray(bounds_max, dtype=float)
+        self.results_path = os.path.join(reference.results_dir, f'benchmark_{mode}.json')
+
+    def _positions(self):
+        if self.positions == 'template':
+            # The particle stored in model_config.json serves as the reference particle.
+            return self.reference.template_position()[None, :]
+        if not isinstance(self.positions, str):
+            return np.atleast_2d(np.asarray(self.positions, dtype=float))
+
+        sampler = qmc.LatinHypercube(d=len(self.bounds_min), seed=self.seed)
+        return qmc.scale(sampler.random(self.n_samples), self.bounds_min, self.bounds_max)
+
+    def _run_details(self, evaluator, run_name):
+        details = evaluator._stage_timings(run_name)
+        early_stop_path = os.path.join(evaluator.backend_path, "log", f"abaqus_log_{run_name}_early_stop.json")
+        if os.path.exists(early_stop_path):
+            with open(early_stop_path, 'r') as f:
+                details['early_stop'] = json.load(f)
+        return details
+
+    def _profile_differences(self, reference_file, candidate_file):
+        reference = self.reference.load_profiles(reference_file)
+        candidate = self.candidate.load_profiles(candidate_file)
+
+        differences = {}
+        for path_name, profile in reference.items():
+            interpolated = np.interp(profile[:, 0], candidate[path_name][:, 0], candidate[path_name][:, 1])
+            differences[f'rms_{path_name}'] = float(np.sqrt(np.mean((interpolated - profile[:, 1]) ** 2)))
+            differences[f'max_{path_name}'] = float(np.max(np.abs(interpolated - profile[:, 1])))
+        return differences
+
+    def run(self):
+        positions = self._positions()
+        reference_names = [f"bench_{self.mode}_ref_{k:03d}" for k in range(len(positions))]
+        candidate_names = [f"bench_{self.mode}_cand_{k:03d}" for k in range(len(positions))]
+
+        print(f"=== Benchmark ({self.mode}): {len(positions)} reference and {len(positions)} candidate runs ===")
+        reference_results = self.reference.evaluate_batch(positions, None, reference_names)
+        candidate_results = self.candidate.evaluate_batch(positions, None, candidate_names)
+
+        rows = []
+        for k, position in enumerate(positions):
+            (reference_cost, reference_file), (candidate_cost, candidate_file) = reference_results[k], candidate_results[k]
+            row = {
+                'position': [float(v) for v in position],
+                'reference_cost': reference_cost,
+                'candidate_cost': candidate_cost,
+                'reference': self._run_details(self.reference, reference_names[k]),
+                'candidate': self._run_details(self.candidate, candidate_names[k]),
+            }
+            if reference_file is not None and candidate_file is not None:
+                row['relative_cost_error'] = abs(candidate_cost - reference_cost) / max(abs(reference_cost), 1e-12)
+                row.update(self._profile_differences(reference_file, candidate_file))
+
+            reference_seconds = row['reference'].get('simulation')
+            candidate_seconds = row['candidate'].get('simulation')
+            if reference_seconds and candidate_seconds:
+                row['speedup'] = reference_seconds / candidate_seconds
+            rows.append(row)
+
+        summary = self._summary(rows)
+        with open(self.results_path, 'w') as f:
+            json.dump({'mode': self.mode, 'summary': summary, 'samples': rows}, f, indent=4)
+
+        print(f"{'sample':>6} {'ref cost':>10} {'cand cost':>10} {'rel err':>8} {'rms surf':>9} {'rms depth':>9} {'speedup':>8}")
+        for k, row in enumerate(rows):
+            print(f"{k:>6} {row['reference_cost']:10.4f} {row['candidate_cost']:10.4f} "
+                  f"{row.get('relative_cost_error', np.nan):8.4f} {row.get('rms_surface', np.nan):9.2f} "
+                  f"{row.get('rms_depth', np.nan):9.2f} {row.get('speedup', np.nan):8.2f}")
+        print(f"Summary: {summary}")
+        if 'accepted' in summary:
+            print(f"Verdict: {'ACCEPTED' if summary['accepted'] else 'REJECTED'} (tolerance: {self.tolerance})")
+        print(f"Results saved to {self.results_path}")
+
+        return summary
+
+    def _summary(self, rows):
+        summary = {'n_samples': len(rows), 'n_compared': sum('relative_cost_error' in row for row in rows)}
+        for key in ('relative_cost_error', 'rms_surface', 'rms_depth'):
+            values = [row[key] for row in rows if key in row]
+            if values:
+                summary[f'mean_{key}'] = float(np.mean(values))
+                summary[f'worst_{key}'] = float(np.max(values))
+
+        speedups = [row['speedup'] for row in rows if 'speedup' in row]
+        if speedups:
+            summary['mean_speedup'] = float(np.mean(speedups))
+
+        # The variant is only accepted when every compared sample stays within every configured tolerance.
+        if self.tolerance:
+            summary['accepted'] = summary['n_compared'] == len(rows) and all(
+                summary.get(f'worst_{key}', np.inf) <= limit for key, limit in self.tolerance.items()
+            )
+        return summary
@@ -1,26 +1,63 @@
 import os
 import json
 import pickle
-import subprocess
 import numpy as np
-import pyswarms as ps
 import sys
+from calibration.archive import CalibrationArchive
+from calibration.benchmark import BENCHMARK_MODES, ComparisonBenchmark
+from calibration.convergence import ConvergenceMonitor
+from calibration.doe import DesignOfExperiments
+from calibration.evaluator import PARAMETER_NAMES, MultiExperimentEvaluator, SimulationEvaluator
+from calibration.metrics import MetricsRecorder
+from calibration.optimizers import make_optimizer
+from calibration.refinement import FiniteDifferenceRefiner
+from calibration.retention import ArtifactRetention
+from calibration.sensitivity import MorrisScreening
 
 sys.dont_write_bytecode = True
 
 
 class PSOCalibrator:
-    def __init__(self):
+    def __init__(self, calibration_config_path=None):
         self.abaqus_cmd_path = 'C:/SIMULIA/Abaqus/Commands/abaqus.bat'
         self.config_file_path = os.path.join('backend', 'model_config', 'model_config.json')
-        self.data_file_path = None
         self.target_profile_path = os.path.join('calibration', 'config', 'target_curve.pkl')
-        self.calibration_config_path = os.path.join('calibration', 'config', 'calibration_config.json')
-        
+        self.calibration_config_path = calibration_config_path or os.path.join('calibration', 'config', 'calibration_config.json')
+
         self.target_spline = self._load_target_profile()
-        
+
         self._load_calibration_config()
 
+        if self.experiments:
+            self.evaluator = MultiExperimentEvaluator(
+                self.abaqus_cmd_path,
+                self.config_file_path,
+                self.experiments,
+                self.evaluation_config,
+                parameter_names=self.parameter_names,
+                fixed_parameters=self.fixed_parameters
+            )
+        else:
+            self.evaluator = SimulationEvaluator(
+                self.abaqus_cmd_path,
+                self.config_file_path,
+                self.target_spline,
+                self.evaluation_config,
+                parameter_names=self.parameter_names,
+                fixed_parameters=self.fixed_parameters
+            )
+
+        # Artifacts are named after the model in the template config, which may have been renamed.
+        self.retention = ArtifactRetention(
+            self.retention_config, model_name=self._simulation_evaluators()[0].model_name
+        )
+
+        self.metrics = MetricsRecorder(self.monitoring_config)
+        self.evaluator.attach_metrics(self.metrics)
+
+        self.archive = CalibrationArchive(self.archive_config, self.parameter_names, self.bounds_min, self.bounds_max)
+        self.run_metadata = self.archive.run_metadata(self.fixed_parameters, self.experiments)
+
     def _load_target_profile(self):
         with open(self.target_profile_path, 'rb') as f:
             return pickle.load(f)
@@ -28,122 +65,184 @@ class PSOCalibrator:
     def _load_calibration_config(self):
         with open(self.calibration_config_path, 'r') as f:
             config = json.load(f)
+        self.calibration_config = config
 
+        self.parameter_names = config.get('parameter_names', PARAMETER_NAMES)
+        self.fixed_parameters = config.get('fixed_parameters', {})
+        self.experiments = config.get('experiments', [])
         self.bounds_min = np.array(config['pso_optimization_bounds']['bounds_min'])
         self.bounds_max = np.array(config['pso_optimization_bounds']['bounds_max'])
         self.bounds = (self.bounds_min, self.bounds_max)
-        
+
         self.options = config['pso_hyperparameters']
         self.dimensions = config['dimensions']
         self.n_particles = config['n_particles']
         self.n_iterations = config['n_iterations']
-
-    def _update_model_config(self, particle, particle_index, iteration_index):
-        with open(self.config_file_path, 'r') as file:
-            config = json.load(file)
-
-        if particle_index is not None:
-            config['lspModel']['modelBuilder']['particleNumber'] = particle_index
-        
-        if iteration_index is not None:
-            config['lspModel']['modelBuilder']['iterationNumber'] = iteration_index
-
-        config['lspModel']['modelBuilder']['material']['johnsonCook']['a'] = float(particle[0])
-        config['lspModel']['modelBuilder']['material']['johnsonCook']['b'] = float(particle[1])
-        config['lspModel']['modelBuilder']['material']['johnsonCook']['n'] = float(particle[2])
-        config['lspModel']['modelBuilder']['material']['johnsonCook']['c'] = float(particle[3])
-        config['lspModel']['modelBuilder']['pulse']['p0'] = float(particle[4])
-        config['lspModel']['modelBuilder']['pulse']['pMax'] = float(particle[5])
-        config['lspModel']['modelBuilder']['pulse']['rMax'] = float(particle[6])
-        config['lspModel']['modelBuilder']['pulse']['timeMax'] = float(particle[7])
-        
-        with open(self.config_file_path, 'w') as file:
-            json.dump(config, file, indent=4)
-
-    def _run_abaqus_simulation(self):
-        os.environ["BACKEND_PROJECT_PATH"] = os.path.join(os.getcwd(), "backend")
-        abaqus_command = f'"{self.abaqus_cmd_path}" cae noGUI="backend/command.py"'
-        
-        stdout_path = os.path.join(os.environ["BACKEND_PROJECT_PATH"], "log", "subprocess_stdout.log")
-        stderr_path = os.path.join(os.environ["BACKEND_PROJECT_PATH"], "log", "subprocess_stderr.log")
-
-        MAX_SIMULATION_TIME = 600 
-
-        try:
-            with open(stdout_path, "w") as out_file, open(stderr_path, "w") as err_file:
-                subprocess.run(
-                    abaqus_command, 
-                    shell=True, 
-                    check=True, 
-                    stdout=out_file, 
-                    stderr=err_file, 
-                    text=True,
-                    timeout=MAX_SIMULATION_TIME
-                )
-        except subprocess.TimeoutExpired:
-            print(f"\n[WARNING] Abaqus simulation exceeded {MAX_SIMULATION_TIME} seconds. Killing process...")
-            raise RuntimeError("Simulation timed out due to severe element distortion or hanging.")
-        except subprocess.CalledProcessError as e:
-            print(f"\n[ERROR] Abaqus failed with return code {e.returncode}.")
-            raise
-        finally:
-            from utilities.clean_files import clean_files
-            clean_files()
-
-    def _evaluate_particle(self, particle, particle_index):
-        try:
-            self._update_model_config(particle, particle_index, self.current_iteration)
-            self._run_abaqus_simulation()
-
-            data_file_name = f'data_i{self.current_iteration}_p{particle_index}.json'
-            self.data_file_path = os.path.join('backend', 'data', data_file_name)
-            with open(self.data_file_path, 'r') as f:
-                data = json.load(f)
-            
-            data_key_name = f"lspModel_i{self.current_iteration}_p{particle_index}"
-            surface_data = data[data_key_name]["surface"]
-            surface_data_x = np.array([point[0] for point in surface_data])
-            simulated_stresses = np.array([point[1] for point in surface_data])
-            
-            target_stresses = self.target_spline(surface_data_x)
-            
-            mse = np.mean((simulated_stresses - target_stresses)**2)
-            return mse
-            
-        except Exception as e:
-            print(f"[ERROR] Simulation failed for particle {particle}: {e}")
-            return 1e6  
+        self.optimizer_config = config.get('optimizer', {'name': 'pso'})
+        self.evaluation_config = config.get('evaluation', {})
+        self.retention_config = config.get('retention', {})
+        self.convergence = ConvergenceMonitor(config.get('convergence', {}), self.bounds_min, self.bounds_max)
+        self.refinement_config = config.get('refinement', {})
+        self.doe_config = config.get('doe', {})
+        self.initialization_config = config.get('initialization', {})
+        self.sensitivity_config = config.get('sensitivity', {})
+        self.monitoring_config = config.get('monitoring', {})
+        self.archive_config = config.get('archive', {})
+        self.benchmark_config = config.get('benchmark', {})
+
+    def _evaluate_batch(self, positions, iteration):
+        # Swarm generations and refinement batches share the metrics, failure report and retention bookkeeping.
+        self.metrics.set_iteration(iteration, self.n_iterations, len(positions), len(self._simulation_evaluators()))
+        results = self.evaluator.evaluate_batch(positions, iteration)
+        print(f"Failures this iteration: {self.evaluator.failure_report(iteration)}")
+
+        self.retention.apply(self.evaluator.costs, iteration, self.evaluator.run_names)
+        return results
 
     def _objective_function(self, particles):
         n_particles = particles.shape[0]
-        costs = np.zeros(n_particles)
-        
+
         print(f"\n=== Iteration {self.current_iteration + 1} ===")
-        for i in range(n_particles):
-            print(f"--- Evaluating Particle {i + 1}/{n_particles} ---")
-            costs[i] = self._evaluate_particle(particles[i], i)
-            print(f"Cost (MSE): {costs[i]:.4f}\n")
-        
+        print(f"--- Evaluating {n_particles} particles ---")
+        costs = np.array([cost for cost, _ in self._evaluate_batch(particles, self.current_iteration)])
         self.current_iteration += 1
 
         return costs
 
+    def _simulation_evaluators(self):
+        return getattr(self.evaluator, 'evaluators', [self.evaluator])
+
+    def _initial_positions(self):
+        seeds = [np.empty((0, self.dimensions))]
+
+        if self.archive.warm_start:
+            n_seeds = min(self.archive.n_seeds, self.n_particles)
+            seeds.append(self.archive.seed_positions(self.run_metadata, n_seeds))
+            print(f"Seeding {len(seeds[-1])} of {self.n_particles} particles from archived calibrations.")
+
+        if self.initialization_config.get('from_doe', False):
+            doe = DesignOfExperiments(
+                self.evaluator, self.doe_config, self.bounds_min, self.bounds_max, self.parameter_names
+            )
+            n_free = self.n_particles - sum(len(s) for s in seeds)
+            n_best = min(self.initialization_config.get('n_best', self.n_particles), n_free)
+            best_points = doe.best_points(n_best)
+            if best_points.shape[1] != self.dimensions:
+                raise ValueError(f"DOE points have {best_points.shape[1]} parameters, the calibration has {self.dimensions}.")
+            seeds.append(best_points)
+            print(f"Seeding {len(seeds[-1])} of {self.n_particles} particles from the best DOE points.")
+
+        seeds = np.vstack(seeds)
+        if len(seeds) == 0:
+            return None
+
+        random_positions = np.random.uniform(
+            self.bounds_min, self.bounds_max, size=(self.n_particles - len(seeds), self.dimensions)
+        )
+        return np.vstack([seeds, random_positions])
+
+    def run_doe(self):
+        doe = DesignOfExperiments(
+            self.evaluator, self.doe_config, self.bounds_min, self.bounds_max, self.parameter_names
+        )
+        self.metrics.start()
+        try:
+            doe.run()
+        finally:
+            self.metrics.stop()
+
+    def run_sensitivity(self, reduced_config_path):
+        screening = MorrisScreening(
+            self.evaluator, self.sensitivity_config, self.bounds_min, self.bounds_max, self.parameter_names
+        )
+        self.metrics.start()
+        try:
+            ranking = screening.run()
+        finally:
+            self.metrics.stop()
+        screening.write_reduced_config(self.calibration_config, ranking, reduced_config_path)
+
+    def run_benchmark(self, mode):
+        if mode not in BENCHMARK_MODES:
+            raise ValueError(f"Unknown benchmark mode '{mode}'. Available: {', '.join(BENCHMARK_MODES)}.")
+
+        # Benchmarks compare wall-clock times, so every run is simulated instead of served from the cache.
+        evaluation_config = dict(self.evaluation_config, cache=False)
+        reference, candidate = [
+            SimulationEvaluator(
+                self.abaqus_cmd_path,
+                self.config_file_path,
+                self.target_spline,
+                evaluation_config,
+                parameter_names=self.parameter_names,
+                fixed_parameters=self.fixed_parameters,
+                model_overrides=overrides,
+                store=self._simulation_evaluators()[0].store,
+                broker=self._simulation_evaluators()[0].broker
+            )
+            for overrides in BENCHMARK_MODES[mode]
+        ]
+
+        benchmark = ComparisonBenchmark(
+            reference, candidate, self.benchmark_config, self.bounds_min, self.bounds_max, mode
+        )
+        return benchmark.run()
+
     def run(self):
-        print("Starting PSO Calibration...")
-        optimizer = ps.single.GlobalBestPSO(
-            n_particles=self.n_particles, 
-            dimensions=self.dimensions, 
-            options=self.options, 
-            bounds=self.bounds
+        self.metrics.start()
+        try:
+            self._calibrate()
+        finally:
+            self.metrics.stop()
+
+    def _calibrate(self):
+        print(f"Starting Calibration ({self.optimizer_config.get('name', 'pso')})...")
+        simulation_store = self._simulation_evaluators()[0].store
+        if self.archive.warm_start and self.archive.seed_cache:
+            contexts = {evaluator.cache_context for evaluator in self._simulation_evaluators()}
+            self.archive.seed_store(self.run_metadata, simulation_store, contexts)
+        first_record = len(simulation_store.records)
+        optimizer = make_optimizer(
+            self.optimizer_config,
+            bounds=self.bounds,
+            n_particles=self.n_particles,
+            options=self.options,
+            init_pos=self._initial_positions()
         )
 
         self.current_iteration = 0
+        stop_reason = f"reached n_iterations={self.n_iterations}"
+        history = []
+
+        for _ in range(self.n_iterations):
+            particles = optimizer.ask(self.n_particles)
+            costs = self._objective_function(particles)
+            optimizer.tell(particles, costs)
+            self.metrics.set_best(optimizer.best_cost)
+            history.append(float(optimizer.best_cost))
+            print(f"Best Cost so far (MSE): {optimizer.best_cost:.4f}")
+
+            if self.convergence.update(optimizer.best_cost, particles, self.evaluator.best_residual()):
+                stop_reason = f"converged after {self.current_iteration} iterations ({self.convergence.reason})"
+                break
 
-        best_cost, best_pos = optimizer.optimize(
-            self._objective_function, 
-            iters=self.n_iterations
+        best_cost, best_pos = optimizer.best_cost, optimizer.best_pos
+
+        refiner = FiniteDifferenceRefiner(
+            self.evaluator, self.refinement_config, self.bounds_min, self.bounds_max, self._evaluate_batch
         )
-        
+        if refiner.enabled and best_pos is not None:
+            refined_pos, refined_cost = refiner.run(best_pos, self.current_iteration)
+            self.current_iteration = refiner.iteration
+            if refined_cost < best_cost:
+                best_cost, best_pos = refined_cost, refined_pos
+
         print("\n=== Calibration Finished ===")
+        print(f"Stop reason: {stop_reason}")
         print(f"Best Cost (MSE): {best_cost}")
-        print(f"Best Parameters: {best_pos}")
\ No newline at end of file
+        print(f"Best Parameters: {best_pos}")
+
+        self.archive.save(
+            self.run_metadata, self.fixed_parameters, best_pos, best_cost, history,
+            simulation_store.records[first_record:], stop_reason
+        )
@@ -0,0 +1,67 @@
+from collections import deque
+
+import numpy as np
+
+
+class ConvergenceMonitor:
+    def __init__(self, convergence_config, bounds_min, bounds_max):
+        self.enabled = convergence_config.get('enabled', False)
+        self.window = convergence_config.get('window', 10)
+        self.min_iterations = convergence_config.get('min_iterations', 20)
+        self.cost_tolerance = convergence_config.get('cost_tolerance', 1e-3)
+        self.spread_tolerance = convergence_config.get('spread_tolerance', 0.02)
+        self.residual_tolerance = convergence_config.get('residual_tolerance', 1e-2)
+        self.criteria = convergence_config.get('criteria', ['cost', 'spread', 'residual'])
+        self.mode = convergence_config.get('mode', 'all')
+
+        self.bounds_span = np.asarray(bounds_max, dtype=float) - np.asarray(bounds_min, dtype=float)
+        self.best_costs = deque(maxlen=self.window + 1)
+        self.best_residuals = deque(maxlen=self.window + 1)
+        self.iterations = 0
+        self.reason = None
+
+    def cost_improvement(self):
+        if len(self.best_costs) <= self.window:
+            return np.inf
+
+        old, new = self.best_costs[0], self.best_costs[-1]
+        return (old - new) / max(abs(old), 1e-12)
+
+    def swarm_spread(self, positions):
+        normalized_std = np.std(np.asarray(positions, dtype=float), axis=0) / self.bounds_span
+        return float(np.max(normalized_std))
+
+    def residual_change(self):
+        if len(self.best_residuals) <= self.window or self.best_residuals[0] is None:
+            return np.inf
+
+        old, new = self.best_residuals[0], self.best_residuals[-1]
+        if old.shape != new.shape:
+            return np.inf
+
+        return float(np.linalg.norm(new - old) / max(np.linalg.norm(new), 1e-12))
+
+    def update(self, best_cost, positions, best_residual=None):
+        self.iterations += 1
+        self.best_costs.append(float(best_cost))
+        self.best_residuals.append(None if best_residual is None else np.asarray(best_residual, dtype=float))
+
+        metrics = {
+            'cost': (self.cost_improvement(), self.cost_tolerance),
+            'spread': (self.swarm_spread(positions), self.spread_tolerance),
+            'residual': (self.residual_change(), self.residual_tolerance),
+        }
+        satisfied = {name: metrics[name][0] < metrics[name][1] for name in self.criteria}
+
+        if not self.enabled or self.iterations < self.min_iterations:
+            return False
+
+        check = all if self.mode == 'all' else any
+        if check(satisfied.values()):
+            self.reason = "; ".join(
+                f"{name} {metrics[name][0]:.3g} < {metrics[name][1]:.3g}"
+                for name, ok in satisfied.items() if ok
+            )
+            return True
+
+        return False
@@ -0,0 +1,349 @@
+import glob
+import json
+import os
+import shutil
+import socket
+import subprocess
+import threading
+import time
+import uuid
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from backend.job_paths import batch_members
+from calibration.failures import classify_failure, failure_sources, remove_stale_locks
+
+# Newline-delimited JSON over TCP:
+#   agent -> broker: hello {agent, slots, token}, heartbeat,
+#                    result {task_id, status, data {member run name: profiles} | error, failure_class, files}
+#   broker -> agent: task {task_id, run_name, model_config}
+
+
+class RemoteEvaluationError(RuntimeError):
+    def __init__(self, message, failure_class=None):
+        super().__init__(message)
+        self.failure_class = failure_class
+
+
+def _send_message(connection, lock, message):
+    with lock:
+        connection.sendall((json.dumps(message) + '\n').encode('utf-8'))
+
+
+class RemoteAgent:
+    def __init__(self, name, connection, slots):
+        self.name = name
+        self.connection = connection
+        self.slots = slots
+        self.tasks = {}
+        self.last_seen = time.time()
+        self.alive = True
+        self.send_lock = threading.Lock()
+
+    def send(self, message):
+        _send_message(self.connection, self.send_lock, message)
+
+
+class JobBroker:
+    def __init__(self, distributed_config):
+        self.host = distributed_config.get('host', '127.0.0.1')
+        self.port = distributed_config.get('port', 8766)
+        self.heartbeat_timeout = distributed_config.get('heartbeat_timeout', 60.0)
+        self.token = distributed_config.get('token')
+
+        self.condition = threading.Condition()
+        self.pending = deque()
+        self.futures = {}
+        self.agents = {}
+        self.server_socket = None
+
+    def start(self):
+        self.server_socket = socket.create_server((self.host, self.port))
+        for target in (self._accept_loop, self._dispatch_loop, self._reaper_loop):
+            threading.Thread(target=target, daemon=True).start()
+        print(f"[Broker] Listening on {self.host}:{self.port}, start agents with run_agent.py.")
+
+    def submit(self, run_name, model_config):
+        future = Future()
+        with self.condition:
+            task_id = uuid.uuid4().hex
+            self.pending.append({'type': 'task', 'task_id': task_id, 'run_name': run_name, 'model_config': model_config})
+            self.futures[task_id] = future
+            if not self.agents:
+                print(f"[Broker] No agent connected, {len(self.pending)} task(s) waiting.")
+            self.condition.notify_all()
+        return future
+
+    def _accept_loop(self):
+        while True:
+            connection, address = self.server_socket.accept()
+            threading.Thread(target=self._serve_agent, args=(connection, address), daemon=True).start()
+
+    def _serve_agent(self, connection, address):
+        reader = connection.makefile('r', encoding='utf-8')
+        try:
+            hello = json.loads(reader.readline())
+        except (OSError, ValueError):
+            connection.close()
+            return
+
+        if hello.get('type') != 'hello' or (self.token and hello.get('token') != self.token):
+            print(f"[Broker] Rejected connection from {address[0]}:{address[1]}.")
+            connection.close()
+            return
+
+        agent = RemoteAgent(f"{hello.get('agent', 'agent')}@{address[0]}:{address[1]}", connection, hello.get('slots', 1))
+        with self.condition:
+            self.agents[agent.name] = agent
+            self.condition.notify_all()
+        print(f"[Broker] Agent {agent.name} connected with {agent.slots} slot(s).")
+
+        try:
+            for line in reader:
+                message = json.loads(line)
+                agent.last_seen = time.time()
+                if message.get('type') == 'result':
+                    self._complete(agent, message)
+        except (OSError, ValueError):
+            pass
+        finally:
+            self._drop_agent(agent, "disconnected")
+
+    def _complete(self, agent, message):
+        task_id = message['task_id']
+        with self.condition:
+            agent.tasks.pop(task_id, None)
+            future = self.futures.pop(task_id, None)
+            # A late result of a requeued task makes its queued copy redundant.
+            self.pending = deque(task for task in self.pending if task['task_id'] != task_id)
+            self.condition.notify_all()
+
+        if future is not None:
+            future.set_result(message)
+
+    def _drop_agent(self, agent, reason):
+        with self.condition:
+            if not agent.alive:
+                return
+            agent.alive = False
+            self.agents.pop(agent.name, None)
+            requeued = [task for task in agent.tasks.values() if task['task_id'] in self.futures]
+            self.pending.extendleft(reversed(requeued))
+            agent.tasks.clear()
+            self.condition.notify_all()
+
+        print(f"[Broker] Agent {agent.name} {reason}, {len(requeued)} task(s) requeued.")
+        try:
+            agent.connection.close()
+        except OSError:
+            pass
+
+    def _next_assignment(self):
+        if not self.pending:
+            return None
+
+        free = [agent for agent in self.agents.values() if len(agent.tasks) < agent.slots]
+        if not free:
+            return None
+
+        agent = min(free, key=lambda a: len(a.tasks) / a.slots)
+        return agent, self.pending.popleft()
+
+    def _dispatch_loop(self):
+        while True:
+            with self.condition:
+                assignment = self._next_assignment()
+                while assignment is None:
+                    self.condition.wait()
+                    assignment = self._next_assignment()
+                agent, task = assignment
+                agent.tasks[task['task_id']] = task
+
+            try:
+                agent.send(task)
+            except OSError:
+                self._drop_agent(agent, "could not receive a task")
+
+    def _reaper_loop(self):
+        while True:
+            time.sleep(self.heartbeat_timeout / 4.0)
+            now = time.time()
+            with self.condition:
+                stale = [agent for agent in self.agents.values() if now - agent.last_seen > self.heartbeat_timeout]
+            for agent in stale:
+                self._drop_agent(agent, f"missed heartbeats for {self.heartbeat_timeout:.0f} s")
+
+
+class EvaluationAgent:
+    def __init__(self, host, port, workspace, abaqus_cmd_path, slots=1, heartbeat_interval=10.0, timeout=600,
+                 token=None, keep_files=False, agent_id=None):
+        self.host = host
+        self.port = port
+        self.workspace = os.path.abspath(workspace)
+        self.abaqus_cmd_path = abaqus_cmd_path
+        self.slots = slots
+        self.heartbeat_interval = heartbeat_interval
+        self.timeout = timeout
+        self.token = token
+        self.keep_files = keep_files
+        self.agent_id = agent_id or f"{socket.gethostname()}-{os.getpid()}"
+
+        self.backend_path = os.path.join(self.workspace, 'backend')
+        self.executor = ThreadPoolExecutor(max_workers=slots)
+        self.connection = None
+        self.send_lock = threading.Lock()
+
+    def _prepare_workspace(self):
+        source_backend = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'backend')
+        for directory in ('log', 'model_config', 'data', os.path.join('files', 'job')):
+            os.makedirs(os.path.join(self.backend_path, directory), exist_ok=True)
+        for source_path in glob.glob(os.path.join(source_backend, '*.py')):
+            shutil.copy2(source_path, self.backend_path)
+
+    def run(self):
+        self._prepare_workspace()
+        print(f"[Agent {self.agent_id}] Workspace: {self.workspace}")
+
+        while True:
+            try:
+                connection = socket.create_connection((self.host, self.port))
+            except OSError as e:
+                print(f"[Agent {self.agent_id}] Broker {self.host}:{self.port} unreachable ({e}), retrying in 5 s.")
+                time.sleep(5.0)
+                continue
+
+            self._session(connection)
+            print(f"[Agent {self.agent_id}] Connection to the broker lost, reconnecting.")
+            time.sleep(1.0)
+
+    def _send(self, message):
+        connection = self.connection
+        if connection is None:
+            return False
+        try:
+            _send_message(connection, self.send_lock, message)
+            return True
+        except OSError:
+            return False
+
+    def _heartbeat(self, stopped):
+        while not stopped.wait(self.heartbeat_interval):
+            if not self._send({'type': 'heartbeat'}):
+                return
+
+    def _session(self, connection):
+        self.connection = connection
+        stopped = threading.Event()
+        try:
+            self._send({'type': 'hello', 'agent': self.agent_id, 'slots': self.slots, 'token': self.token})
+            threading.Thread(target=self._heartbeat, args=(stopped,), daemon=True).start()
+            print(f"[Agent {self.agent_id}] Connected to {self.host}:{self.port} with {self.slots} slot(s).")
+
+            for line in connection.makefile('r', encoding='utf-8'):
+                task = json.loads(line)
+                if task.get('type') == 'task':
+                    self.executor.submit(self._handle_task, task)
+        except (OSError, ValueError):
+            pass
+        finally:
+            stopped.set()
+            self.connection = None
+            connection.close()
+
+    def _handle_task(self, task):
+        result = self._execute(task)
+        if not self._send(result):
+            print(f"[Agent {self.agent_id}] Result of {task['run_name']} lost, the broker will requeue it.")
+
+    def _read_text(self, path, max_bytes=200000):
+        with open(path, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            f.seek(max(0, f.tell() - max_bytes))
+            return f.read().decode('utf-8', errors='ignore')
+
+    def _returned_files(self, model_name, run_name, failed):
+        log_dir = os.path.join(self.backend_path, 'log')
+        paths = [
+            os.path.join(log_dir, f'abaqus_log_{run_name}_timings.json'),
+            os.path.join(log_dir, f'abaqus_log_{run_name}_early_stop.json'),
+        ]
+        if failed:
+            paths += failure_sources(self.backend_path, model_name, run_name)
+
+        # Keyed by path relative to the backend so the broker side can mirror them into its own tree.
+        return {
+            os.path.relpath(path, self.backend_path).replace(os.sep, '/'): self._read_text(path)
+            for path in paths if os.path.exists(path)
+        }
+
+    def _remove_run_files(self, model_name, run_name):
+        patterns = [
+            os.path.join(self.backend_path, 'files', '*', f'{model_name}_{run_name}.*'),
+            os.path.join(self.backend_path, 'files', 'inp', f'JobMock_{model_name}_{run_name}.*'),
+        ]
+        for pattern in patterns:
+            for path in glob.glob(pattern):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    def _execute(self, task):
+        run_name = task['run_name']
+        model_config = task['model_config']
+        model_name = next(iter(model_config))
+        print(f"[Agent {self.agent_id}] Running {run_name}.")
+
+        config_path = os.path.join(self.backend_path, 'model_config', f'model_config_{run_name}.json')
+        # Batch jobs write one data file per member.
+        data_file_paths = {
+            member['runName']: os.path.join(self.backend_path, 'data', f"data_{member['runName']}.json")
+            for member in batch_members(model_config[model_name]['modelBuilder'])
+        }
+        log_dir = os.path.join(self.backend_path, 'log')
+
+        remove_stale_locks(self.backend_path, model_name, run_name)
+        for data_file_path in data_file_paths.values():
+            if os.path.exists(data_file_path):
+                os.remove(data_file_path)
+        with open(config_path, 'w') as f:
+            json.dump(model_config, f, indent=4)
+
+        env = dict(os.environ)
+        env["BACKEND_PROJECT_PATH"] = self.backend_path
+        env["MODEL_CONFIG_FILE"] = config_path
+        env["ABAQUS_LOG_FILE"] = os.path.join(log_dir, f"abaqus_log_{run_name}.txt")
+        command_path = os.path.join(self.backend_path, "command.py")
+        abaqus_command = f'"{self.abaqus_cmd_path}" cae noGUI="{command_path}"'
+
+        result = {'type': 'result', 'task_id': task['task_id'], 'agent': self.agent_id}
+        try:
+            with open(os.path.join(log_dir, f"subprocess_stdout_{run_name}.log"), "w") as out_file, \
+                    open(os.path.join(log_dir, f"subprocess_stderr_{run_name}.log"), "w") as err_file:
+                subprocess.run(abaqus_command, shell=True, check=True, stdout=out_file, stderr=err_file,
+                               text=True, env=env, cwd=self.workspace, timeout=self.timeout)
+            data = {}
+            for member_run_name, data_file_path in data_file_paths.items():
+                with open(data_file_path, 'r') as f:
+                    data[member_run_name] = json.load(f)
+            result.update(status='ok', data=data)
+        except Exception as e:
+            if isinstance(e, subprocess.TimeoutExpired):
+                e = RuntimeError("Simulation timed out due to severe element distortion or hanging.")
+            result.update(
+                status='failed',
+                error=str(e),
+                failure_class=classify_failure(failure_sources(self.backend_path, model_name, run_name), e),
+            )
+
+        result['files'] = self._returned_files(model_name, run_name, result['status'] != 'ok')
+
+        os.remove(config_path)
+        if not self.keep_files:
+            self._remove_run_files(model_name, run_name)
+            for data_file_path in data_file_paths.values():
+                if os.path.exists(data_file_path):
+                    os.remove(data_file_path)
+
+        print(f"[Agent {self.agent_id}] {run_name}: {result['status']}.")
+        return result
@@ -0,0 +1,135 @@
+import csv
+import hashlib
+import json
+import os
+
+import numpy as np
+from scipy.stats import qmc
+
+from calibration.evaluator import PARAMETER_NAMES
+
+
+class DesignOfExperiments:
+    def __init__(self, evaluator, doe_config, bounds_min, bounds_max, parameter_names=PARAMETER_NAMES):
+        self.evaluator = evaluator
+        self.method = doe_config.get('method', 'lhs')
+        self.n_samples = doe_config.get('n_samples', 64)
+        self.seed = doe_config.get('seed', 0)
+        self.batch_size = doe_config.get('batch_size', 15)
+
+        self.bounds_min = np.asarray(bounds_min, dtype=float)
+        self.bounds_max = np.asarray(bounds_max, dtype=float)
+        self.parameter_names = parameter_names
+
+        self.plan_path = os.path.join(evaluator.results_dir, 'doe_plan.json')
+        self.results_path = os.path.join(evaluator.results_dir, 'doe_results.csv')
+        self.plan_id = None
+
+    def run_name(self, index):
+        # Names carry the plan hash, so records of a replaced plan never count for the samples of a new one.
+        return f"doe_{self.plan_id}_s{index:04d}"
+
+    def _identity(self):
+        # Everything the samples and their simulations depend on; a plan is only reused when all of it matches.
+        return {
+            'method': self.method,
+            'seed': self.seed,
+            'n_samples': self.n_samples,
+            'parameter_names': list(self.parameter_names),
+            'bounds_min': self.bounds_min.tolist(),
+            'bounds_max': self.bounds_max.tolist(),
+            'context': self.evaluator.cache_context,
+        }
+
+    def _set_plan(self, samples):
+        plan = dict(self._identity(), samples=np.asarray(samples).tolist())
+        self.plan_id = hashlib.sha1(json.dumps(plan, sort_keys=True).encode()).hexdigest()[:8]
+        return samples
+
+    def _sample(self):
+        dimensions = len(self.bounds_min)
+        if self.method == 'sobol':
+            sampler = qmc.Sobol(d=dimensions, scramble=True, seed=self.seed)
+        elif self.method == 'lhs':
+            sampler = qmc.LatinHypercube(d=dimensions, seed=self.seed)
+        else:
+            raise ValueError(f"Unknown DOE method '{self.method}'. Available: lhs, sobol.")
+
+        return qmc.scale(sampler.random(self.n_samples), self.bounds_min, self.bounds_max)
+
+    def load_plan(self):
+        # The plan is written once so an interrupted sweep resumes with the very same samples.
+        identity = self._identity()
+        if os.path.exists(self.plan_path):
+            with open(self.plan_path, 'r') as f:
+                plan = json.load(f)
+            changed = [key for key, value in identity.items() if plan.get(key) != value]
+            if not changed:
+                return self._set_plan(np.array(plan['samples']))
+            print(f"[DOE] Existing plan differs in {', '.join(changed)} and will be replaced.")
+
+        samples = self._sample()
+        os.makedirs(os.path.dirname(self.plan_path), exist_ok=True)
+        with open(self.plan_path, 'w') as f:
+            json.dump(dict(identity, samples=samples.tolist()), f, indent=4)
+
+        return self._set_plan(samples)
+
+    def _records_by_name(self):
+        # Later records of a re-run sample replace the earlier ones; other model contexts never count.
+        return {
+            record['run_name']: record for record in self.evaluator.store.records
+            if record.get('context', '') == self.evaluator.cache_context
+        }
+
+    def _completed_run_names(self):
+        # Unresolved transient failures (infinite cost) say nothing about the sample, so they are run again.
+        return {name for name, record in self._records_by_name().items()
+                if record['status'] == 'ok' or np.isfinite(record['cost'])}
+
+    def run(self):
+        samples = self.load_plan()
+        completed = self._completed_run_names()
+        pending = [i for i in range(len(samples)) if self.run_name(i) not in completed]
+
+        print(f"=== DOE ({self.method}): {len(samples)} samples, {len(samples) - len(pending)} already done ===")
+        for start in range(0, len(pending), self.batch_size):
+            batch = pending[start:start + self.batch_size]
+            self.evaluator.evaluate_batch(samples[batch], None, [self.run_name(i) for i in batch])
+
+        self.write_results(samples)
+
+    def results(self, samples=None):
+        samples = self.load_plan() if samples is None else samples
+        by_name = self._records_by_name()
+
+        results = []
+        for i, position in enumerate(samples):
+            record = by_name.get(self.run_name(i))
+            if record is not None:
+                results.append((i, position, record['cost'], record['status']))
+
+        return results
+
+    def write_results(self, samples=None):
+        results = self.results(samples)
+        with open(self.results_path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['sample'] + list(self.parameter_names) + ['cost', 'status'])
+            for i, position, cost, status in results:
+                writer.writerow([i] + [float(v) for v in position] + [cost, status])
+
+        failed = np.array([position for _, position, _, status in results if status != 'ok'])
+        print(f"[DOE] {len(results)} evaluated, {len(failed)} failed. Results: {self.results_path}")
+
+        if len(failed):
+            unit_failed = (failed - self.bounds_min) / (self.bounds_max - self.bounds_min)
+            print("[DOE] Mean normalized position of failures (0 = bounds_min, 1 = bounds_max):")
+            for name, value in zip(self.parameter_names, unit_failed.mean(axis=0)):
+                print(f"    {name:>8}: {value:.2f}")
+
+    def best_points(self, n):
+        ok = [(cost, position) for _, position, cost, status in self.results() if status == 'ok']
+        ok.sort(key=lambda item: item[0])
+        points = [position for _, position in ok[:n]]
+        return np.array(points) if points else np.empty((0, len(self.parameter_names)))
@@ -0,0 +1,634 @@
+import hashlib
+import json
+import os
+import pickle
+import subprocess
+import threading
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from calibration.distributed import JobBroker, RemoteEvaluationError
+from calibration.failures import classify_failure, failure_sources, is_transient, remove_stale_locks
+from utilities.clean_files import clean_files
+
+PARAMETER_NAMES = ['a', 'b', 'n', 'c', 'p0', 'pMax', 'rMax', 'timeMax']
+PARAMETER_PATHS = {
+    'a': ('material', 'johnsonCook', 'a'),
+    'b': ('material', 'johnsonCook', 'b'),
+    'n': ('material', 'johnsonCook', 'n'),
+    'c': ('material', 'johnsonCook', 'c'),
+    'p0': ('pulse', 'p0'),
+    'pMax': ('pulse', 'pMax'),
+    'rMax': ('pulse', 'rMax'),
+    'timeMax': ('pulse', 'timeMax'),
+}
+
+FAILURE_COST = 1e6
+
+
+def _merge_overrides(section, overrides):
+    for key, value in overrides.items():
+        if isinstance(value, dict):
+            _merge_overrides(section.setdefault(key, {}), value)
+        else:
+            section[key] = value
+
+
+def _make_broker(evaluation_config):
+    if evaluation_config.get('backend', 'local') != 'distributed':
+        return None
+
+    broker = JobBroker(evaluation_config.get('distributed', {}))
+    broker.start()
+    return broker
+
+
+class EvaluationStore:
+    def __init__(self, store_path):
+        self.store_path = store_path
+        self.lock = threading.Lock()
+        self.records = []
+        self.index = {}
+        self.keys_by_file = {}
+
+        if os.path.exists(self.store_path):
+            with open(self.store_path, 'r') as f:
+                for line in f:
+                    if line.strip():
+                        self._index(json.loads(line))
+
+    @staticmethod
+    def key(position, context=''):
+        return context + '|' + ','.join(f'{float(v):.10g}' for v in position)
+
+    @staticmethod
+    def _data_files(record):
+        data_file = record.get('data_file')
+        if data_file is None:
+            return []
+        return data_file if isinstance(data_file, list) else [data_file]
+
+    def _drop(self, data_files):
+        for data_file in data_files:
+            key = self.keys_by_file.pop(data_file, None)
+            if key in self.index and data_file in self._data_files(self.index[key]):
+                del self.index[key]
+
+    def _index(self, record):
+        if record['status'] == 'invalidated':
+            self._drop(self._data_files(record))
+            return
+
+        self.records.append(record)
+        # Data files are named after reusable run names, so only the newest record of a file may serve it.
+        data_files = self._data_files(record)
+        self._drop(data_files)
+        if record['status'] == 'ok':
+            key = self.key(record['position'], record.get('context', ''))
+            self.index[key] = record
+            for data_file in data_files:
+                self.keys_by_file[data_file] = key
+
+    def lookup(self, position, context=''):
+        with self.lock:
+            record = self.index.get(self.key(position, context))
+
+        if record is not None and os.path.exists(record['data_file']):
+            return record
+        return None
+
+    def invalidate(self, data_file):
+        # A new run is about to overwrite this data file; the tombstone keeps a restart from serving older records.
+        self.add({'status': 'invalidated', 'data_file': data_file})
+
+    def add(self, record):
+        with self.lock:
+            self._index(record)
+            os.makedirs(os.path.dirname(self.store_path), exist_ok=True)
+            with open(self.store_path, 'a') as f:
+                f.write(json.dumps(record) + '\n')
+
+
+class SimulationEvaluator:
+    def __init__(self, abaqus_cmd_path, template_config_path, target_spline, evaluation_config,
+                 parameter_names=PARAMETER_NAMES, fixed_parameters=None, model_overrides=None, store=None,
+                 broker=None):
+        self.abaqus_cmd_path = abaqus_cmd_path
+        self.template_config_path = template_config_path
+        self.target_spline = target_spline
+        self.parameter_names = parameter_names
+        self.fixed_parameters = fixed_parameters or {}
+        self.model_overrides = model_overrides or {}
+        self.max_concurrent_jobs = evaluation_config.get('max_concurrent_jobs', 1)
+        self.particles_per_job = evaluation_config.get('particles_per_job', 1)
+        self.timeout = evaluation_config.get('timeout', 600)
+        self.use_cache = evaluation_config.get('cache', True)
+        self.results_dir = evaluation_config.get('results_dir', os.path.join('calibration', 'results'))
+
+        retry_config = evaluation_config.get('retry', {})
+        self.max_attempts = retry_config.get('max_attempts', 3)
+        self.retry_budget = retry_config.get('budget', 30)
+        self.backoff = retry_config.get('backoff', 30.0)
+        self.backoff_factor = retry_config.get('backoff_factor', 2.0)
+        self.retry_lock = threading.Lock()
+        self.failure_counts = defaultdict(Counter)
+
+        self.metrics = None
+
+        self.backend_path = os.path.join(os.getcwd(), 'backend')
+        self.store = store or EvaluationStore(os.path.join(self.results_dir, 'evaluations.jsonl'))
+        self.broker = broker or _make_broker(evaluation_config)
+
+        with open(self.template_config_path, 'r') as f:
+            self.template_config = json.load(f)
+        self.model_name = next(iter(self.template_config))
+
+        # Positions only hold the free parameters, so everything else that changes the model is part of the cache key.
+        self.cache_context = json.dumps(self.fixed_parameters, sort_keys=True) if self.fixed_parameters else ''
+        if self.model_overrides:
+            self.cache_context += '|' + json.dumps(self.model_overrides, sort_keys=True)
+        self.cache_context += '|template:' + self._template_hash()
+
+        self.costs = {}
+        self.run_names = {}
+        self.best_cost = np.inf
+        self.best_data_file = None
+        self.best_lock = threading.Lock()
+
+    def attach_metrics(self, metrics):
+        self.metrics = metrics
+
+    def _stage_timings(self, run_name):
+        timings_path = os.path.join(self.backend_path, "log", f"abaqus_log_{run_name}_timings.json")
+        try:
+            with open(timings_path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _apply_parameters(self, root, position):
+        parameters = dict(self.fixed_parameters)
+        parameters.update(zip(self.parameter_names, position))
+
+        for name, value in parameters.items():
+            *parents, leaf = PARAMETER_PATHS[name]
+            section = root
+            for parent in parents:
+                section = section[parent]
+            section[leaf] = float(value)
+
+    def _template_hash(self):
+        # Mesh, steps, geometry, solver controls, ... of the template after the overrides; run names and the
+        # calibrated values, which every run overwrites, are left out.
+        config = json.loads(json.dumps(self.template_config))
+        model_builder = config[self.model_name]['modelBuilder']
+        _merge_overrides(model_builder, self.model_overrides)
+        for key in ('particleNumber', 'iterationNumber', 'runName', 'batchMembers'):
+            model_builder.pop(key, None)
+        for name in set(self.parameter_names) | set(self.fixed_parameters):
+            *parents, leaf = PARAMETER_PATHS[name]
+            section = model_builder
+            for parent in parents:
+                section = section.get(parent, {})
+            section.pop(leaf, None)
+
+        return hashlib.sha1(json.dumps(config, sort_keys=True).encode()).hexdigest()[:12]
+
+    def template_position(self):
+        model_builder = self.template_config[self.model_name]['modelBuilder']
+        position = []
+        for name in self.parameter_names:
+            section = model_builder
+            for key in PARAMETER_PATHS[name]:
+                section = section[key]
+            position.append(float(section))
+        return np.array(position)
+
+    def _write_model_config(self, positions, run_name, iteration, particles, member_run_names):
+        config = json.loads(json.dumps(self.template_config))
+        model_builder = config[self.model_name]['modelBuilder']
+        model_builder['particleNumber'] = particles[0]
+        model_builder['iterationNumber'] = iteration
+        model_builder['runName'] = run_name
+        _merge_overrides(model_builder, self.model_overrides)
+
+        if len(positions) == 1:
+            self._apply_parameters(model_builder, positions[0])
+        else:
+            # Every member gets its own material and pulse sections; everything else is shared by the batch.
+            model_builder['batchMembers'] = []
+            for position, particle, member_run_name in zip(positions, particles, member_run_names):
+                member = {
+                    'runName': member_run_name,
+                    'particleNumber': particle,
+                    'material': json.loads(json.dumps(model_builder['material'])),
+                    'pulse': json.loads(json.dumps(model_builder['pulse'])),
+                }
+                self._apply_parameters(member, position)
+                model_builder['batchMembers'].append(member)
+
+        config_path = os.path.join(self.backend_path, 'model_config', f'model_config_{run_name}.json')
+        with open(config_path, 'w') as f:
+            json.dump(config, f, indent=4)
+
+        return config_path
+
+    def _run_abaqus_simulation(self, config_path, run_name):
+        log_dir = os.path.join(self.backend_path, "log")
+        command_path = os.path.join(self.backend_path, "command.py")
+        abaqus_command = f'"{self.abaqus_cmd_path}" cae noGUI="{command_path}"'
+
+        env = dict(os.environ)
+        env["BACKEND_PROJECT_PATH"] = self.backend_path
+        env["MODEL_CONFIG_FILE"] = config_path
+        env["ABAQUS_LOG_FILE"] = os.path.join(log_dir, f"abaqus_log_{run_name}.txt")
+
+        stdout_path = os.path.join(log_dir, f"subprocess_stdout_{run_name}.log")
+        stderr_path = os.path.join(log_dir, f"subprocess_stderr_{run_name}.log")
+
+        try:
+            with open(stdout_path, "w") as out_file, open(stderr_path, "w") as err_file:
+                subprocess.run(
+                    abaqus_command,
+                    shell=True,
+                    check=True,
+                    stdout=out_file,
+                    stderr=err_file,
+                    text=True,
+                    env=env,
+                    timeout=self.timeout
+                )
+        except subprocess.TimeoutExpired:
+            print(f"\n[WARNING] Abaqus simulation {run_name} exceeded {self.timeout} seconds. Killing process...")
+            raise RuntimeError("Simulation timed out due to severe element distortion or hanging.")
+        except subprocess.CalledProcessError as e:
+            print(f"\n[ERROR] Abaqus failed for {run_name} with return code {e.returncode}.")
+            raise
+
+    def _run_remote_simulation(self, config_path, run_name):
+        with open(config_path, 'r') as f:
+            model_config = json.load(f)
+
+        result = self.broker.submit(run_name, model_config).result()
+
+        # Logs and timings come back with the result so failures are classified and reported as for local runs.
+        for relative_path, text in result.get('files', {}).items():
+            local_path = os.path.join(self.backend_path, *relative_path.split('/'))
+            os.makedirs(os.path.dirname(local_path), exist_ok=True)
+            with open(local_path, 'w') as f:
+                f.write(text)
+
+        if result['status'] != 'ok':
+            print(f"\n[ERROR] Abaqus failed for {run_name} on agent {result.get('agent')}.")
+            raise RemoteEvaluationError(result.get('error', 'remote evaluation failed'), result.get('failure_class'))
+
+        for member_run_name, data in result['data'].items():
+            with open(os.path.join(self.backend_path, 'data', f'data_{member_run_name}.json'), 'w') as f:
+                json.dump(data, f, indent=4)
+
+    def load_profiles(self, data_file_path):
+        with open(data_file_path, 'r') as f:
+            data = json.load(f)
+
+        profiles = next(iter(data.values()))
+        return {name: np.array(points, dtype=float) for name, points in profiles.items()}
+
+    def residual(self, profiles):
+        surface = profiles["surface"]
+        return surface[:, 1] - self.target_spline(surface[:, 0])
+
+    def compute_cost(self, profiles):
+        return float(np.mean(self.residual(profiles) ** 2))
+
+    def best_residual(self):
+        if self.best_data_file is None:
+            return None
+        return self.residual(self.load_profiles(self.best_data_file))
+
+    def residual_grid(self, data_file):
+        return self.load_profiles(data_file)["surface"][:, 0]
+
+    def interpolated_residual(self, data_file, grid):
+        surface = self.load_profiles(data_file)["surface"]
+        return np.interp(grid, surface[:, 0], self.residual({"surface": surface}))
+
+    def _update_best(self, cost, data_file_path):
+        with self.best_lock:
+            if cost < self.best_cost:
+                self.best_cost = cost
+                self.best_data_file = data_file_path
+
+    def _evaluate_particle(self, position, iteration, particle, run_name=None, queued_at=None):
+        return self._evaluate_group([position], iteration, [particle], [run_name], queued_at)[0]
+
+    def _evaluate_group(self, positions, iteration, particles, run_names, queued_at=None):
+        run_names = [name or f"i{iteration}_p{particle}" for name, particle in zip(run_names, particles)]
+        results = [None] * len(positions)
+
+        if self.use_cache:
+            for i, (position, run_name) in enumerate(zip(positions, run_names)):
+                cached = self.store.lookup(position, self.cache_context)
+                if cached is not None:
+                    cost = self.compute_cost(self.load_profiles(cached['data_file']))
+                    print(f"[{run_name}] Cache hit ({cached['run_name']}) | Cost (MSE): {cost:.4f}")
+                    self._update_best(cost, cached['data_file'])
+                    if self.metrics is not None:
+                        self.metrics.cache_hit()
+                    results[i] = (cost, cached['data_file'])
+
+        pending = [i for i, result in enumerate(results) if result is None]
+        if not pending:
+            return results
+
+        # A batch job packs several particles into one model and is named after its first member.
+        job_run_name = run_names[pending[0]]
+        if len(pending) > 1:
+            job_run_name = f"batch_{job_run_name}_n{len(pending)}"
+
+        start_time = time.time()
+        stage_seconds = {'queue': start_time - queued_at} if queued_at is not None else {}
+        if self.metrics is not None:
+            for _ in pending:
+                self.metrics.evaluation_started()
+        data_file_paths = [os.path.join(self.backend_path, 'data', f'data_{run_names[i]}.json') for i in pending]
+        for data_file_path in data_file_paths:
+            self.store.invalidate(data_file_path)
+        config_path = self._write_model_config(
+            [positions[i] for i in pending], job_run_name, iteration,
+            [particles[i] for i in pending], [run_names[i] for i in pending]
+        )
+
+        attempt = 0
+        failure_class = None
+        while True:
+            attempt += 1
+            try:
+                # The backend appends to its log, so errors of an earlier attempt must not classify this one.
+                for path in data_file_paths + [os.path.join(self.backend_path, 'log', f'abaqus_log_{job_run_name}.txt')]:
+                    if os.path.exists(path):
+                        os.remove(path)
+                process_start = time.time()
+                if self.broker is not None:
+                    self._run_remote_simulation(config_path, job_run_name)
+                else:
+                    self._run_abaqus_simulation(config_path, job_run_name)
+                stage_seconds['abaqus_process'] = time.time() - process_start
+                stage_seconds.update(self._stage_timings(job_run_name))
+
+                cost_start = time.time()
+                costs = [self.compute_cost(self.load_profiles(data_file_path)) for data_file_path in data_file_paths]
+                stage_seconds['cost'] = time.time() - cost_start
+                status = 'ok'
+                break
+            except Exception as e:
+                failure_class = getattr(e, 'failure_class', None) or classify_failure(
+                    failure_sources(self.backend_path, self.model_name, job_run_name), e)
+                with self.retry_lock:
+                    self.failure_counts[iteration][failure_class] += 1
+
+                if is_transient(failure_class) and attempt < self.max_attempts and self._take_retry():
+                    delay = self.backoff * self.backoff_factor ** (attempt - 1)
+                    print(f"[{job_run_name}] Transient failure ({failure_class}), retrying in {delay:.0f} s "
+                          f"(attempt {attempt + 1}/{self.max_attempts}).")
+                    if failure_class == 'lock':
+                        remove_stale_locks(self.backend_path, self.model_name, job_run_name)
+                    time.sleep(delay)
+                    continue
+
+                print(f"[ERROR] Simulation failed for {job_run_name} ({failure_class}): {e}")
+                # Unresolved transient failures say nothing about the parameters, so they are
+                # reported as infinite (never better than a personal best) instead of penalized.
+                costs = [np.inf if is_transient(failure_class) else FAILURE_COST] * len(pending)
+                status = 'failed'
+                break
+
+        if os.path.exists(config_path):
+            os.remove(config_path)
+
+        if self.metrics is not None:
+            for _ in pending:
+                self.metrics.evaluation_finished(stage_seconds, failure_class if status != 'ok' else None)
+
+        if status != 'ok' and not is_transient(failure_class) and len(pending) > 1:
+            # A single distorted member aborts the whole job, so the members are re-run one job each.
+            print(f"[{job_run_name}] Batch failed, re-running its {len(pending)} members as single jobs.")
+            if self.metrics is not None:
+                self.metrics.evaluation_queued(len(pending))
+            for i in pending:
+                results[i] = self._evaluate_group([positions[i]], iteration, [particles[i]], [run_names[i]], time.time())[0]
+            return results
+
+        for i, cost, data_file_path in zip(pending, costs, data_file_paths):
+            self.store.add({
+                'run_name': run_names[i],
+                'batch': job_run_name if len(pending) > 1 else None,
+                'iteration': iteration,
+                'particle': particles[i],
+                'position': [float(v) for v in positions[i]],
+                'cost': cost,
+                'status': status,
+                'context': self.cache_context,
+                'data_file': data_file_path,
+                'failure_class': failure_class,
+                'attempts': attempt,
+                'elapsed': time.time() - start_time,
+            })
+            self.costs[(iteration, particles[i])] = cost
+            if status == 'ok':
+                self._update_best(cost, data_file_path)
+            # Job artifacts are named after the job, which batch members share.
+            self.run_names[(iteration, particles[i])] = job_run_name
+
+            print(f"[{run_names[i]}] Cost (MSE): {cost:.4f}")
+            results[i] = (cost, data_file_path if status == 'ok' else None)
+
+        return results
+
+    def _take_retry(self):
+        with self.retry_lock:
+            if self.retry_budget <= 0:
+                return False
+            self.retry_budget -= 1
+            return True
+
+    def failure_report(self, iteration):
+        counts = self.failure_counts.get(iteration)
+        if not counts:
+            return "no failures"
+        return ", ".join(f"{failure_class}: {count}" for failure_class, count in sorted(counts.items()))
+
+    def _submit(self, executor, positions, iteration, run_names):
+        queued_at = time.time()
+        return [
+            executor.submit(
+                self._evaluate_group, positions[start:start + self.particles_per_job], iteration,
+                list(range(start, min(start + self.particles_per_job, len(positions)))),
+                run_names[start:start + self.particles_per_job], queued_at
+            )
+            for start in range(0, len(positions), self.particles_per_job)
+        ]
+
+    @staticmethod
+    def _collect(futures):
+        return [result for future in futures for result in future.result()]
+
+    def evaluate_batch(self, positions, iteration, run_names=None):
+        positions = np.atleast_2d(positions)
+        run_names = run_names or [None] * len(positions)
+        if self.metrics is not None:
+            self.metrics.evaluation_queued(len(positions))
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_jobs) as executor:
+            results = self._collect(self._submit(executor, positions, iteration, run_names))
+
+        clean_files()
+        return results
+
+    def evaluate(self, positions, iteration):
+        return np.array([cost for cost, _ in self.evaluate_batch(positions, iteration)])
+
+
+class MultiExperimentEvaluator:
+    def __init__(self, abaqus_cmd_path, template_config_path, experiments, evaluation_config,
+                 parameter_names=PARAMETER_NAMES, fixed_parameters=None):
+        self.max_concurrent_jobs = evaluation_config.get('max_concurrent_jobs', 1)
+        self.results_dir = evaluation_config.get('results_dir', os.path.join('calibration', 'results'))
+        self.cache_context = ''
+
+        # Every experiment keeps its own cached simulations; the joint store only holds the combined costs.
+        simulation_store = EvaluationStore(os.path.join(self.results_dir, 'evaluations.jsonl'))
+        broker = _make_broker(evaluation_config)
+        self.store = EvaluationStore(os.path.join(self.results_dir, 'joint_evaluations.jsonl'))
+
+        self.experiment_names = []
+        self.weights = []
+        self.evaluators = []
+        for experiment in experiments:
+            with open(experiment['target_curve'], 'rb') as f:
+                target_spline = pickle.load(f)
+
+            # Free parameters are applied last, so an overlap would silently override the experiment's own values.
+            overlap = [name for name in parameter_names if name in experiment.get('parameters', {})]
+            if overlap:
+                raise ValueError(
+                    f"Experiment '{experiment['name']}' fixes {', '.join(overlap)}, which are also free parameters. "
+                    f"Remove them from parameter_names (and the bounds) for a joint calibration."
+                )
+
+            experiment_fixed = dict(fixed_parameters or {})
+            experiment_fixed.update(experiment.get('parameters', {}))
+
+            self.experiment_names.append(experiment['name'])
+            self.weights.append(float(experiment.get('weight', 1.0)))
+            self.evaluators.append(SimulationEvaluator(
+                abaqus_cmd_path,
+                template_config_path,
+                target_spline,
+                evaluation_config,
+                parameter_names=parameter_names,
+                fixed_parameters=experiment_fixed,
+                model_overrides=experiment.get('model_overrides'),
+                store=simulation_store,
+                broker=broker,
+            ))
+
+        self.weights = np.array(self.weights) / np.sum(self.weights)
+
+        self.costs = {}
+        self.run_names = {}
+        self.best_cost = np.inf
+        self.best_data_file = None
+        self.metrics = None
+
+    def attach_metrics(self, metrics):
+        self.metrics = metrics
+        for evaluator in self.evaluators:
+            evaluator.attach_metrics(metrics)
+
+    def failure_report(self, iteration):
+        counts = Counter()
+        for evaluator in self.evaluators:
+            counts.update(evaluator.failure_counts.get(iteration, {}))
+        if not counts:
+            return "no failures"
+        return ", ".join(f"{failure_class}: {count}" for failure_class, count in sorted(counts.items()))
+
+    def load_profiles(self, data_files):
+        profiles = {}
+        for name, data_file in zip(self.experiment_names, data_files):
+            for path_name, profile in self.evaluators[0].load_profiles(data_file).items():
+                profiles[f"{name}/{path_name}"] = profile
+        return profiles
+
+    def residual_grid(self, data_files):
+        return [evaluator.residual_grid(f) for evaluator, f in zip(self.evaluators, data_files)]
+
+    def interpolated_residual(self, data_files, grids):
+        # Scaled so that the squared norm equals the weighted sum of per-experiment MSEs.
+        return np.concatenate([
+            np.sqrt(weight / len(grid)) * evaluator.interpolated_residual(data_file, grid)
+            for evaluator, weight, data_file, grid in zip(self.evaluators, self.weights, data_files, grids)
+        ])
+
+    def best_residual(self):
+        if self.best_data_file is None:
+            return None
+        return self.interpolated_residual(self.best_data_file, self.residual_grid(self.best_data_file))
+
+    def evaluate_batch(self, positions, iteration, run_names=None):
+        positions = np.atleast_2d(positions)
+        run_names = run_names or [f"i{iteration}_p{particle}" for particle in range(len(positions))]
+        if self.metrics is not None:
+            self.metrics.evaluation_queued(len(positions) * len(self.evaluators))
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_jobs) as executor:
+            futures = [
+                evaluator._submit(executor, positions, iteration, [f"{name}_{experiment}" for name in run_names])
+                for evaluator, experiment in zip(self.evaluators, self.experiment_names)
+            ]
+            experiment_results = list(zip(*[evaluator._collect(f) for evaluator, f in zip(self.evaluators, futures)]))
+
+        clean_files()
+
+        results = []
+        for particle, (position, name, row) in enumerate(zip(positions, run_names, experiment_results)):
+            experiment_costs = np.array([cost for cost, _ in row])
+            data_files = [data_file for _, data_file in row]
+            failed = any(data_file is None for data_file in data_files)
+
+            if not failed:
+                cost = float(np.dot(self.weights, experiment_costs))
+            else:
+                cost = np.inf if np.isinf(experiment_costs).any() else FAILURE_COST
+            results.append((cost, None if failed else data_files))
+
+            self.store.add({
+                'run_name': name,
+                'iteration': iteration,
+                'particle': particle,
+                'position': [float(v) for v in position],
+                'cost': cost,
+                'experiment_costs': dict(zip(self.experiment_names, experiment_costs.tolist())),
+                'status': 'failed' if failed else 'ok',
+                'data_file': data_files,
+                'context': self.cache_context,
+            })
+            self.costs[(iteration, particle)] = cost
+            self.run_names[(iteration, particle)] = [
+                evaluator.run_names[(iteration, particle)] for evaluator in self.evaluators
+                if (iteration, particle) in evaluator.run_names
+            ]
+            if not failed and cost < self.best_cost:
+                self.best_cost = cost
+                self.best_data_file = data_files
+
+            print(f"[{name}] Joint cost: {cost:.4f} | " + ", ".join(
+                f"{experiment}: {c:.4f}" for experiment, c in zip(self.experiment_names, experiment_costs)))
+
+        return results
+
+    def evaluate(self, positions, iteration):
+        return np.array([cost for cost, _ in self.evaluate_batch(positions, iteration)])
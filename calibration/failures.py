@@ -0,0 +1,79 @@
+import glob
+import os
+
+# Ordered: the first class whose pattern appears in the logs wins.
+FAILURE_PATTERNS = [
+    # Successful runs also log license check-outs, so only failure wording is matched here.
+    ('license', [
+        'license error', 'licensing error', 'license server', 'unable to check out', 'failed to check out',
+        'insufficient tokens', 'licensed number of users already reached', 'no such feature exists',
+        'license queue', 'dsls error', 'flexnet licensing error',
+    ]),
+    ('lock', [
+        '.lck', 'lock file', 'is locked', 'locked by another',
+    ]),
+    ('solver', [
+        'excessively distorted', 'excessive distortion', 'analysis has not been completed',
+        'has exited with an error', '***error', 'negative eigenvalue', 'deformation speed',
+        'numerical singularity',
+    ]),
+    # command.py catches every backend exception, logs its traceback and exits 0, so model building and
+    # extraction errors surface as missing data; the logged traceback shows they are not transient.
+    ('backend', [
+        '[command error]',
+    ]),
+]
+
+TRANSIENT_CLASSES = {'license', 'lock', 'missing_data'}
+
+
+def is_transient(failure_class):
+    return failure_class in TRANSIENT_CLASSES
+
+
+def failure_sources(backend_path, model_name, run_name):
+    log_dir = os.path.join(backend_path, 'log')
+    job_dir = os.path.join(backend_path, 'files', 'job')
+
+    return [
+        os.path.join(log_dir, f'subprocess_stdout_{run_name}.log'),
+        os.path.join(log_dir, f'subprocess_stderr_{run_name}.log'),
+        os.path.join(log_dir, f'abaqus_log_{run_name}.txt'),
+        os.path.join(job_dir, f'{model_name}_{run_name}.msg'),
+        os.path.join(job_dir, f'{model_name}_{run_name}.sta'),
+    ]
+
+
+def _read_tail(path, max_bytes=200000):
+    try:
+        with open(path, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            f.seek(max(0, f.tell() - max_bytes))
+            return f.read().decode('utf-8', errors='ignore').lower()
+    except OSError:
+        return ''
+
+
+def classify_failure(source_paths, exception=None):
+    text = '\n'.join(_read_tail(path) for path in source_paths)
+
+    for failure_class, patterns in FAILURE_PATTERNS:
+        if any(pattern in text for pattern in patterns):
+            return failure_class
+
+    # Hung jobs are treated like the README describes: a distorted mesh, i.e. a physical failure.
+    if exception is not None and 'timed out' in str(exception).lower():
+        return 'timeout'
+    if isinstance(exception, (FileNotFoundError, KeyError, ValueError)):
+        return 'missing_data'
+
+    return 'unknown'
+
+
+def remove_stale_locks(backend_path, model_name, run_name):
+    pattern = os.path.join(backend_path, 'files', 'job', f'{model_name}_{run_name}*.lck')
+    for path in glob.glob(pattern):
+        try:
+            os.remove(path)
+        except OSError as e:
+            print(f"[WARNING] Could not remove lock file {path}: {e}")
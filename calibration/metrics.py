@@ -0,0 +1,199 @@
+import json
+import os
+import threading
+import time
+from collections import Counter, defaultdict, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class MetricsRecorder:
+    def __init__(self, monitoring_config):
+        self.enabled = monitoring_config.get('enabled', False)
+        self.host = monitoring_config.get('host', '127.0.0.1')
+        self.http_port = monitoring_config.get('http_port')
+        self.metrics_file = monitoring_config.get('metrics_file', os.path.join('calibration', 'results', 'metrics.json'))
+        self.rate_window = monitoring_config.get('rate_window', 50)
+
+        self.lock = threading.Lock()
+        self.file_lock = threading.Lock()
+        self.start_time = time.time()
+        self.iteration = 0
+        self.n_iterations = 0
+        self.n_particles = 0
+        self.n_experiments = 1
+        self.queued = 0
+        self.running = 0
+        self.completed = 0
+        self.cache_hits = 0
+        self.failures = Counter()
+        self.stage_seconds = defaultdict(float)
+        self.stage_counts = Counter()
+        self.best_cost = float('inf')
+        self.finish_times = deque(maxlen=self.rate_window)
+        self.server = None
+
+    def start(self):
+        if not self.enabled:
+            return
+
+        if self.http_port is not None:
+            try:
+                self.server = ThreadingHTTPServer((self.host, self.http_port), _handler_for(self))
+            except OSError as e:
+                # Another calibration on this host already holds the port, so let the OS pick a free one.
+                print(f"[Metrics] Port {self.http_port} unavailable ({e}), using a free port instead.")
+                self.server = ThreadingHTTPServer((self.host, 0), _handler_for(self))
+            threading.Thread(target=self.server.serve_forever, daemon=True).start()
+            port = self.server.server_address[1]
+            print(f"[Metrics] Serving http://{self.host}:{port}/metrics (Prometheus) and /status (JSON)")
+
+        self._write_file()
+
+    def stop(self):
+        if self.server is not None:
+            self.server.shutdown()
+            self.server = None
+        if self.enabled:
+            self._write_file()
+
+    def set_iteration(self, iteration, n_iterations, n_particles, n_experiments=1):
+        with self.lock:
+            self.iteration = iteration
+            self.n_iterations = n_iterations
+            self.n_particles = n_particles
+            self.n_experiments = n_experiments
+        self._write_file()
+
+    def set_best(self, best_cost):
+        with self.lock:
+            self.best_cost = min(self.best_cost, float(best_cost))
+        self._write_file()
+
+    def evaluation_queued(self, n=1):
+        with self.lock:
+            self.queued += n
+
+    def evaluation_started(self):
+        with self.lock:
+            self.queued = max(0, self.queued - 1)
+            self.running += 1
+
+    def cache_hit(self):
+        with self.lock:
+            self.queued = max(0, self.queued - 1)
+            self.cache_hits += 1
+
+    def evaluation_finished(self, stage_seconds, failure_class=None):
+        with self.lock:
+            self.running = max(0, self.running - 1)
+            self.completed += 1
+            self.finish_times.append(time.time())
+            for stage, seconds in stage_seconds.items():
+                self.stage_seconds[stage] += seconds
+                self.stage_counts[stage] += 1
+            if failure_class is not None:
+                self.failures[failure_class] += 1
+        self._write_file()
+
+    def snapshot(self):
+        with self.lock:
+            elapsed = time.time() - self.start_time
+            if len(self.finish_times) >= 2:
+                window = self.finish_times[-1] - self.finish_times[0]
+                rate = (len(self.finish_times) - 1) / window * 3600.0 if window > 0 else 0.0
+            else:
+                rate = self.completed / elapsed * 3600.0 if elapsed > 0 else 0.0
+
+            lookups = self.completed + self.cache_hits
+            # Throughput counts simulations, and a joint calibration runs one per experiment and particle.
+            future = max(0, self.n_iterations - self.iteration - 1) * self.n_particles * self.n_experiments
+            remaining = future + self.running + self.queued
+
+            return {
+                'timestamp': time.time(),
+                'elapsed_seconds': elapsed,
+                'iteration': self.iteration,
+                'n_iterations': self.n_iterations,
+                'running': self.running,
+                'queued': self.queued,
+                'completed': self.completed,
+                'evaluations_per_hour': rate,
+                'cache_hits': self.cache_hits,
+                'cache_hit_rate': self.cache_hits / lookups if lookups else 0.0,
+                'failures': dict(self.failures),
+                'stage_mean_seconds': {
+                    stage: self.stage_seconds[stage] / self.stage_counts[stage] for stage in self.stage_counts
+                },
+                'best_cost': self.best_cost,
+                'eta_seconds': remaining / rate * 3600.0 if rate > 0 else None,
+            }
+
+    def prometheus_text(self):
+        snapshot = self.snapshot()
+        lines = []
+
+        def metric(name, value, help_text, metric_type='gauge', labels=''):
+            lines.append(f"# HELP lsp_{name} {help_text}")
+            lines.append(f"# TYPE lsp_{name} {metric_type}")
+            lines.append(f"lsp_{name}{labels} {value}")
+
+        metric('iteration', snapshot['iteration'], 'Current calibration iteration.')
+        metric('iterations_total', snapshot['n_iterations'], 'Configured number of iterations.')
+        metric('evaluations_running', snapshot['running'], 'Evaluations currently running.')
+        metric('evaluations_queued', snapshot['queued'], 'Evaluations waiting for a worker.')
+        metric('evaluations_completed_total', snapshot['completed'], 'Finished simulations.', 'counter')
+        metric('evaluations_per_hour', snapshot['evaluations_per_hour'], 'Recent evaluation throughput.')
+        metric('cache_hits_total', snapshot['cache_hits'], 'Evaluations served from the cache.', 'counter')
+        metric('cache_hit_rate', snapshot['cache_hit_rate'], 'Share of evaluations served from the cache.')
+        metric('best_cost', snapshot['best_cost'], 'Best cost found so far.')
+        metric('eta_seconds', snapshot['eta_seconds'] if snapshot['eta_seconds'] is not None else 'NaN',
+               'Estimated seconds until n_iterations is reached.')
+
+        lines.append("# HELP lsp_failures_total Failed evaluations per failure class.")
+        lines.append("# TYPE lsp_failures_total counter")
+        for failure_class, count in snapshot['failures'].items():
+            lines.append(f'lsp_failures_total{{class="{failure_class}"}} {count}')
+
+        lines.append("# HELP lsp_stage_mean_seconds Mean duration per evaluation stage.")
+        lines.append("# TYPE lsp_stage_mean_seconds gauge")
+        for stage, seconds in snapshot['stage_mean_seconds'].items():
+            lines.append(f'lsp_stage_mean_seconds{{stage="{stage}"}} {seconds}')
+
+        return "\n".join(lines) + "\n"
+
+    def _write_file(self):
+        if not self.enabled or not self.metrics_file:
+            return
+
+        snapshot = self.snapshot()
+        os.makedirs(os.path.dirname(self.metrics_file) or '.', exist_ok=True)
+        temporary_path = self.metrics_file + '.tmp'
+        with self.file_lock:
+            with open(temporary_path, 'w') as f:
+                json.dump(snapshot, f, indent=4)
+            os.replace(temporary_path, self.metrics_file)
+
+
+def _handler_for(recorder):
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.startswith('/metrics'):
+                body = recorder.prometheus_text().encode('utf-8')
+                content_type = 'text/plain; version=0.0.4'
+            elif self.path in ('/', '/status'):
+                body = json.dumps(recorder.snapshot(), indent=4).encode('utf-8')
+                content_type = 'application/json'
+            else:
+                self.send_error(404)
+                return
+
+            self.send_response(200)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return MetricsHandler
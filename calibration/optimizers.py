@@ -0,0 +1,129 @@
+import numpy as np
+from pyswarms.backend.generators import create_swarm
+from pyswarms.backend.handlers import BoundaryHandler, VelocityHandler
+from pyswarms.backend.operators import compute_pbest
+from pyswarms.backend.topology import Star
+
+
+class Optimizer:
+    def __init__(self, bounds):
+        self.bounds_min = np.asarray(bounds[0], dtype=float)
+        self.bounds_max = np.asarray(bounds[1], dtype=float)
+        self.dimensions = len(self.bounds_min)
+        self.best_cost = np.inf
+        self.best_pos = None
+
+    def ask(self, n=None):
+        raise NotImplementedError
+
+    def tell(self, positions, costs):
+        raise NotImplementedError
+
+    def _update_best(self, positions, costs):
+        i = int(np.argmin(costs))
+        if costs[i] < self.best_cost:
+            self.best_cost = float(costs[i])
+            self.best_pos = np.array(positions[i], dtype=float)
+
+
+class PSOOptimizer(Optimizer):
+    def __init__(self, bounds, n_particles, options, init_pos=None):
+        super().__init__(bounds)
+        self.n_particles = n_particles
+        self.bounds = (self.bounds_min, self.bounds_max)
+
+        self.swarm = create_swarm(
+            n_particles=n_particles,
+            dimensions=self.dimensions,
+            options=options,
+            bounds=self.bounds,
+            init_pos=init_pos,
+        )
+        self.swarm.pbest_cost = np.full(n_particles, np.inf)
+        self.swarm.best_cost = np.inf
+        self.topology = Star()
+        self.vh = VelocityHandler(strategy="unmodified")
+        self.bh = BoundaryHandler(strategy="periodic")
+        self.told = False
+
+    @property
+    def positions(self):
+        return self.swarm.position
+
+    def ask(self, n=None):
+        if n is not None and n != self.n_particles:
+            raise ValueError(f"PSO proposes exactly n_particles={self.n_particles} points per generation.")
+
+        # Without a finite global best (e.g. a whole generation lost to a license outage) there is nothing
+        # to move towards, so the same generation is proposed again.
+        if self.told and np.isfinite(self.swarm.best_cost):
+            self.swarm.velocity = self.topology.compute_velocity(self.swarm, None, self.vh, self.bounds)
+            self.swarm.position = self.topology.compute_position(self.swarm, self.bounds, self.bh)
+        self.told = False
+
+        return self.swarm.position.copy()
+
+    def tell(self, positions, costs):
+        self.swarm.position = np.asarray(positions, dtype=float)
+        self.swarm.current_cost = np.asarray(costs, dtype=float)
+        self.swarm.pbest_pos, self.swarm.pbest_cost = compute_pbest(self.swarm)
+
+        if np.min(self.swarm.pbest_cost) < self.swarm.best_cost:
+            self.swarm.best_pos, self.swarm.best_cost = self.topology.compute_gbest(self.swarm)
+
+        self._update_best(positions, costs)
+        self.told = True
+
+
+class CMAESOptimizer(Optimizer):
+    def __init__(self, bounds, n_particles, sigma0=0.3, x0=None, seed=None):
+        super().__init__(bounds)
+        try:
+            import cma
+        except ImportError as e:
+            raise ImportError("The CMA-ES optimizer requires the 'cma' package (pip install cma).") from e
+
+        # CMA-ES works in the unit cube so a single sigma0 fits every parameter scale.
+        x0_unit = np.full(self.dimensions, 0.5) if x0 is None else self._to_unit(x0)
+        cma_options = {'bounds': [0.0, 1.0], 'popsize': n_particles, 'verbose': -9}
+        if seed is not None:
+            cma_options['seed'] = seed
+
+        self.es = cma.CMAEvolutionStrategy(x0_unit, sigma0, cma_options)
+        self.positions = None
+
+    def _to_unit(self, positions):
+        return (np.asarray(positions, dtype=float) - self.bounds_min) / (self.bounds_max - self.bounds_min)
+
+    def _from_unit(self, positions):
+        return self.bounds_min + np.asarray(positions, dtype=float) * (self.bounds_max - self.bounds_min)
+
+    def ask(self, n=None):
+        self.positions = self._from_unit(np.array(self.es.ask(n)))
+        return self.positions.copy()
+
+    def tell(self, positions, costs):
+        costs = np.asarray(costs, dtype=float)
+        # CMA-ES ranks candidates, so non-finite costs are simply ranked last.
+        finite = costs[np.isfinite(costs)]
+        worst = finite.max() if len(finite) else 1.0
+        ranked_costs = np.where(np.isfinite(costs), costs, worst + abs(worst) + 1.0)
+        self.es.tell(list(self._to_unit(positions)), [float(c) for c in ranked_costs])
+        self._update_best(positions, costs)
+
+
+def make_optimizer(optimizer_config, bounds, n_particles, options, init_pos=None):
+    name = optimizer_config.get('name', 'pso').lower()
+
+    if name == 'pso':
+        return PSOOptimizer(bounds, n_particles, options, init_pos=init_pos)
+    if name in ('cma', 'cmaes', 'cma-es'):
+        x0 = None if init_pos is None else np.asarray(init_pos)[0]
+        return CMAESOptimizer(
+            bounds, n_particles,
+            sigma0=optimizer_config.get('sigma0', 0.3),
+            x0=x0,
+            seed=optimizer_config.get('seed'),
+        )
+
+    raise ValueError(f"Unknown optimizer '{name}'. Available: pso, cmaes.")
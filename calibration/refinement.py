@@ -0,0 +1,98 @@
+import numpy as np
+from scipy.optimize import least_squares
+
+from calibration.evaluator import FAILURE_COST
+
+
+class FiniteDifferenceRefiner:
+    def __init__(self, evaluator, refinement_config, bounds_min, bounds_max, evaluate_batch=None):
+        self.evaluator = evaluator
+        # The calibrator passes its own batch function so refinement batches get the per-iteration bookkeeping.
+        self.evaluate_batch = evaluate_batch or evaluator.evaluate_batch
+        self.enabled = refinement_config.get('enabled', False)
+        self.scheme = refinement_config.get('scheme', 'forward')
+        self.step = refinement_config.get('step', 0.01)
+        self.max_evaluations = refinement_config.get('max_evaluations', 10)
+        self.xtol = refinement_config.get('xtol', 1e-3)
+        self.ftol = refinement_config.get('ftol', 1e-3)
+
+        self.bounds_min = np.asarray(bounds_min, dtype=float)
+        self.bounds_max = np.asarray(bounds_max, dtype=float)
+
+        self.iteration = None
+        self.reference_grid = None
+        self.n_evaluations = 0
+
+    # The search runs in the unit cube so that one step size fits every parameter scale.
+    def _to_unit(self, position):
+        return (np.asarray(position, dtype=float) - self.bounds_min) / (self.bounds_max - self.bounds_min)
+
+    def _from_unit(self, unit_position):
+        return self.bounds_min + np.asarray(unit_position, dtype=float) * (self.bounds_max - self.bounds_min)
+
+    def _residuals(self, unit_positions):
+        results = self.evaluate_batch(self._from_unit(unit_positions), self.iteration)
+        self.iteration += 1
+        self.n_evaluations += len(unit_positions)
+
+        residuals = []
+        for _, data_file in results:
+            if data_file is None:
+                residuals.append(np.full(self.n_residuals, np.sqrt(FAILURE_COST)))
+                continue
+
+            residuals.append(self.evaluator.interpolated_residual(data_file, self.reference_grid))
+
+        return np.array(residuals)
+
+    def _fun(self, unit_position):
+        return self._residuals(np.atleast_2d(unit_position))[0]
+
+    def _jac(self, unit_position):
+        dimensions = len(unit_position)
+        # Step inwards at the bounds so every perturbed point stays feasible.
+        steps = np.where(unit_position + self.step > 1.0, -self.step, self.step)
+
+        if self.scheme == 'central':
+            perturbed = np.vstack([unit_position + np.diag(steps), unit_position - np.diag(steps)])
+            perturbed = np.clip(perturbed, 0.0, 1.0)
+            residuals = self._residuals(perturbed)
+            deltas = np.diag(perturbed[:dimensions] - perturbed[dimensions:])
+            return ((residuals[:dimensions] - residuals[dimensions:]) / deltas[:, None]).T
+
+        perturbed = np.vstack([unit_position[None, :], unit_position + np.diag(steps)])
+        residuals = self._residuals(perturbed)
+        return ((residuals[1:] - residuals[0]) / steps[:, None]).T
+
+    def run(self, best_pos, first_iteration):
+        self.iteration = first_iteration
+        self.n_evaluations = 0
+
+        _, data_file = self.evaluate_batch(np.atleast_2d(best_pos), self.iteration)[0]
+        self.iteration += 1
+        if data_file is None:
+            print("[Refinement] Starting point could not be evaluated, refinement skipped.")
+            return best_pos, np.inf
+
+        self.reference_grid = self.evaluator.residual_grid(data_file)
+        self.n_residuals = len(self.evaluator.interpolated_residual(data_file, self.reference_grid))
+
+        print(f"\n=== Finite-Difference Refinement ({self.scheme}, step={self.step}) ===")
+        result = least_squares(
+            self._fun,
+            np.clip(self._to_unit(best_pos), 0.0, 1.0),
+            jac=self._jac,
+            bounds=(0.0, 1.0),
+            method='trf',
+            max_nfev=self.max_evaluations,
+            xtol=self.xtol,
+            ftol=self.ftol,
+        )
+
+        refined_pos = self._from_unit(result.x)
+        refined_cost = float(self.evaluate_batch(np.atleast_2d(refined_pos), self.iteration)[0][0])
+        self.iteration += 1
+        print(f"[Refinement] {result.message} Evaluations (cached included): {self.n_evaluations}, "
+              f"Cost (MSE): {refined_cost:.4f}")
+
+        return refined_pos, refined_cost
@@ -0,0 +1,110 @@
+import glob
+import gzip
+import os
+import shutil
+
+import numpy as np
+
+from calibration.evaluator import FAILURE_COST
+
+SOLVER_SCRATCH_EXTENSIONS = (
+    '.023', '.abq', '.com', '.ipm', '.lck', '.log', '.mdl', '.pac', '.prt', '.res', '.sel', '.sim', '.stt'
+)
+DIAGNOSTIC_EXTENSIONS = ('.dat', '.msg', '.sta')
+
+
+class ArtifactRetention:
+    def __init__(self, policy, model_name='lspModel', backend_path='backend'):
+        self.enabled = policy.get('enabled', False)
+        self.keep_top_k = policy.get('keep_top_k', 3)
+        self.keep_latest_generation = policy.get('keep_latest_generation', True)
+        self.keep_failed = policy.get('keep_failed', False)
+        self.compress = policy.get('compress', False)
+        self.report_disk_usage = policy.get('report_disk_usage', True)
+
+        self.model_name = model_name
+        self.files_dir_path = os.path.join(backend_path, 'files')
+        self.data_dir_path = os.path.join(backend_path, 'data')
+
+    def _artifact_paths(self, run_name):
+        patterns = [
+            os.path.join(self.files_dir_path, 'job', f'{self.model_name}_{run_name}.*'),
+            os.path.join(self.files_dir_path, 'cae', f'{self.model_name}_{run_name}.*'),
+            os.path.join(self.files_dir_path, 'inp', f'JobMock_{self.model_name}_{run_name}.*'),
+        ]
+        return [path for pattern in patterns for path in glob.glob(pattern)]
+
+    def _is_extracted(self, run_name):
+        return os.path.exists(os.path.join(self.data_dir_path, f'data_{run_name}.json'))
+
+    def _remove(self, path):
+        try:
+            size = os.path.getsize(path)
+            os.remove(path)
+            return size
+        except OSError as e:
+            print(f"[WARNING] Could not remove {path}: {e}")
+            return 0
+
+    def _compress(self, path):
+        compressed_path = path + '.gz'
+        with open(path, 'rb') as src, gzip.open(compressed_path, 'wb', compresslevel=6) as dst:
+            shutil.copyfileobj(src, dst)
+        return self._remove(path) - os.path.getsize(compressed_path)
+
+    def disk_usage(self):
+        total = 0
+        for root, _, files in os.walk(self.files_dir_path):
+            for file_name in files:
+                try:
+                    total += os.path.getsize(os.path.join(root, file_name))
+                except OSError:
+                    pass
+        return total
+
+    def _apply_to_run(self, run_name, kept, latest, extracted):
+        freed = 0
+
+        for path in self._artifact_paths(run_name):
+            if path.endswith(SOLVER_SCRATCH_EXTENSIONS):
+                freed += self._remove(path)
+            elif kept or (not extracted and self.keep_failed):
+                if self.compress and not latest and path.endswith('.odb'):
+                    freed += self._compress(path)
+            elif not path.endswith(DIAGNOSTIC_EXTENSIONS) or extracted:
+                freed += self._remove(path)
+
+        return freed
+
+    def select_kept(self, costs, latest_iteration):
+        ranked = sorted(costs, key=costs.get)
+        kept = set(ranked[:self.keep_top_k])
+
+        if self.keep_latest_generation:
+            kept.update(key for key in costs if key[0] == latest_iteration)
+
+        return kept
+
+    def apply(self, costs, latest_iteration, run_names):
+        # costs: {(iteration, particle): cost}; run_names: {(iteration, particle): run name or list of run names}
+        if not self.enabled:
+            return
+
+        kept = self.select_kept(costs, latest_iteration)
+        freed = 0
+
+        # Batch members share one job, whose artifacts follow the most demanding member.
+        runs = {}
+        for key, names in run_names.items():
+            succeeded = np.isfinite(costs.get(key, np.inf)) and costs[key] < FAILURE_COST
+            for run_name in ([names] if isinstance(names, str) else names):
+                kept_run, latest_run, extracted_run = runs.get(run_name, (False, False, False))
+                runs[run_name] = (kept_run or key in kept, latest_run or key[0] == latest_iteration,
+                                  extracted_run or succeeded)
+
+        for run_name, (kept_run, latest_run, extracted_run) in runs.items():
+            freed += self._apply_to_run(run_name, kept_run, latest_run, extracted_run or self._is_extracted(run_name))
+
+        if self.report_disk_usage:
+            print(f"[Retention] Kept {len(kept)} run(s), freed {freed / 1e6:.1f} MB, "
+                  f"disk usage of {self.files_dir_path}: {self.disk_usage() / 1e6:.1f} MB")
@@ -0,0 +1,174 @@
+import json
+import os
+
+import numpy as np
+
+
+class MorrisScreening:
+    def __init__(self, evaluator, sensitivity_config, bounds_min, bounds_max, parameter_names):
+        self.evaluator = evaluator
+        self.n_trajectories = sensitivity_config.get('trajectories', 10)
+        self.levels = sensitivity_config.get('levels', 4)
+        self.seed = sensitivity_config.get('seed', 0)
+        self.threshold = sensitivity_config.get('threshold', 0.1)
+        self.fixed_values = sensitivity_config.get('fixed_values', 'best')
+
+        self.bounds_min = np.asarray(bounds_min, dtype=float)
+        self.bounds_max = np.asarray(bounds_max, dtype=float)
+        self.parameter_names = list(parameter_names)
+        self.delta = self.levels / (2.0 * (self.levels - 1))
+
+        self.results_path = os.path.join(evaluator.results_dir, 'sensitivity_morris.json')
+
+    def _trajectories(self):
+        rng = np.random.default_rng(self.seed)
+        dimensions = len(self.parameter_names)
+        grid = np.arange(self.levels) / (self.levels - 1)
+        base_levels = grid[grid <= 1.0 - self.delta + 1e-12]
+
+        points = np.zeros((self.n_trajectories, dimensions + 1, dimensions))
+        orders = np.zeros((self.n_trajectories, dimensions), dtype=int)
+        for t in range(self.n_trajectories):
+            point = rng.choice(base_levels, size=dimensions)
+            orders[t] = rng.permutation(dimensions)
+            points[t, 0] = point
+            for step, dimension in enumerate(orders[t], start=1):
+                point = point.copy()
+                point[dimension] += self.delta
+                points[t, step] = point
+
+        return points, orders
+
+    def _evaluate(self, unit_points):
+        positions = self.bounds_min + unit_points.reshape(-1, unit_points.shape[-1]) * (self.bounds_max - self.bounds_min)
+        n_steps = unit_points.shape[1]
+        run_names = [f"morris_t{t:02d}_s{s:02d}" for t in range(unit_points.shape[0]) for s in range(n_steps)]
+
+        results = self.evaluator.evaluate_batch(positions, None, run_names)
+        costs = np.array([cost for cost, _ in results]).reshape(unit_points.shape[:2])
+        # Filled element-wise: joint evaluators return one list of data files per point.
+        data_files = np.empty(len(results), dtype=object)
+        for i, (_, data_file) in enumerate(results):
+            data_files[i] = data_file
+        data_files = data_files.reshape(unit_points.shape[:2])
+        return costs, data_files
+
+    def _profiles(self, data_files):
+        reference = next((f for f in data_files.ravel() if f is not None), None)
+        if reference is None:
+            raise RuntimeError("Morris screening has no successful evaluation to take the profile grids from.")
+        grids = {name: profile[:, 0] for name, profile in self.evaluator.load_profiles(reference).items()}
+
+        profiles = np.empty(data_files.shape, dtype=object)
+        for index, data_file in np.ndenumerate(data_files):
+            if data_file is None:
+                profiles[index] = None
+                continue
+            loaded = self.evaluator.load_profiles(data_file)
+            profiles[index] = {
+                name: np.interp(grid, loaded[name][:, 0], loaded[name][:, 1]) for name, grid in grids.items()
+            }
+
+        return profiles
+
+    def run(self):
+        unit_points, orders = self._trajectories()
+        print(f"=== Morris screening: {self.n_trajectories} trajectories, "
+              f"{unit_points.shape[0] * unit_points.shape[1]} evaluations ===")
+
+        costs, data_files = self._evaluate(unit_points)
+        profiles = self._profiles(data_files)
+
+        effects = {name: {'cost': [], 'surface': [], 'depth': []} for name in self.parameter_names}
+        for t in range(self.n_trajectories):
+            for step, dimension in enumerate(orders[t], start=1):
+                before, after = profiles[t, step - 1], profiles[t, step]
+                if before is None or after is None:
+                    continue
+
+                name = self.parameter_names[dimension]
+                effects[name]['cost'].append((costs[t, step] - costs[t, step - 1]) / self.delta)
+                for path_name in ('surface', 'depth'):
+                    # Joint evaluators label profiles "<experiment>/<path>"; their effects are averaged.
+                    keys = [key for key in after if key.split('/')[-1] == path_name]
+                    rms_changes = [np.sqrt(np.mean((after[key] - before[key]) ** 2)) for key in keys]
+                    effects[name][path_name].append(np.mean(rms_changes) / self.delta)
+
+        ranking = self._rank(effects)
+        with open(self.results_path, 'w') as f:
+            json.dump(ranking, f, indent=4)
+
+        print(f"{'parameter':>10} {'mu* surface':>12} {'mu* depth':>12} {'mu* cost':>12} {'sigma cost':>12} {'score':>7}")
+        for name, entry in sorted(ranking.items(), key=lambda item: -item[1]['score']):
+            print(f"{name:>10} {entry['mu_star_surface']:12.2f} {entry['mu_star_depth']:12.2f} "
+                  f"{entry['mu_star_cost']:12.2f} {entry['sigma_cost']:12.2f} {entry['score']:7.3f}")
+        print(f"Results saved to {self.results_path}")
+
+        return ranking
+
+    def _rank(self, effects):
+        ranking = {}
+        for name, values in effects.items():
+            ranking[name] = {
+                'mu_star_surface': float(np.mean(values['surface'])) if values['surface'] else 0.0,
+                'mu_star_depth': float(np.mean(values['depth'])) if values['depth'] else 0.0,
+                'mu_star_cost': float(np.mean(np.abs(values['cost']))) if values['cost'] else 0.0,
+                'sigma_cost': float(np.std(values['cost'])) if values['cost'] else 0.0,
+                'n_effects': len(values['cost']),
+            }
+
+        # Score each parameter by its largest profile influence relative to the most influential one.
+        for path_name in ('surface', 'depth'):
+            largest = max(entry[f'mu_star_{path_name}'] for entry in ranking.values()) or 1.0
+            for entry in ranking.values():
+                entry[f'relative_{path_name}'] = entry[f'mu_star_{path_name}'] / largest
+        for entry in ranking.values():
+            entry['score'] = max(entry['relative_surface'], entry['relative_depth'])
+
+        return ranking
+
+    def _reference_position(self):
+        if self.fixed_values == 'best':
+            records = [
+                record for record in self.evaluator.store.records
+                if record['status'] == 'ok' and len(record['position']) == len(self.parameter_names)
+                and record.get('context', '') == self.evaluator.cache_context
+            ]
+            if records:
+                return np.array(min(records, key=lambda record: record['cost'])['position'])
+
+        return (self.bounds_min + self.bounds_max) / 2.0
+
+    def write_reduced_config(self, calibration_config, ranking, output_path):
+        reference = self._reference_position()
+        keep = [i for i, name in enumerate(self.parameter_names) if ranking[name]['score'] >= self.threshold]
+        if not keep:
+            top = max(range(len(self.parameter_names)), key=lambda i: ranking[self.parameter_names[i]]['score'])
+            if ranking[self.parameter_names[top]]['score'] <= 0.0:
+                raise RuntimeError(
+                    "No parameter changed the profiles in the screening (every mu* is 0), so there is no ranking "
+                    f"to reduce by; the reduced configuration was not written to {output_path}."
+                )
+            # A calibration needs at least one free parameter, so the most influential one is kept.
+            print(f"[Sensitivity] No score reaches threshold={self.threshold}, keeping "
+                  f"{self.parameter_names[top]} only.")
+            keep = [top]
+
+        reduced = json.loads(json.dumps(calibration_config))
+        fixed = dict(reduced.get('fixed_parameters', {}))
+        fixed.update({
+            name: float(reference[i]) for i, name in enumerate(self.parameter_names) if i not in keep
+        })
+
+        reduced['parameter_names'] = [self.parameter_names[i] for i in keep]
+        reduced['fixed_parameters'] = fixed
+        reduced['dimensions'] = len(keep)
+        reduced['pso_optimization_bounds'] = {
+            'bounds_min': [float(self.bounds_min[i]) for i in keep],
+            'bounds_max': [float(self.bounds_max[i]) for i in keep],
+        }
+
+        with open(output_path, 'w') as f:
+            json.dump(reduced, f, indent=4)
+
+        print(f"Reduced configuration ({len(keep)} free, fixed: {sorted(fixed)}) saved to {output_path}")
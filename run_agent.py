@@ -0,0 +1,33 @@
+import argparse
+import os
+
+from calibration.distributed import EvaluationAgent
+
+def main():
+    parser = argparse.ArgumentParser(description="Evaluation agent for the distributed calibration broker.")
+    parser.add_argument("--host", default="127.0.0.1", help="Broker host (the machine running the calibration).")
+    parser.add_argument("--port", type=int, default=8766, help="Broker port (evaluation.distributed.port).")
+    parser.add_argument("--workspace", default=os.path.join("agent_workspace", "agent_{}".format(os.getpid())),
+                        help="Private working directory of this agent.")
+    parser.add_argument("--abaqus", default="abaqus", help="Abaqus command on this node.")
+    parser.add_argument("--slots", type=int, default=1, help="Number of concurrent simulations on this node.")
+    parser.add_argument("--heartbeat-interval", type=float, default=10.0)
+    parser.add_argument("--timeout", type=float, default=600, help="Seconds before a simulation is killed.")
+    parser.add_argument("--token", default=None, help="Shared token (evaluation.distributed.token).")
+    parser.add_argument("--keep-files", action="store_true", help="Keep job files in the workspace.")
+    parser.add_argument("--id", default=None, help="Agent name shown by the broker.")
+    args = parser.parse_args()
+
+    agent = EvaluationAgent(
+        args.host, args.port, args.workspace, args.abaqus,
+        slots=args.slots,
+        heartbeat_interval=args.heartbeat_interval,
+        timeout=args.timeout,
+        token=args.token,
+        keep_files=args.keep_files,
+        agent_id=args.id,
+    )
+    agent.run()
+
+if __name__ == "__main__":
+    main()
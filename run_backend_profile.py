@@ -0,0 +1,48 @@
+import argparse
+import json
+import os
+import sys
+
+from utilities.backend_profiler import BackendProfiler
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the Abaqus backend under plain Python with stub Abaqus modules.")
+    parser.add_argument("action", choices=["profile", "benchmark"], help="cProfile one run, or time the backend stages.")
+    parser.add_argument("--config", default=os.path.join("backend", "model_config", "model_config.json"))
+    parser.add_argument("--workspace", default=None, help="Backend working directory (defaults to a temporary one).")
+    parser.add_argument("--batch", type=int, default=1, help="Number of workpieces in the model (batchMembers).")
+    parser.add_argument("--engine", default="session", choices=["session", "odbAccess"], help="Extractor to profile.")
+    parser.add_argument("--stats", default=None, help="Save the cProfile stats to this file.")
+    parser.add_argument("--top", type=int, default=30, help="Number of functions listed by the profile.")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per extraction engine in the benchmark.")
+    parser.add_argument("--output", default=os.path.join("calibration", "results", "backend_benchmark.json"))
+    parser.add_argument("--baseline", default=None, help="Earlier benchmark output to compare against.")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed slowdown before a stage is flagged.")
+    args = parser.parse_args()
+
+    profiler = BackendProfiler(args.config, args.workspace, args.batch)
+    try:
+        if args.action == "profile":
+            profiler.profile(args.engine, args.stats, args.top)
+            return
+
+        results = profiler.benchmark(repeat=args.repeat)
+    finally:
+        profiler.close()
+
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=4)
+    print(f"Results saved to {args.output}")
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline, "r") as f:
+            baseline = json.load(f)
+    regressions = BackendProfiler.compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"Slower than the baseline: {', '.join(regressions)}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,17 @@
+import argparse
+
+from calibration.benchmark import BENCHMARK_MODES
+from calibration.calibrator import PSOCalibrator
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare reduced-cost simulations against full-length reference runs.")
+    parser.add_argument("mode", choices=sorted(BENCHMARK_MODES), help="Model variant to compare with the reference.")
+    parser.add_argument("--config", default=None, help="Calibration config (defaults to calibration/config/calibration_config.json).")
+    args = parser.parse_args()
+
+    print("=== Initializing Abaqus Benchmark ===")
+    calibrator = PSOCalibrator(args.config)
+    calibrator.run_benchmark(args.mode)
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,15 @@
+import argparse
+
 from calibration.calibrator import PSOCalibrator
 
 def main():
+    parser = argparse.ArgumentParser(description="Run the Abaqus PSO calibration.")
+    parser.add_argument("--config", default=None, help="Calibration config (defaults to calibration/config/calibration_config.json).")
+    args = parser.parse_args()
+
     print("=== Initializing Abaqus PSO Calibration ===")
-    calibrator = PSOCalibrator()
+    calibrator = PSOCalibrator(args.config)
     calibrator.run()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,15 @@
+import argparse
+
+from calibration.calibrator import PSOCalibrator
+
+def main():
+    parser = argparse.ArgumentParser(description="Space-filling design of experiments over the calibration bounds.")
+    parser.add_argument("--config", default=None, help="Calibration config (defaults to calibration/config/calibration_config.json).")
+    args = parser.parse_args()
+
+    print("=== Initializing Abaqus Design of Experiments ===")
+    calibrator = PSOCalibrator(args.config)
+    calibrator.run_doe()
+
+if __name__ == "__main__":
+    main()
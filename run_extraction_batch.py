@@ -0,0 +1,36 @@
+import argparse
+import os
+import subprocess
+
+ABAQUS_CMD_PATH = r'C:\SIMULIA\Abaqus\Commands\abaqus.bat'
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-extract residual stress profiles from existing ODBs.")
+    parser.add_argument("odbs", nargs="*", default=[os.path.join("backend", "files", "job", "*.odb")])
+    parser.add_argument("--output", default=os.path.join("backend", "data", "profiles.json"))
+    parser.add_argument("--no-split", action="store_true")
+    args = parser.parse_args()
+
+    abaqus_command = [ABAQUS_CMD_PATH, "python", os.path.join("backend", "extract_profiles.py")]
+    abaqus_command += args.odbs + ["--output", args.output]
+    if args.no_split:
+        abaqus_command.append("--no-split")
+
+    try:
+        result = subprocess.run(abaqus_command, check=True, capture_output=True, text=True)
+        print("\n=== Abaqus Outputs ===\n")
+        print('STDOUT:', result.stdout, "\n")
+        print('STDERR:', result.stderr)
+        print("==========================")
+
+    except subprocess.CalledProcessError as e:
+        print("=== Abaqus 'except' error ===\n")
+        print('Retorno:', e.returncode, "\n")
+        print('STDOUT:', e.stdout, "\n")
+        print('STDERR:', e.stderr)
+        print("==========================\n")
+
+
+if __name__ == "__main__":
+    main()
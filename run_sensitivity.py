@@ -0,0 +1,17 @@
+import argparse
+import os
+
+from calibration.calibrator import PSOCalibrator
+
+def main():
+    parser = argparse.ArgumentParser(description="Morris sensitivity screening of the calibrated parameters.")
+    parser.add_argument("--config", default=None, help="Calibration config to screen.")
+    parser.add_argument("--output", default=os.path.join("calibration", "config", "calibration_config_reduced.json"))
+    args = parser.parse_args()
+
+    print("=== Initializing Abaqus Sensitivity Screening ===")
+    calibrator = PSOCalibrator(args.config)
+    calibrator.run_sensitivity(args.output)
+
+if __name__ == "__main__":
+    main()
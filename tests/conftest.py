@@ -0,0 +1,26 @@
+import json
+import os
+import shutil
+import sys
+
+import pytest
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_DIR not in sys.path:
+    sys.path.insert(0, REPO_DIR)
+
+TEMPLATE_CONFIG = os.path.join(REPO_DIR, 'backend', 'model_config', 'model_config.json')
+
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    # The evaluator writes per-run configs to <cwd>/backend/model_config.
+    os.makedirs(tmp_path / 'backend' / 'model_config')
+    shutil.copy(TEMPLATE_CONFIG, tmp_path / 'model_config.json')
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def read_json(path):
+    with open(path, 'r') as f:
+        return json.load(f)
@@ -0,0 +1,26 @@
+import numpy as np
+
+from calibration.archive import CalibrationArchive
+from calibration.evaluator import FAILURE_COST
+
+NAMES = ['a', 'b']
+
+
+def _record(position, cost, status):
+    return {'run_name': 'i0_p0', 'position': position, 'cost': cost, 'status': status, 'context': '', 'data_file': None}
+
+
+def test_failed_evaluations_are_never_seeds(tmp_path):
+    archive = CalibrationArchive(
+        {'enabled': True, 'directory': str(tmp_path), 'store_profiles': False}, NAMES, [0.0, 0.0], [1.0, 1.0]
+    )
+    records = [
+        _record([0.2, 0.2], 0.5, 'ok'),
+        _record([0.9, 0.9], FAILURE_COST, 'failed'),
+        _record([0.8, 0.1], np.inf, 'failed'),
+        _record([0.4, 0.6], 0.3, 'ok'),
+    ]
+    archive.save({}, {}, np.array([0.4, 0.6]), 0.3, [0.5, 0.3], records, 'test')
+
+    seeds = archive.seed_positions({}, 10)
+    np.testing.assert_allclose(seeds, [[0.4, 0.6], [0.2, 0.2]])
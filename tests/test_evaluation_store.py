@@ -0,0 +1,60 @@
+import json
+
+from calibration.evaluator import EvaluationStore
+
+
+def _write_profiles(data_file, value):
+    data_file.write_text(json.dumps({'profiles': {'surface': [[0.0, value], [1.0, value]]}}))
+
+
+def _record(position, data_file, status='ok'):
+    return {
+        'run_name': 'i0_p0',
+        'position': position,
+        'cost': 0.0,
+        'status': status,
+        'context': '',
+        'data_file': str(data_file),
+    }
+
+
+def _run(store_path, data_file, position, value):
+    # One evaluation as the evaluator performs it: invalidate, overwrite the data file, record.
+    store = EvaluationStore(str(store_path))
+    store.invalidate(str(data_file))
+    _write_profiles(data_file, value)
+    store.add(_record(position, data_file))
+
+
+def test_reused_data_file_is_only_served_for_the_newest_position(tmp_path):
+    store_path = tmp_path / 'results' / 'evaluations.jsonl'
+    data_file = tmp_path / 'data_i0_p0.json'
+    _run(store_path, data_file, [1.0], 1.0)
+    _run(store_path, data_file, [2.0], 2.0)
+
+    store = EvaluationStore(str(store_path))
+    assert store.lookup([1.0]) is None
+    assert store.lookup([2.0])['position'] == [2.0]
+
+
+def test_invalidation_survives_a_restart(tmp_path):
+    store_path = tmp_path / 'results' / 'evaluations.jsonl'
+    data_file = tmp_path / 'data_i0_p0.json'
+    _run(store_path, data_file, [2.0], 2.0)
+
+    # A run interrupted between the invalidation and its own record leaves only the tombstone behind.
+    EvaluationStore(str(store_path)).invalidate(str(data_file))
+    _write_profiles(data_file, 3.0)
+
+    store = EvaluationStore(str(store_path))
+    assert store.lookup([2.0]) is None
+    assert all(record['status'] != 'invalidated' for record in store.records)
+
+
+def test_failed_rerun_drops_the_older_record(tmp_path):
+    store_path = tmp_path / 'results' / 'evaluations.jsonl'
+    data_file = tmp_path / 'data_i0_p0.json'
+    _run(store_path, data_file, [2.0], 2.0)
+    EvaluationStore(str(store_path)).add(_record([5.0], data_file, status='failed'))
+
+    assert EvaluationStore(str(store_path)).lookup([2.0]) is None
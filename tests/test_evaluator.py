@@ -0,0 +1,100 @@
+import json
+import os
+
+import pytest
+
+from calibration.evaluator import PARAMETER_NAMES, SimulationEvaluator
+from conftest import read_json
+
+POSITIONS = [
+    [250.0, 500.0, 0.3, 0.01, 2000.0, 2500.0, 1.0, 3e-08],
+    [300.0, 600.0, 0.4, 0.02, 2500.0, 3500.0, 1.2, 5e-08],
+]
+
+
+def _expected(position):
+    values = dict(zip(PARAMETER_NAMES, position))
+    johnson_cook = {name: values[name] for name in ('a', 'b', 'n', 'c')}
+    pulse = {name: values[name] for name in ('p0', 'pMax', 'rMax', 'timeMax')}
+    return johnson_cook, pulse
+
+
+def _assert_applied(section, position):
+    johnson_cook, pulse = _expected(position)
+    for name, value in johnson_cook.items():
+        assert section['material']['johnsonCook'][name] == pytest.approx(value)
+    for name, value in pulse.items():
+        assert section['pulse'][name] == pytest.approx(value)
+
+
+@pytest.fixture
+def evaluator(workspace):
+    return SimulationEvaluator(
+        'abaqus', str(workspace / 'model_config.json'), None, {'results_dir': str(workspace / 'results')}
+    )
+
+
+def test_write_model_config_single_particle(evaluator):
+    config_path = evaluator._write_model_config([POSITIONS[0]], 'i0_p0', 0, [0], ['i0_p0'])
+
+    assert os.path.exists(config_path)
+    model_builder = read_json(config_path)[evaluator.model_name]['modelBuilder']
+    _assert_applied(model_builder, POSITIONS[0])
+    assert model_builder['runName'] == 'i0_p0'
+    assert (model_builder['iterationNumber'], model_builder['particleNumber']) == (0, 0)
+    assert 'batchMembers' not in model_builder
+
+
+def test_write_model_config_batch_members(evaluator):
+    template = read_json(evaluator.template_config_path)[evaluator.model_name]['modelBuilder']
+    config_path = evaluator._write_model_config(
+        POSITIONS, 'batch_i1_p0_n2', 1, [0, 1], ['i1_p0', 'i1_p1']
+    )
+
+    model_builder = read_json(config_path)[evaluator.model_name]['modelBuilder']
+    assert [member['runName'] for member in model_builder['batchMembers']] == ['i1_p0', 'i1_p1']
+    assert [member['particleNumber'] for member in model_builder['batchMembers']] == [0, 1]
+    for member, position in zip(model_builder['batchMembers'], POSITIONS):
+        _assert_applied(member, position)
+        # Members carry complete sections, not only the calibrated entries.
+        assert member['material']['elastic'] == template['material']['elastic']
+        assert member['pulse']['r'] == template['pulse']['r']
+
+    # The shared sections keep the template values.
+    assert model_builder['material'] == template['material']
+    assert model_builder['pulse'] == template['pulse']
+
+
+def test_write_model_config_fixed_parameters(workspace):
+    evaluator = SimulationEvaluator(
+        'abaqus', str(workspace / 'model_config.json'), None, {'results_dir': str(workspace / 'results')},
+        parameter_names=PARAMETER_NAMES[:4], fixed_parameters={'p0': 2100.0, 'rMax': 0.9}
+    )
+    config_path = evaluator._write_model_config([POSITIONS[0][:4]], 'i0_p0', 0, [0], ['i0_p0'])
+
+    model_builder = read_json(config_path)[evaluator.model_name]['modelBuilder']
+    assert model_builder['material']['johnsonCook']['b'] == pytest.approx(POSITIONS[0][1])
+    assert model_builder['pulse']['p0'] == pytest.approx(2100.0)
+    assert model_builder['pulse']['rMax'] == pytest.approx(0.9)
+
+
+def _context(workspace, edit=None, **kwargs):
+    config = read_json(workspace / 'model_config.json')
+    model_builder = next(iter(config.values()))['modelBuilder']
+    if edit is not None:
+        edit(model_builder)
+    path = workspace / 'edited_config.json'
+    path.write_text(json.dumps(config))
+    return SimulationEvaluator('abaqus', str(path), None, {'results_dir': str(workspace / 'results')}, **kwargs).cache_context
+
+
+def test_cache_context_follows_the_template(workspace):
+    reference = _context(workspace)
+
+    assert _context(workspace, lambda builder: builder['step'].update(durationRestPhase=1.0)) != reference
+    assert _context(workspace, lambda builder: builder['mesh'].update(maxElementSize=0.5)) != reference
+    assert _context(workspace, model_overrides={'pulse': {'r': 2.0}}) != reference
+
+    # Calibrated values and run bookkeeping are overwritten by every run, so they do not change the key.
+    assert _context(workspace, lambda builder: builder['material']['johnsonCook'].update(a=1.0)) == reference
+    assert _context(workspace, lambda builder: builder.update(particleNumber=7, iterationNumber=3)) == reference
@@ -0,0 +1,33 @@
+from calibration.failures import classify_failure, is_transient
+
+COMMAND_ERROR = """
+====================================================
+
+[COMMAND ERROR] An exception occurred during execution:
+Traceback (most recent call last):
+  File "command.py", line 136, in <module>
+KeyError: 'SetJohnsonCook'
+"""
+
+
+def _log(tmp_path, text):
+    path = tmp_path / 'abaqus_log_i0_p0.txt'
+    path.write_text(text)
+    return [str(path)]
+
+
+def test_logged_backend_error_is_not_transient(tmp_path):
+    failure_class = classify_failure(_log(tmp_path, COMMAND_ERROR), FileNotFoundError('data_i0_p0.json'))
+    assert failure_class == 'backend'
+    assert not is_transient(failure_class)
+
+
+def test_missing_data_without_error_evidence_is_transient(tmp_path):
+    failure_class = classify_failure(_log(tmp_path, 'Job submitted successfully.\n'), FileNotFoundError('data_i0_p0.json'))
+    assert failure_class == 'missing_data'
+    assert is_transient(failure_class)
+
+
+def test_license_wording_wins_over_the_traceback(tmp_path):
+    sources = _log(tmp_path, COMMAND_ERROR + 'Abaqus Error: License server not responding\n')
+    assert classify_failure(sources, FileNotFoundError('data_i0_p0.json')) == 'license'
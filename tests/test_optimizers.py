@@ -0,0 +1,25 @@
+import numpy as np
+
+from calibration.optimizers import PSOOptimizer
+
+BOUNDS = (np.zeros(3), np.ones(3))
+OPTIONS = {'c1': 1.5, 'c2': 1.5, 'w': 0.75}
+
+
+def test_pso_survives_a_generation_without_finite_costs():
+    optimizer = PSOOptimizer(BOUNDS, 4, OPTIONS)
+    first = optimizer.ask(4)
+    optimizer.tell(first, np.full(4, np.inf))
+
+    # No global best yet: the generation is proposed again instead of failing on an unset best position.
+    second = optimizer.ask(4)
+    np.testing.assert_array_equal(second, first)
+    assert optimizer.best_pos is None
+
+    costs = np.array([np.inf, 0.5, 0.2, np.inf])
+    optimizer.tell(second, costs)
+    third = optimizer.ask(4)
+    assert third.shape == (4, 3)
+    assert not np.allclose(third, second)
+    np.testing.assert_array_equal(optimizer.best_pos, second[2])
+    assert optimizer.best_cost == 0.2
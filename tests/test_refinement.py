@@ -0,0 +1,37 @@
+import numpy as np
+
+from calibration.refinement import FiniteDifferenceRefiner
+
+TARGET = np.array([0.3, 0.7])
+
+
+class FakeEvaluator:
+    # Profiles are the position itself, so the residual is linear and the refinement converges quickly.
+    def evaluate_batch(self, positions, iteration):
+        return [(float(np.sum((p - TARGET) ** 2)), tuple(p)) for p in np.atleast_2d(positions)]
+
+    def residual_grid(self, data_file):
+        return np.arange(len(data_file))
+
+    def interpolated_residual(self, data_file, grid):
+        return np.asarray(data_file) - TARGET
+
+
+def test_every_refinement_batch_goes_through_the_calibrator():
+    evaluator = FakeEvaluator()
+    batches = []
+
+    def evaluate_batch(positions, iteration):
+        batches.append((iteration, len(positions)))
+        return evaluator.evaluate_batch(positions, iteration)
+
+    refiner = FiniteDifferenceRefiner(
+        evaluator, {'enabled': True, 'max_evaluations': 5}, [0.0, 0.0], [1.0, 1.0], evaluate_batch
+    )
+    refined_pos, refined_cost = refiner.run(np.array([0.5, 0.5]), 10)
+
+    np.testing.assert_allclose(refined_pos, TARGET, atol=1e-6)
+    assert refined_cost < 1e-10
+    # Starting point, every residual/Jacobian batch and the final evaluation, numbered consecutively.
+    assert [iteration for iteration, _ in batches] == list(range(10, refiner.iteration))
+    assert len(batches) >= 3
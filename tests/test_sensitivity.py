@@ -0,0 +1,51 @@
+import json
+
+import pytest
+
+from calibration.sensitivity import MorrisScreening
+
+NAMES = ['a', 'b', 'c']
+
+
+class FakeEvaluator:
+    def __init__(self, results_dir):
+        self.results_dir = str(results_dir)
+        self.cache_context = ''
+        self.store = type('Store', (), {'records': []})()
+
+
+def _ranking(screening, surface):
+    effects = {name: {'cost': [0.0], 'surface': [value], 'depth': [0.0]} for name, value in zip(NAMES, surface)}
+    return screening._rank(effects)
+
+
+@pytest.fixture
+def screening(tmp_path):
+    return MorrisScreening(FakeEvaluator(tmp_path), {'threshold': 0.5}, [0.0] * 3, [1.0] * 3, NAMES)
+
+
+def test_reduced_config_keeps_parameters_above_the_threshold(screening, tmp_path):
+    output = tmp_path / 'reduced.json'
+    screening.write_reduced_config({'dimensions': 3}, _ranking(screening, [4.0, 1.0, 3.0]), str(output))
+
+    reduced = json.loads(output.read_text())
+    assert reduced['parameter_names'] == ['a', 'c']
+    assert reduced['dimensions'] == 2
+    assert sorted(reduced['fixed_parameters']) == ['b']
+
+
+def test_reduced_config_keeps_the_top_parameter_below_the_threshold(tmp_path):
+    screening = MorrisScreening(FakeEvaluator(tmp_path), {'threshold': 2.0}, [0.0] * 3, [1.0] * 3, NAMES)
+    output = tmp_path / 'reduced.json'
+    screening.write_reduced_config({'dimensions': 3}, _ranking(screening, [1.0, 4.0, 3.0]), str(output))
+
+    reduced = json.loads(output.read_text())
+    assert reduced['parameter_names'] == ['b']
+    assert reduced['dimensions'] == 1
+
+
+def test_reduced_config_is_refused_without_any_effect(screening, tmp_path):
+    output = tmp_path / 'reduced.json'
+    with pytest.raises(RuntimeError, match='mu'):
+        screening.write_reduced_config({'dimensions': 3}, _ranking(screening, [0.0, 0.0, 0.0]), str(output))
+    assert not output.exists()
@@ -0,0 +1,163 @@
+from part import Part, PartInstance, PartSet
+from step import ExplicitDynamicsStep, FieldOutputRequest
+
+# Element types an explicit axisymmetric input file may contain; anything else is rejected on import.
+KNOWN_ELEMENT_TYPES = ('CAX4R', 'CAX3', 'ACAX4', 'ACAX3', 'CINAX4')
+
+
+def _format_number(value):
+    text = f"{value:.8g}"
+    return text if any(c in text for c in '.e') else text + '.'
+
+
+def _label_lines(labels, per_line=16):
+    return [', '.join(str(label) for label in labels[i:i + per_line]) for i in range(0, len(labels), per_line)]
+
+
+def write_input(model, job_name, path):
+    lines = [
+        '*Heading',
+        f'** Job name: {job_name} Model name: {model.name}',
+        '*Preprint, echo=NO, model=NO, history=NO, contact=NO',
+        '**',
+        '** PARTS',
+        '**',
+    ]
+
+    instances = list(model.rootAssembly.instances.values())
+    for part in dict((instance.part.name, instance.part) for instance in instances).values():
+        if not part.elements:
+            raise ValueError(f"writeInput: part {part.name} is not meshed")
+
+        lines.append(f'*Part, name={part.name}')
+        lines.append('*Node')
+        lines.extend(f'{label:7d}, {_format_number(x):>13}, {_format_number(y):>13}' for label, x, y in part.nodes)
+
+        element_types = []
+        for _, element_type, _ in part.elements:
+            if element_type not in element_types:
+                element_types.append(element_type)
+        for element_type in element_types:
+            lines.append(f'*Element, type={element_type}')
+            lines.extend(
+                f'{label}, ' + ', '.join(str(node) for node in connectivity)
+                for label, current_type, connectivity in part.elements if current_type == element_type
+            )
+
+        for set_name, labels in part.element_sets().items():
+            lines.append(f'*Elset, elset={set_name}')
+            lines.extend(_label_lines(labels))
+        for set_name, section_name in part.sectionAssignments:
+            lines.append(f'** Section: {section_name}')
+            lines.append(f'*Solid Section, elset={set_name}, material={model.sections[section_name].material}')
+            lines.append(',')
+        lines.append('*End Part')
+        lines.append('**')
+
+    lines += ['**', '** ASSEMBLY', '**', '*Assembly, name=Assembly', '**']
+    for instance in instances:
+        lines.append(f'*Instance, name={instance.name}, part={instance.part.name}')
+        if any(instance.translation):
+            lines.append(', '.join(_format_number(value) for value in instance.translation))
+        lines.append('*End Instance')
+        lines.append('**')
+    lines.append('*End Assembly')
+
+    lines += ['**', '** MATERIALS', '**']
+    for material in model.materials.values():
+        lines.append(f'*Material, name={material.name}')
+        if material.density is not None:
+            lines += ['*Density', ', '.join(_format_number(v) for v in material.density.table[0]) + ',']
+        if material.elastic is not None:
+            lines += ['*Elastic', ', '.join(_format_number(v) for v in material.elastic.table[0])]
+        if material.plastic is not None:
+            lines += ['*Plastic, hardening=JOHNSON COOK', ', '.join(_format_number(v) for v in material.plastic.table[0])]
+            if getattr(material.plastic, 'rateDependent', None) is not None:
+                lines += ['*Rate Dependent, type=JOHNSON COOK',
+                          ', '.join(_format_number(v) for v in material.plastic.rateDependent.table[0])]
+
+    field_request = model.fieldOutputRequests.get('F-Output-1')
+    for step in model.steps.values():
+        lines += [
+            '** ----------------------------------------------------------------',
+            '**',
+            f'** STEP: {step.name}',
+            '**',
+            f'*Step, name={step.name}, nlgeom=YES',
+            '*Dynamic, Explicit' + (f', scale factor={_format_number(step.scaleFactor)}' if step.scaleFactor != 1.0 else ''),
+            f', {_format_number(step.timePeriod)}',
+            '*Bulk Viscosity',
+            f'{_format_number(step.linearBulkViscosity)}, {_format_number(step.quadBulkViscosity)}',
+        ]
+        if field_request is not None:
+            lines += [
+                '** OUTPUT REQUESTS',
+                f'*Output, field, number interval={field_request.numIntervals}',
+                '*Element Output, directions=YES',
+                ', '.join(str(v) for v in field_request.variables),
+            ]
+        lines.append('*End Step')
+
+    with open(path, 'w') as f:
+        f.write('\n'.join(lines) + '\n')
+
+
+def _options(keyword_line):
+    options = {}
+    for token in keyword_line.split(',')[1:]:
+        key, _, value = token.partition('=')
+        options[key.strip().lower()] = value.strip()
+    return options
+
+
+def read_input(path, model):
+    with open(path, 'r') as f:
+        lines = [line.strip() for line in f if line.strip() and not line.startswith('**')]
+
+    part = None
+    instance = None
+    block = None
+    element_type = None
+    set_name = None
+    step = None
+    for line in lines:
+        if line.startswith('*'):
+            keyword = line.split(',')[0].lower()
+            options = _options(line)
+            block = keyword
+            if keyword == '*part':
+                part = Part(options['name'])
+                model.parts[part.name] = part
+            elif keyword == '*end part':
+                part = None
+            elif keyword == '*element':
+                element_type = options['type'].upper()
+                if element_type not in KNOWN_ELEMENT_TYPES:
+                    raise ValueError(f"{path}: unknown element type {element_type}")
+            elif keyword == '*elset' and part is not None:
+                set_name = options['elset']
+                part.sets[set_name] = PartSet(set_name, elementLabels=[])
+            elif keyword == '*instance':
+                instance = PartInstance(options['name'], model.parts[options['part']])
+                model.rootAssembly.instances[instance.name] = instance
+            elif keyword == '*step':
+                step = ExplicitDynamicsStep(options['name'], list(model.steps)[-1] if model.steps else 'Initial')
+                model.steps[step.name] = step
+            elif keyword == '*output' and 'field' in options and step is not None:
+                model.fieldOutputRequests['F-Output-1'] = FieldOutputRequest(
+                    'F-Output-1', list(model.steps)[0], numIntervals=int(options['number interval']))
+            continue
+
+        values = [value.strip() for value in line.split(',')]
+        if block == '*node' and part is not None:
+            part.nodes.append((int(values[0]), float(values[1]), float(values[2])))
+        elif block == '*element' and part is not None:
+            part.elements.append((int(values[0]), element_type, tuple(int(v) for v in values[1:] if v)))
+        elif block == '*elset' and part is not None:
+            part.sets[set_name].elementLabels.extend(int(v) for v in values if v)
+        elif block == '*instance':
+            instance.translation = [float(v) for v in values[:3]]
+        elif block == '*dynamic' and step is not None:
+            step.timePeriod = float(values[1])
+
+    return model
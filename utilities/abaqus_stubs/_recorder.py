@@ -0,0 +1,83 @@
+from collections import Counter
+
+
+class CallRecorder:
+    def __init__(self):
+        self.calls = []
+
+    def record(self, name, args=(), kwargs=None):
+        self.calls.append((name, args, dict(kwargs or {})))
+
+    def counts(self):
+        return Counter(name for name, _, _ in self.calls)
+
+    def reset(self):
+        del self.calls[:]
+
+
+# Shared by every stub module, so a profiling run can report which Abaqus calls the backend made.
+recorder = CallRecorder()
+
+
+class StubObject:
+    def _record(self, method, *args, **kwargs):
+        recorder.record(f"{type(self).__name__}.{method}", args, kwargs)
+
+    def setValues(self, **kwargs):
+        self._record('setValues', **kwargs)
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+
+
+def check_options(owner, options, allowed):
+    # Abaqus rejects unknown keyword arguments, which is what catches typos in the backend.
+    unknown = sorted(set(options) - set(allowed))
+    if unknown:
+        raise TypeError(f"{owner}: unexpected keyword argument(s) {', '.join(unknown)}")
+
+
+class EntityArray(list):
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return EntityArray(list.__getitem__(self, key))
+        return list.__getitem__(self, key)
+
+    def __add__(self, other):
+        return EntityArray(list(self) + list(other))
+
+    def findAt(self, *coordinates):
+        # findAt(((x, y, z), ...)) returns an array; findAt((x, y, z)) returns a single entity or None.
+        if coordinates and isinstance(coordinates[0][0], (tuple, list)):
+            found = [self._find(point) for point in coordinates[0]]
+            return EntityArray(entity for entity in found if entity is not None)
+        return self._find(coordinates[0])
+
+    def _find(self, point):
+        for entity in self:
+            if entity.contains(point[0], point[1]):
+                return entity
+        return None
+
+
+class Entity:
+    def __init__(self, index, region=None):
+        self.index = index
+        self.region = region
+
+    def contains(self, x, y):
+        return self.region is not None and self.region(x, y)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.index})"
+
+
+class Face(Entity):
+    pass
+
+
+class Edge(Entity):
+    pass
+
+
+class Vertex(Entity):
+    pass
@@ -0,0 +1,89 @@
+import json
+import math
+import os
+
+import numpy as np
+
+# Shape of a typical LSP residual stress field: compressive under the spot, turning tensile further down.
+PEAK_STRESS = 300.0
+SPOT_RADIUS = 1.5
+LAYER_DEPTH = 0.5
+
+
+def residual_stress(r, depth, progress):
+    # Works on scalars and NumPy arrays alike.
+    lateral = 1.0 / (1.0 + (r / SPOT_RADIUS) ** 4)
+    return -PEAK_STRESS * progress * lateral * (1.0 - depth / LAYER_DEPTH) * np.exp(-depth / LAYER_DEPTH)
+
+
+def progress(total_time, shot_duration):
+    return 1.0 - math.exp(-total_time / max(shot_duration, 1e-30))
+
+
+def _step_frames(model):
+    request = model.fieldOutputRequests.get('F-Output-1')
+    n_intervals = request.numIntervals if request is not None else 20
+    frames = []
+    start = 0.0
+    for step in model.steps.values():
+        frames.append({'name': step.name, 'start': start, 'timePeriod': step.timePeriod, 'numIntervals': n_intervals})
+        start += step.timePeriod
+    return frames
+
+
+def write_odb(model, path):
+    instances = []
+    for instance in model.rootAssembly.instances.values():
+        dx, dy = instance.translation[0], instance.translation[1]
+        part = instance.part
+        instances.append({
+            'name': instance.name.upper(),
+            'nodes': [[label, x + dx, y + dy] for label, x, y in part.nodes],
+            'elements': [[label, element_type, list(connectivity)] for label, element_type, connectivity in part.elements],
+            'elementSets': dict((name.upper(), labels) for name, labels in part.element_sets().items()),
+        })
+
+    with open(path, 'w') as f:
+        f.write(json.dumps({'name': os.path.splitext(os.path.basename(path))[0], 'instances': instances,
+                            'steps': _step_frames(model)}))
+
+
+def write_status_files(model, job_name, work_dir, n_elements):
+    steps = _step_frames(model)
+    shot_duration = steps[0]['timePeriod'] if steps else 1.0
+    total_duration = sum(step['timePeriod'] for step in steps)
+    stable_increment = shot_duration / 2000.0
+
+    sta_lines = [
+        ' Abaqus/Explicit 2024                  DATE  1-Jan-2024  TIME 00:00:00',
+        ' SUMMARY OF JOB INFORMATION:',
+        ' MONITOR NODE:  1 DOF:  1',
+        ' STEP  TOTAL     CPU      STABLE      CRITICAL    KINETIC      TOTAL',
+        '  INCREMENT       TIME     TIME    INCREMENT   ELEMENT     ENERGY      ENERGY',
+    ]
+    increment = 0
+    for number, step in enumerate(steps, 1):
+        sta_lines += ['', f' STEP {number}  ORIGIN {step["start"]:.4E}', '']
+        for k in range(step['numIntervals'] + 1):
+            step_time = step['timePeriod'] * k / step['numIntervals']
+            total_time = step['start'] + step_time
+            # Kinetic energy rises during the shot and decays through the RestPhase.
+            kinetic = 1.0e3 * (min(total_time, shot_duration) / shot_duration) * math.exp(
+                -max(total_time - shot_duration, 0.0) / (0.1 * total_duration))
+            seconds = int(total_time / total_duration * 600)
+            sta_lines.append(
+                f'{increment:>12d}  {step_time:.3E}  {total_time:.3E}  00:{seconds // 60:02d}:{seconds % 60:02d}  '
+                f'{stable_increment:.3E}  {1 + increment % n_elements:>8d}  {kinetic:.3E}  {1.2 * kinetic:.3E}'
+            )
+            increment += int(step['timePeriod'] / step['numIntervals'] / stable_increment) or 1
+    sta_lines += ['', '  THE ANALYSIS HAS COMPLETED SUCCESSFULLY']
+
+    with open(os.path.join(work_dir, job_name + '.sta'), 'w') as f:
+        f.write('\n'.join(sta_lines) + '\n')
+    with open(os.path.join(work_dir, job_name + '.msg'), 'w') as f:
+        f.write(f' Abaqus/Explicit stub run of {job_name}: {n_elements} elements, {increment} increments.\n')
+    with open(os.path.join(work_dir, job_name + '.dat'), 'w') as f:
+        f.write(' ANALYSIS COMPLETE\n')
+    with open(os.path.join(work_dir, job_name + '.log'), 'w') as f:
+        f.write(f'Abaqus JOB {job_name}\nBegin Abaqus/Explicit Analysis\nEnd Abaqus/Explicit Analysis\n'
+                f'Abaqus JOB {job_name} COMPLETED\n')
@@ -0,0 +1,169 @@
+import os
+
+from _inp import read_input
+from _recorder import StubObject, check_options, recorder
+from assembly import Assembly
+from job import Job
+from load import BoundaryCondition, Load, MappedField, TabularAmplitude
+from material import Material
+from part import Part
+from section import HomogeneousSolidSection
+from sketch import ConstrainedSketch
+from step import ExplicitDynamicsStep, FieldOutputRequest, HistoryOutputRequest
+from visualization import Path, XYData, path_data
+
+__all__ = ['Mdb', 'mdb', 'session']
+
+
+class Model(StubObject):
+    def __init__(self, name):
+        self.name = name
+        self.parts = {}
+        self.materials = {}
+        self.sections = {}
+        self.sketches = {}
+        self.steps = {}
+        self.fieldOutputRequests = {}
+        self.historyOutputRequests = {}
+        self.analyticalFields = {}
+        self.amplitudes = {}
+        self.loads = {}
+        self.boundaryConditions = {}
+        self.rootAssembly = Assembly(self)
+
+    def Material(self, name):
+        self._record('Material', name=name)
+        self.materials[name] = Material(name)
+        return self.materials[name]
+
+    def ConstrainedSketch(self, name, sheetSize):
+        self._record('ConstrainedSketch', name=name, sheetSize=sheetSize)
+        self.sketches[name] = ConstrainedSketch(name, sheetSize)
+        return self.sketches[name]
+
+    def Part(self, name, dimensionality, type):
+        self._record('Part', name=name, dimensionality=dimensionality, type=type)
+        self.parts[name] = Part(name, dimensionality, type)
+        return self.parts[name]
+
+    def HomogeneousSolidSection(self, name, material, thickness=None):
+        self._record('HomogeneousSolidSection', name=name, material=material, thickness=thickness)
+        if material not in self.materials:
+            raise KeyError(f"HomogeneousSolidSection: material {material} does not exist")
+        self.sections[name] = HomogeneousSolidSection(name, material, thickness)
+        return self.sections[name]
+
+    def ExplicitDynamicsStep(self, name, previous, **options):
+        self._record('ExplicitDynamicsStep', name=name, previous=previous, **options)
+        if previous != 'Initial' and previous not in self.steps:
+            raise KeyError(f"ExplicitDynamicsStep: previous step {previous} does not exist")
+        self.steps[name] = ExplicitDynamicsStep(name, previous, **options)
+
+        # Like CAE, the first analysis step brings the default output requests.
+        if 'F-Output-1' not in self.fieldOutputRequests:
+            self.fieldOutputRequests['F-Output-1'] = FieldOutputRequest('F-Output-1', name)
+            self.historyOutputRequests['H-Output-1'] = HistoryOutputRequest('H-Output-1', name)
+        return self.steps[name]
+
+    def HistoryOutputRequest(self, name, createStepName, variables, numIntervals=200):
+        self._record('HistoryOutputRequest', name=name, createStepName=createStepName, variables=variables,
+                     numIntervals=numIntervals)
+        self.historyOutputRequests[name] = HistoryOutputRequest(name, createStepName, variables, numIntervals)
+        return self.historyOutputRequests[name]
+
+    def MappedField(self, name, xyzPointData, **options):
+        self._record('MappedField', name=name, xyzPointData=xyzPointData, **options)
+        self.analyticalFields[name] = MappedField(name, xyzPointData, **options)
+        return self.analyticalFields[name]
+
+    def TabularAmplitude(self, name, data, **options):
+        self._record('TabularAmplitude', name=name, data=data, **options)
+        self.amplitudes[name] = TabularAmplitude(name, data, **options)
+        return self.amplitudes[name]
+
+    def Pressure(self, name, createStepName, region, **options):
+        self._record('Pressure', name=name, createStepName=createStepName, region=region.name, **options)
+        if options.get('amplitude') not in (None, '') and options['amplitude'] not in self.amplitudes:
+            raise KeyError(f"Pressure: amplitude {options['amplitude']} does not exist")
+        if options.get('field') not in (None, '') and options['field'] not in self.analyticalFields:
+            raise KeyError(f"Pressure: field {options['field']} does not exist")
+        self.loads[name] = Load(name, createStepName, region, **options)
+        return self.loads[name]
+
+    def DisplacementBC(self, name, createStepName, region, **options):
+        self._record('DisplacementBC', name=name, createStepName=createStepName, region=region.name, **options)
+        self.boundaryConditions[name] = BoundaryCondition(name, createStepName, region, **options)
+        return self.boundaryConditions[name]
+
+
+class ModelDatabase(StubObject):
+    def __init__(self):
+        self.models = {}
+        self.jobs = {}
+        self.reset()
+
+    def reset(self):
+        self.models.clear()
+        self.jobs.clear()
+        self.models['Model-1'] = Model('Model-1')
+
+    def Model(self, name):
+        self._record('Model', name=name)
+        self.models[name] = Model(name)
+        return self.models[name]
+
+    def ModelFromInputFile(self, name, inputFileName):
+        self._record('ModelFromInputFile', name=name, inputFileName=inputFileName)
+        self.models[name] = read_input(inputFileName, Model(name))
+        return self.models[name]
+
+    def Job(self, name, model, **options):
+        self._record('Job', name=name, model=model, **options)
+        self.jobs[name] = Job(self, name, model, **options)
+        return self.jobs[name]
+
+    def saveAs(self, pathName):
+        self._record('saveAs', pathName=pathName)
+        with open(os.path.join(os.getcwd(), pathName), 'w') as f:
+            f.write(f"stub model database: {', '.join(self.models)}\n")
+
+
+class Viewport(StubObject):
+    def __init__(self, name):
+        self.name = name
+        self.displayedObject = None
+
+
+class Session(StubObject):
+    def __init__(self):
+        self.journalOptions = StubObject()
+        self.viewports = {'Viewport: 1': Viewport('Viewport: 1')}
+        self.paths = {}
+        self.xyDataObjects = {}
+
+    def Path(self, name, type, expression):
+        self._record('Path', name=name, type=type, expression=expression)
+        self.paths[name] = Path(name, type, expression)
+        return self.paths[name]
+
+    def XYDataFromPath(self, name, path, frame, step, variable, **options):
+        self._record('XYDataFromPath', name=name, path=path.name, frame=frame, step=step, variable=variable, **options)
+        check_options('XYDataFromPath', options, ('includeIntersections', 'shape', 'labelType', 'pathStyle',
+                                                  'numIntervals', 'projectOntoMesh', 'projectionTolerance'))
+        odb = self.viewports['Viewport: 1'].displayedObject
+        if odb is None:
+            raise ValueError("XYDataFromPath: no ODB is displayed in the current viewport")
+
+        self.xyDataObjects[name] = XYData(name, path_data(odb, path, frame, step))
+        return self.xyDataObjects[name]
+
+
+mdb = ModelDatabase()
+session = Session()
+
+
+def Mdb():
+    # Scripts keep the `mdb` imported from this module, so a new database resets it in place.
+    recorder.record('Mdb')
+    mdb.reset()
+    return mdb
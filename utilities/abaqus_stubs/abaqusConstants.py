@@ -0,0 +1,40 @@
+# Stand-in for Abaqus' abaqusConstants: every constant is a named singleton compared by identity.
+
+
+class SymbolicConstant:
+    def __init__(self, name):
+        self.name = name
+
+    def __repr__(self):
+        return self.name
+
+    def __str__(self):
+        return self.name
+
+
+_NAMES = (
+    # General
+    'ON', 'OFF', 'TRUE', 'FALSE', 'DEFAULT', 'UNSET', 'SET', 'UNIFORM', 'FIELD', 'STEP', 'MODEL',
+    # Part, sketch and assembly
+    'AXISYMMETRIC', 'TWO_D_PLANAR', 'THREE_D', 'DEFORMABLE_BODY', 'AXISYM', 'GEOMETRY', 'DELETE',
+    'SUPPRESS', 'CYLINDRICAL', 'CARTESIAN', 'SPHERICAL', 'INDEX', 'COORDINATE',
+    # Materials and sections
+    'JOHNSON_COOK', 'ISOTROPIC', 'MIDDLE_SURFACE', 'FROM_SECTION',
+    # Steps and solver controls
+    'SEMI_AUTOMATIC', 'AUTOMATIC', 'FIXED', 'AT_BEGINNING', 'THROUGHOUT_STEP', 'BELOW_MIN', 'UNIFORM_SCALE',
+    'SINGLE', 'FORCE_SINGLE', 'DOUBLE', 'DOUBLE_CONSTRAINT_ONLY', 'DOUBLE_PLUS_PACK', 'FULL', 'ELEMENT_BY_ELEMENT',
+    # Loads and fields
+    'SCALAR', 'XYZ', 'POINT', 'SOLVER_DEFAULT',
+    # Mesh
+    'QUAD', 'QUAD_DOMINATED', 'TRI', 'STRUCTURED', 'SWEEP', 'FREE', 'FINER', 'FINE', 'FORWARD', 'REVERSE',
+    'STANDARD', 'EXPLICIT', 'CAX4R', 'CAX3', 'ACAX4', 'ACAX3', 'CINAX4',
+    # Job
+    'PERCENTAGE', 'MEGA_BYTES', 'DOMAIN', 'LOOP', 'THREADS', 'MPI', 'ODB', 'ANALYSIS',
+    'SUBMITTED', 'RUNNING', 'COMPLETED', 'ABORTED', 'TERMINATED',
+    # Results and visualization
+    'NODAL', 'ELEMENT_NODAL', 'INTEGRATION_POINT', 'CENTROID', 'COMPONENT', 'INVARIANT',
+    'POINT_LIST', 'UNDEFORMED', 'DEFORMED', 'TRUE_DISTANCE', 'PATH_POINTS', 'UNIFORM_SPACING',
+)
+
+for _name in _NAMES:
+    globals()[_name] = SymbolicConstant(_name)
@@ -0,0 +1,79 @@
+from _recorder import EntityArray, StubObject
+from abaqusConstants import DELETE
+from part import Feature, Part, PartInstance
+
+__all__ = ['Assembly']
+
+
+class Surface(StubObject):
+    def __init__(self, name, side1Edges):
+        self.name = name
+        self.side1Edges = side1Edges
+
+
+class AssemblySet(StubObject):
+    def __init__(self, name, edges=None, faces=None):
+        self.name = name
+        self.edges = edges or EntityArray()
+        self.faces = faces or EntityArray()
+
+
+class Assembly(StubObject):
+    def __init__(self, model):
+        self.model = model
+        self.instances = {}
+        self.surfaces = {}
+        self.sets = {}
+        self.features = {}
+
+    def DatumCsysByThreePoints(self, coordSysType, origin, point1, point2, name=None):
+        self._record('DatumCsysByThreePoints', coordSysType=coordSysType, origin=origin, point1=point1, point2=point2)
+        feature = Feature(name or f"Datum csys-{len(self.features) + 1}", len(self.features) + 1)
+        self.features[feature.name] = feature
+        return feature
+
+    def Instance(self, name, part, dependent=None):
+        self._record('Instance', name=name, part=part.name, dependent=dependent)
+        if name in self.instances:
+            raise ValueError(f"Instance: {name} already exists")
+        self.instances[name] = PartInstance(name, part, dependent)
+        return self.instances[name]
+
+    def InstanceFromBooleanMerge(self, name, instances, keepIntersections=None, originalInstances=None, domain=None):
+        self._record('InstanceFromBooleanMerge', name=name, instances=[i.name for i in instances],
+                     keepIntersections=keepIntersections, originalInstances=originalInstances, domain=domain)
+        part = Part(name, instances[0].part.dimensionality, instances[0].part.type)
+        part.merge_from([instance.part for instance in instances])
+        self.model.parts[name] = part
+
+        if originalInstances is DELETE:
+            for instance in instances:
+                del self.instances[instance.name]
+
+        instance = PartInstance(name + '-1', part)
+        self.instances[instance.name] = instance
+        return instance
+
+    def translate(self, instanceList, vector):
+        self._record('translate', instanceList=instanceList, vector=vector)
+        for name in instanceList:
+            translation = self.instances[name].translation
+            for axis in range(3):
+                translation[axis] += vector[axis]
+
+    def Surface(self, name, side1Edges):
+        self._record('Surface', name=name, side1Edges=side1Edges)
+        if not side1Edges:
+            raise ValueError(f"Surface: {name} has no edges")
+        self.surfaces[name] = Surface(name, side1Edges)
+        return self.surfaces[name]
+
+    def Set(self, name, edges=None, faces=None):
+        self._record('Set', name=name, edges=edges, faces=faces)
+        if not edges and not faces:
+            raise ValueError(f"Set: {name} is empty")
+        self.sets[name] = AssemblySet(name, edges, faces)
+        return self.sets[name]
+
+    def regenerate(self):
+        self._record('regenerate')
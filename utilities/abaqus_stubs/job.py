@@ -0,0 +1,50 @@
+import os
+
+from _inp import write_input
+from _recorder import StubObject, check_options
+from _results import write_odb, write_status_files
+from abaqusConstants import ABORTED, COMPLETED
+
+__all__ = ['Job']
+
+JOB_OPTIONS = (
+    'activateLoadBalancing', 'atTime', 'contactPrint', 'description', 'echoPrint', 'explicitPrecision',
+    'historyPrint', 'memory', 'memoryUnits', 'modelPrint', 'multiprocessingMode', 'nodalOutputPrecision',
+    'numCpus', 'numDomains', 'parallelizationMethodExplicit', 'queue', 'resultsFormat', 'scratch', 'type',
+    'userSubroutine', 'waitHours', 'waitMinutes', 'numGPUs',
+)
+
+
+class Job(StubObject):
+    def __init__(self, mdb, name, model, **options):
+        check_options('Job', options, JOB_OPTIONS)
+        if model not in mdb.models:
+            raise KeyError(f"Job: model {model} does not exist")
+        self.mdb = mdb
+        self.name = name
+        self.model = model
+        self.status = None
+        for key, value in options.items():
+            setattr(self, key, value)
+
+    def writeInput(self, consistencyChecking=None):
+        self._record('writeInput', name=self.name)
+        write_input(self.mdb.models[self.model], self.name, os.path.join(os.getcwd(), self.name + '.inp'))
+
+    def submit(self, consistencyChecking=None):
+        # The stub solver finishes before submit returns and writes the usual job files to the working directory.
+        self._record('submit', name=self.name)
+        model = self.mdb.models[self.model]
+        work_dir = os.getcwd()
+        n_elements = sum(len(instance.part.elements) for instance in model.rootAssembly.instances.values())
+
+        write_odb(model, os.path.join(work_dir, self.name + '.odb'))
+        write_status_files(model, self.name, work_dir, max(n_elements, 1))
+        self.status = COMPLETED
+
+    def waitForCompletion(self):
+        self._record('waitForCompletion', name=self.name)
+
+    def kill(self):
+        self._record('kill', name=self.name)
+        self.status = ABORTED
@@ -0,0 +1,33 @@
+from _recorder import StubObject
+
+__all__ = ['MappedField', 'TabularAmplitude']
+
+
+class MappedField(StubObject):
+    def __init__(self, name, xyzPointData, **options):
+        self.name = name
+        self.xyzPointData = xyzPointData
+
+
+class TabularAmplitude(StubObject):
+    def __init__(self, name, data, **options):
+        self.name = name
+        self.data = data
+
+
+class Load(StubObject):
+    def __init__(self, name, createStepName, region, **options):
+        self.name = name
+        self.createStepName = createStepName
+        self.region = region
+        self.deactivatedIn = None
+        for key, value in options.items():
+            setattr(self, key, value)
+
+    def deactivate(self, stepName):
+        self._record('deactivate', stepName=stepName)
+        self.deactivatedIn = stepName
+
+
+class BoundaryCondition(Load):
+    pass
@@ -0,0 +1,49 @@
+from _recorder import StubObject
+
+__all__ = ['Material']
+
+
+def _check_table(owner, table):
+    if not isinstance(table, tuple) or not all(isinstance(row, tuple) for row in table):
+        raise TypeError(f"{owner}: table must be a tuple of tuples")
+
+
+class MaterialBehavior(StubObject):
+    def __init__(self, table, **options):
+        self.table = table
+        for key, value in options.items():
+            setattr(self, key, value)
+
+
+class Plastic(MaterialBehavior):
+    def RateDependent(self, table, type):
+        self._record('RateDependent', table=table, type=type)
+        _check_table('RateDependent', table)
+        self.rateDependent = MaterialBehavior(table, type=type)
+        return self.rateDependent
+
+
+class Material(StubObject):
+    def __init__(self, name):
+        self.name = name
+        self.plastic = None
+        self.elastic = None
+        self.density = None
+
+    def Plastic(self, table, hardening):
+        self._record('Plastic', table=table, hardening=hardening)
+        _check_table('Plastic', table)
+        self.plastic = Plastic(table, hardening=hardening)
+        return self.plastic
+
+    def Elastic(self, table):
+        self._record('Elastic', table=table)
+        _check_table('Elastic', table)
+        self.elastic = MaterialBehavior(table)
+        return self.elastic
+
+    def Density(self, table):
+        self._record('Density', table=table)
+        _check_table('Density', table)
+        self.density = MaterialBehavior(table)
+        return self.density
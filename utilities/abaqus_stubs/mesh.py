@@ -0,0 +1,46 @@
+from _recorder import StubObject
+
+__all__ = ['ElemType']
+
+DEFAULT_QUAD_TYPE = 'CAX4R'
+
+
+class ElemType(StubObject):
+    def __init__(self, elemCode, elemLibrary=None, **options):
+        self.elemCode = elemCode
+        self.elemLibrary = elemLibrary
+
+
+def graded_coordinates(start, end, fine_end, fine_size, coarse_size, growth=1.2):
+    # Fine spacing up to fine_end, then sizes grow geometrically up to coarse_size, like a biased seed.
+    coordinates = [start]
+    size = fine_size
+    while coordinates[-1] < end - 1e-9:
+        if coordinates[-1] >= fine_end - 1e-9:
+            size = min(size * growth, coarse_size)
+        coordinates.append(min(coordinates[-1] + size, end))
+
+    if len(coordinates) > 2 and coordinates[-1] - coordinates[-2] < 0.5 * size:
+        del coordinates[-2]
+    return coordinates
+
+
+def structured_mesh(x_coordinates, y_coordinates, element_type):
+    # Quad grid with counter-clockwise connectivity; element_type(x, y) picks the type from the centroid.
+    nx = len(x_coordinates)
+    nodes = [
+        (j * nx + i + 1, x, y)
+        for j, y in enumerate(y_coordinates)
+        for i, x in enumerate(x_coordinates)
+    ]
+
+    elements = []
+    for j in range(len(y_coordinates) - 1):
+        for i in range(nx - 1):
+            first = j * nx + i + 1
+            connectivity = (first, first + 1, first + nx + 1, first + nx)
+            centroid_x = 0.5 * (x_coordinates[i] + x_coordinates[i + 1])
+            centroid_y = 0.5 * (y_coordinates[j] + y_coordinates[j + 1])
+            elements.append((len(elements) + 1, element_type(centroid_x, centroid_y), connectivity))
+
+    return nodes, elements
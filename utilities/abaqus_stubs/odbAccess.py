@@ -0,0 +1,151 @@
+import json
+
+import numpy as np
+
+from _recorder import StubObject, recorder
+from _results import progress, residual_stress
+from abaqusConstants import ELEMENT_NODAL, INTEGRATION_POINT, NODAL
+
+# name: (component labels, output position)
+FIELDS = {
+    'S': (('S11', 'S22', 'S33', 'S12'), INTEGRATION_POINT),
+    'PEEQ': ((), INTEGRATION_POINT),
+    'U': (('U1', 'U2'), NODAL),
+}
+
+
+class OdbNode:
+    def __init__(self, label, coordinates):
+        self.label = label
+        self.coordinates = coordinates
+
+
+class OdbElement:
+    def __init__(self, label, type, connectivity):
+        self.label = label
+        self.type = type
+        self.connectivity = connectivity
+
+
+class OdbSet(StubObject):
+    def __init__(self, name, instance, elements):
+        self.name = name
+        self.instance = instance
+        self.elements = elements
+
+
+class OdbInstance(StubObject):
+    def __init__(self, data):
+        self.name = str(data['name'])
+        self.nodes = [OdbNode(label, (float(x), float(y), 0.0)) for label, x, y in data['nodes']]
+        self.elements = [OdbElement(label, str(element_type), tuple(connectivity))
+                         for label, element_type, connectivity in data['elements']]
+
+        by_label = dict((element.label, element) for element in self.elements)
+        self.elementSets = dict(
+            (str(name), OdbSet(str(name), self, [by_label[label] for label in labels]))
+            for name, labels in data['elementSets'].items()
+        )
+
+        self.nodeLabels = np.array([node.label for node in self.nodes])
+        self.nodeCoordinates = np.array([node.coordinates[:2] for node in self.nodes])
+        self.top = float(self.nodeCoordinates[:, 1].max())
+
+    def node_stress(self, node_labels, fraction):
+        coordinates = self.nodeCoordinates[np.searchsorted(self.nodeLabels, node_labels)]
+        return residual_stress(np.abs(coordinates[:, 0]), self.top - coordinates[:, 1], fraction)
+
+
+class FieldLocation:
+    def __init__(self, position):
+        self.position = position
+
+
+class FieldBulkData:
+    def __init__(self, baseElementType, nodeLabels, elementLabels, data):
+        self.baseElementType = baseElementType
+        self.nodeLabels = nodeLabels
+        self.elementLabels = elementLabels
+        self.data = data
+
+
+class FieldOutput(StubObject):
+    def __init__(self, name, frame, bulkDataBlocks=()):
+        self.name = name
+        self.frame = frame
+        self.componentLabels, position = FIELDS[name]
+        self.locations = [FieldLocation(position)]
+        self.bulkDataBlocks = list(bulkDataBlocks)
+
+    def _values(self, instance, node_labels):
+        s11 = instance.node_stress(node_labels, self.frame.progress)
+        if self.name == 'S':
+            return np.column_stack([s11, 0.5 * s11, 0.8 * s11, np.zeros_like(s11)]).astype(np.float32)
+        if self.name == 'PEEQ':
+            return (0.01 * np.abs(s11) / 300.0).astype(np.float32).reshape(-1, 1)
+        return np.column_stack([np.zeros_like(s11), 1e-6 * s11]).astype(np.float32)
+
+    def getSubset(self, region=None, position=None):
+        self._record('getSubset', region=getattr(region, 'name', None), position=position)
+        instance = region.instance
+        blocks = []
+        # As in Abaqus, the bulk data is split into one block per element type.
+        for element_type in sorted(set(element.type for element in region.elements)):
+            elements = [element for element in region.elements if element.type == element_type]
+            if position is NODAL:
+                node_labels = np.unique([node for element in elements for node in element.connectivity])
+                element_labels = None
+            else:
+                node_labels = np.array([node for element in elements for node in element.connectivity])
+                element_labels = np.array([element.label for element in elements for _ in element.connectivity])
+            blocks.append(FieldBulkData(element_type, node_labels, element_labels, self._values(instance, node_labels)))
+
+        return FieldOutput(self.name, self.frame, blocks)
+
+
+class OdbFrame(StubObject):
+    def __init__(self, step, frameId, frameValue, totalTime, shotDuration):
+        self.step = step
+        self.frameId = frameId
+        self.frameValue = frameValue
+        self.progress = progress(totalTime, shotDuration)
+
+    @property
+    def fieldOutputs(self):
+        return dict((name, FieldOutput(name, self)) for name in FIELDS)
+
+
+class OdbStep(StubObject):
+    def __init__(self, data, shot_duration):
+        self.name = str(data['name'])
+        self.timePeriod = data['timePeriod']
+        self.frames = [
+            OdbFrame(self, k, data['timePeriod'] * k / data['numIntervals'],
+                     data['start'] + data['timePeriod'] * k / data['numIntervals'], shot_duration)
+            for k in range(data['numIntervals'] + 1)
+        ]
+
+
+class OdbAssembly(StubObject):
+    def __init__(self, instances):
+        self.instances = dict((instance.name, instance) for instance in instances)
+
+
+class Odb(StubObject):
+    def __init__(self, path):
+        with open(path, 'r') as f:
+            data = json.load(f)
+
+        self.path = path
+        self.name = data['name']
+        self.rootAssembly = OdbAssembly([OdbInstance(instance) for instance in data['instances']])
+        shot_duration = data['steps'][0]['timePeriod'] if data['steps'] else 1.0
+        self.steps = dict((str(step['name']), OdbStep(step, shot_duration)) for step in data['steps'])
+
+    def close(self):
+        self._record('close')
+
+
+def openOdb(path, readOnly=False):
+    recorder.record('openOdb', (), {'path': path, 'readOnly': readOnly})
+    return Odb(path)
@@ -0,0 +1 @@
+# The backend imports this Abaqus module for its side effects only; nothing in it is used.
@@ -0,0 +1,227 @@
+from _recorder import Edge, EntityArray, Face, StubObject, Vertex
+from mesh import DEFAULT_QUAD_TYPE, graded_coordinates, structured_mesh
+
+__all__ = ['Part', 'PartInstance']
+
+
+def rectangle_region(rectangle):
+    x0, y0, x1, y1 = rectangle
+    return lambda x, y: x0 - 1e-9 <= x <= x1 + 1e-9 and y0 - 1e-9 <= y <= y1 + 1e-9
+
+
+def difference_region(outer, inner):
+    inside_outer, inside_inner = rectangle_region(outer), rectangle_region(inner)
+    return lambda x, y: inside_outer(x, y) and not inside_inner(x, y)
+
+
+class Feature(StubObject):
+    def __init__(self, name, id):
+        self.name = name
+        self.id = id
+
+
+class DatumPoint(StubObject):
+    def __init__(self, id, pointOn):
+        self.id = id
+        self.pointOn = tuple(pointOn)
+
+
+class PartSet(StubObject):
+    def __init__(self, name, faces=None, edges=None, elementLabels=None):
+        self.name = name
+        self.faces = faces or EntityArray()
+        self.edges = edges or EntityArray()
+        self.elementLabels = elementLabels
+
+    def element_labels(self, part):
+        if self.elementLabels is not None:
+            return list(self.elementLabels)
+
+        coordinates = dict((label, (x, y)) for label, x, y in part.nodes)
+        labels = []
+        for label, _, connectivity in part.elements:
+            x = sum(coordinates[node][0] for node in connectivity) / len(connectivity)
+            y = sum(coordinates[node][1] for node in connectivity) / len(connectivity)
+            if any(face.contains(x, y) for face in self.faces):
+                labels.append(label)
+        return labels
+
+
+class Part(StubObject):
+    def __init__(self, name, dimensionality=None, type=None):
+        self.name = name
+        self.dimensionality = dimensionality
+        self.type = type
+        self.faces = EntityArray()
+        self.edges = EntityArray()
+        self.vertices = EntityArray()
+        self.features = {}
+        self.datums = {}
+        self.sets = {}
+        self.sectionAssignments = []
+        self.outline = None
+        self.inner = None
+        self.seedSizes = []
+        self.seedNumbers = []
+        self.elemTypes = []
+        self.nodes = []
+        self.elements = []
+
+    def _add_feature(self, name):
+        feature = Feature(name, len(self.features) + 1)
+        self.features[name] = feature
+        return feature
+
+    def _set_topology(self, regions, n_edges, n_vertices):
+        self.faces = EntityArray(Face(i, region) for i, region in enumerate(regions))
+        self.edges = EntityArray(Edge(i) for i in range(n_edges))
+        self.vertices = EntityArray(Vertex(i) for i in range(n_vertices))
+
+    def BaseShell(self, sketch):
+        self._record('BaseShell', sketch=sketch.name)
+        if not sketch.rectangles:
+            raise ValueError("BaseShell: the sketch has no closed profile")
+
+        self.outline = sketch.rectangles[-1]
+        self._set_topology([rectangle_region(self.outline)], 4, 4)
+        return self._add_feature('Shell planar-1')
+
+    def merge_from(self, parts):
+        # Two rectangles sharing a corner: the finite cube inside the infinite one.
+        rectangles = [part.outline for part in parts]
+        self.inner = rectangles[0]
+        self.outline = (
+            min(r[0] for r in rectangles), min(r[1] for r in rectangles),
+            max(r[2] for r in rectangles), max(r[3] for r in rectangles),
+        )
+        self._set_topology([difference_region(self.outline, self.inner), rectangle_region(self.inner)], 8, 7)
+        # The merged part carries one feature per original instance plus the merge itself,
+        # so the first datum point gets id 4 as in a CAE session.
+        for part in parts:
+            self._add_feature(part.name + '-1')
+        self._add_feature('Merge-1')
+
+    def DatumPointByCoordinate(self, coords):
+        self._record('DatumPointByCoordinate', coords=coords)
+        feature = self._add_feature(f"Datum pt-{len(self.datums) + 1}")
+        self.datums[feature.id] = DatumPoint(feature.id, coords)
+        return feature
+
+    def _partition(self, method, faces):
+        if not faces:
+            raise ValueError(f"{method}: no face to partition")
+        for face in faces:
+            if face not in self.faces:
+                raise ValueError(f"{method}: face {face.index} does not belong to part {self.name}")
+
+        # A partition splits one face and one edge; the new face keeps its parent's region,
+        # which is enough for findAt on the original faces.
+        self.faces.append(Face(len(self.faces), faces[0].region))
+        self.edges.extend(Edge(len(self.edges) + i) for i in range(2))
+        self.vertices.append(Vertex(len(self.vertices)))
+        return self._add_feature(f"Partition face-{len(self.features) + 1}")
+
+    def PartitionFaceByShortestPath(self, faces, point1, point2):
+        self._record('PartitionFaceByShortestPath', faces=faces, point1=point1, point2=point2)
+        for point in (point1, point2):
+            if not isinstance(point, (DatumPoint, Vertex)):
+                raise TypeError("PartitionFaceByShortestPath: points must be vertices or datum points")
+        return self._partition('PartitionFaceByShortestPath', faces)
+
+    def PartitionFaceByProjectingEdges(self, edges, faces, extendEdges=False):
+        self._record('PartitionFaceByProjectingEdges', edges=edges, faces=faces, extendEdges=extendEdges)
+        if not edges:
+            raise ValueError("PartitionFaceByProjectingEdges: no edge to project")
+        return self._partition('PartitionFaceByProjectingEdges', faces)
+
+    def Set(self, name, faces=None, edges=None):
+        self._record('Set', name=name, faces=faces, edges=edges)
+        self.sets[name] = PartSet(name, faces=faces, edges=edges)
+        return self.sets[name]
+
+    def SectionAssignment(self, region, sectionName, **options):
+        self._record('SectionAssignment', region=region.name, sectionName=sectionName, **options)
+        self.sectionAssignments.append((region.name, sectionName))
+
+    def setMeshControls(self, regions, **options):
+        self._record('setMeshControls', regions=regions, **options)
+
+    def setSweepPath(self, edge, region, sense):
+        self._record('setSweepPath', edge=edge, region=region, sense=sense)
+        if not isinstance(edge, Edge) or not isinstance(region, Face):
+            raise TypeError("setSweepPath: expected an edge and a face")
+
+    def seedEdgeBySize(self, edges, size, **options):
+        self._record('seedEdgeBySize', edges=edges, size=size, **options)
+        self.seedSizes.append(size)
+
+    def seedEdgeByBias(self, biasMethod, end1Edges, end2Edges, minSize, maxSize, **options):
+        self._record('seedEdgeByBias', end1Edges=end1Edges, end2Edges=end2Edges, minSize=minSize, maxSize=maxSize)
+        self.seedSizes.extend([minSize, maxSize])
+
+    def seedEdgeByNumber(self, edges, number, **options):
+        self._record('seedEdgeByNumber', edges=edges, number=number, **options)
+        self.seedNumbers.append(number)
+
+    def setElementType(self, regions, elemTypes):
+        self._record('setElementType', regions=regions, elemTypes=[str(e.elemCode) for e in elemTypes])
+        self.elemTypes = [str(e.elemCode) for e in elemTypes]
+
+    def generateMesh(self):
+        self._record('generateMesh')
+        if self.outline is None:
+            raise ValueError(f"generateMesh: part {self.name} has no geometry")
+
+        x0, y0, x1, y1 = self.outline
+        fine_size = min(self.seedSizes) if self.seedSizes else (x1 - x0) / 20.0
+        coarse_size = max(self.seedSizes) if self.seedSizes else fine_size
+        if self.inner is None:
+            xs = graded_coordinates(x0, x1, x1, fine_size, fine_size)
+            ys = graded_coordinates(y0, y1, y1, fine_size, fine_size)
+            self.nodes, self.elements = structured_mesh(xs, ys, lambda x, y: DEFAULT_QUAD_TYPE)
+            return
+
+        # The interest region spans from the axis and the top surface to the datum points of the partitions.
+        inner_x0, inner_y0, inner_x1, inner_y1 = self.inner
+        datum_points = [datum.pointOn for datum in self.datums.values()]
+        interest_x = max([p[0] for p in datum_points] or [inner_x1])
+        interest_y = min([p[1] for p in datum_points] or [inner_y0])
+        border_elements = min(self.seedNumbers) if self.seedNumbers else 1
+
+        xs = graded_coordinates(inner_x0, inner_x1, interest_x, fine_size, coarse_size)
+        xs += [inner_x1 + (x1 - inner_x1) * (k + 1) / border_elements for k in range(border_elements)]
+        depths = graded_coordinates(0.0, inner_y1 - inner_y0, inner_y1 - interest_y, fine_size, coarse_size)
+        ys = [y0 + (inner_y0 - y0) * k / border_elements for k in range(border_elements)]
+        ys += [inner_y1 - depth for depth in reversed(depths)]
+
+        border_type = next((code for code in self.elemTypes if '4' in code), DEFAULT_QUAD_TYPE)
+        inside_inner = rectangle_region(self.inner)
+        self.nodes, self.elements = structured_mesh(
+            xs, ys, lambda x, y: DEFAULT_QUAD_TYPE if inside_inner(x, y) else border_type
+        )
+
+    def element_sets(self):
+        return dict((name, part_set.element_labels(self)) for name, part_set in self.sets.items()
+                    if part_set.faces or part_set.elementLabels is not None)
+
+
+class PartInstance(StubObject):
+    def __init__(self, name, part, dependent=None):
+        self.name = name
+        self.part = part
+        self.dependent = dependent
+        self.translation = [0.0, 0.0, 0.0]
+
+    # Dependent instances share the geometry of their part.
+    @property
+    def faces(self):
+        return self.part.faces
+
+    @property
+    def edges(self):
+        return self.part.edges
+
+    @property
+    def vertices(self):
+        return self.part.vertices
+
@@ -0,0 +1,10 @@
+from _recorder import StubObject
+
+__all__ = ['HomogeneousSolidSection']
+
+
+class HomogeneousSolidSection(StubObject):
+    def __init__(self, name, material, thickness=None):
+        self.name = name
+        self.material = material
+        self.thickness = thickness
@@ -0,0 +1,27 @@
+from _recorder import StubObject
+
+__all__ = ['ConstrainedSketch']
+
+
+class SketchOptions(StubObject):
+    pass
+
+
+class ConstrainedSketch(StubObject):
+    def __init__(self, name, sheetSize):
+        self.name = name
+        self.sheetSize = sheetSize
+        self.sketchOptions = SketchOptions()
+        self.constructionLines = []
+        self.rectangles = []
+
+    def ConstructionLine(self, point1, point2):
+        self._record('ConstructionLine', point1=point1, point2=point2)
+        self.constructionLines.append((tuple(point1), tuple(point2)))
+
+    def rectangle(self, point1, point2):
+        self._record('rectangle', point1=point1, point2=point2)
+        self.rectangles.append((
+            min(point1[0], point2[0]), min(point1[1], point2[1]),
+            max(point1[0], point2[0]), max(point1[1], point2[1]),
+        ))
@@ -0,0 +1,36 @@
+from _recorder import StubObject, check_options
+
+__all__ = ['ExplicitDynamicsStep', 'FieldOutputRequest', 'HistoryOutputRequest']
+
+EXPLICIT_STEP_OPTIONS = (
+    'description', 'timePeriod', 'nlgeom', 'adiabatic', 'timeIncrementationMethod', 'maxIncrement', 'scaleFactor',
+    'userDefinedInc', 'massScaling', 'linearBulkViscosity', 'quadBulkViscosity', 'improvedDtMethod',
+)
+
+
+class ExplicitDynamicsStep(StubObject):
+    def __init__(self, name, previous, **options):
+        check_options('ExplicitDynamicsStep', options, EXPLICIT_STEP_OPTIONS)
+        self.name = name
+        self.previous = previous
+        self.timePeriod = options.get('timePeriod', 1.0)
+        self.scaleFactor = options.get('scaleFactor', 1.0)
+        self.linearBulkViscosity = options.get('linearBulkViscosity', 0.06)
+        self.quadBulkViscosity = options.get('quadBulkViscosity', 1.2)
+        self.massScaling = options.get('massScaling', ())
+
+
+class FieldOutputRequest(StubObject):
+    def __init__(self, name, createStepName, variables=('S', 'U'), numIntervals=20):
+        self.name = name
+        self.createStepName = createStepName
+        self.variables = variables
+        self.numIntervals = numIntervals
+
+
+class HistoryOutputRequest(StubObject):
+    def __init__(self, name, createStepName, variables=('ALLKE', ), numIntervals=200):
+        self.name = name
+        self.createStepName = createStepName
+        self.variables = variables
+        self.numIntervals = numIntervals
@@ -0,0 +1,43 @@
+import numpy as np
+
+from _recorder import StubObject
+
+__all__ = ['Path', 'XYData']
+
+
+class Path(StubObject):
+    def __init__(self, name, type, expression):
+        self.name = name
+        self.type = type
+        self.expression = tuple(tuple(point) for point in expression)
+
+
+class XYData(StubObject):
+    def __init__(self, name, data):
+        self.name = name
+        self.data = data
+
+
+def path_data(odb, path, frame, step, tolerance=1e-6):
+    # S11 at the nodes lying on a two-point path, i.e. at the element boundaries it crosses.
+    start = np.asarray(path.expression[0][:2], dtype=float)
+    end = np.asarray(path.expression[-1][:2], dtype=float)
+    length = np.linalg.norm(end - start)
+    direction = (end - start) / length
+
+    odb_step = list(odb.steps.values())[step]
+    odb_frame = odb_step.frames[frame]
+
+    points = []
+    for instance in odb.rootAssembly.instances.values():
+        relative = instance.nodeCoordinates - start
+        along = relative.dot(direction)
+        off = np.abs(relative[:, 0] * direction[1] - relative[:, 1] * direction[0])
+        on_path = (off <= tolerance * max(length, 1.0)) & (along >= -tolerance) & (along <= length + tolerance)
+        if not on_path.any():
+            continue
+
+        values = instance.node_stress(instance.nodeLabels[on_path], odb_frame.progress)
+        points.extend(zip(np.clip(along[on_path], 0.0, length), values))
+
+    return tuple((float(d), float(v)) for d, v in sorted(points))
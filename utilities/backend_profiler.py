@@ -0,0 +1,187 @@
+import codecs
+import cProfile
+import importlib
+import json
+import os
+import pstats
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from collections import defaultdict
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BACKEND_DIR = os.path.join(REPO_DIR, 'backend')
+STUBS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'abaqus_stubs')
+
+# (stage, module, class, method) timed around every call during a run.
+TIMED_METHODS = [
+    ('simulation', 'run_simulation', 'Simulation', 'run'),
+    ('modify_element_type', 'run_simulation', 'Simulation', '_modify_element_type'),
+    ('stub_abaqus', 'part', 'Part', 'generateMesh'),
+    ('stub_abaqus', 'job', 'Job', 'writeInput'),
+    ('stub_abaqus', 'abaqus', 'ModelDatabase', 'ModelFromInputFile'),
+    ('stub_abaqus', 'job', 'Job', 'submit'),
+    ('stub_odb', 'odbAccess', 'Odb', '__init__'),
+    ('extraction', 'run_extraction', 'OdbDataExtractor', 'run'),
+    ('extraction', 'extract_profiles', 'OdbProfileExtractor', 'run'),
+]
+
+# Stages made of backend code; stub_abaqus is the stubs' own meshing, input-file and solver work and is never flagged.
+TRACKED_STAGES = ('model_building', 'modify_element_type', 'extraction_session', 'extraction_odbAccess')
+
+# Slowdowns below this many seconds are timer noise on stages that only take a few milliseconds.
+NOISE_FLOOR = 1e-3
+
+
+def _register_mbcs():
+    # run_simulation.py declares the Windows-only mbcs source encoding.
+    try:
+        codecs.lookup('mbcs')
+    except LookupError:
+        codecs.register(lambda name: codecs.lookup('cp1252') if name == 'mbcs' else None)
+
+
+def _timed(function, stage, timings):
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            timings[stage] += time.perf_counter() - start
+    return wrapper
+
+
+class BackendProfiler:
+    def __init__(self, model_config_path, workspace=None, batch_size=1):
+        with open(model_config_path, 'r') as f:
+            self.model_config = json.load(f)
+
+        self.temporary = workspace is None
+        self.workspace = tempfile.mkdtemp(prefix='lsp_profile_') if workspace is None else os.path.abspath(workspace)
+        self.batch_size = batch_size
+        self.config_path = os.path.join(self.workspace, 'model_config', 'model_config_profile.json')
+
+        # The backend modules resolve `abaqus`, `odbAccess`, ... to the stubs for the whole process.
+        _register_mbcs()
+        for path in (BACKEND_DIR, STUBS_DIR):
+            if path not in sys.path:
+                sys.path.insert(0, path)
+
+        os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
+        os.environ["BACKEND_PROJECT_PATH"] = self.workspace
+        os.environ["MODEL_CONFIG_FILE"] = self.config_path
+        os.environ["ABAQUS_LOG_FILE"] = os.path.join(self.workspace, "log", "abaqus_log_profile.txt")
+        self.recorder = importlib.import_module('_recorder').recorder
+
+    def close(self):
+        if self.temporary:
+            shutil.rmtree(self.workspace, ignore_errors=True)
+
+    def _write_model_config(self, engine):
+        config = json.loads(json.dumps(self.model_config))
+        model_name = next(iter(config))
+        config[model_name]['odbExtractor']['engine'] = engine
+
+        model_builder = config[model_name]['modelBuilder']
+        model_builder['runName'] = 'profile'
+        model_builder['job']['scratchDir'] = None
+        if self.batch_size > 1:
+            model_builder['batchMembers'] = [
+                {'runName': f'profile_b{k}', 'material': model_builder['material'], 'pulse': model_builder['pulse']}
+                for k in range(self.batch_size)
+            ]
+
+        with open(self.config_path, 'w') as f:
+            json.dump(config, f, indent=4)
+
+    def run_command(self, engine='session', profiler=None):
+        self._write_model_config(engine)
+        self.recorder.reset()
+        command = importlib.import_module('command').Command()
+
+        working_dir = os.getcwd()
+        try:
+            if profiler is not None:
+                profiler.runcall(command.run)
+            else:
+                command.run()
+        finally:
+            os.chdir(working_dir)
+
+    def profile(self, engine='session', stats_path=None, top=30):
+        profiler = cProfile.Profile()
+        self.run_command(engine, profiler)
+
+        if stats_path:
+            profiler.dump_stats(stats_path)
+            print(f"[Profile] Stats saved to {stats_path} (open with `python -m pstats` or snakeviz).")
+
+        pstats.Stats(profiler).strip_dirs().sort_stats('cumulative').print_stats(top)
+        print("[Profile] Most frequent Abaqus API calls:")
+        for name, count in self.recorder.counts().most_common(10):
+            print(f"    {count:6d}  {name}")
+
+    def _timed_run(self, engine):
+        timings = defaultdict(float)
+        originals = []
+        for stage, module_name, class_name, method_name in TIMED_METHODS:
+            owner = getattr(importlib.import_module(module_name), class_name)
+            originals.append((owner, method_name, getattr(owner, method_name)))
+            setattr(owner, method_name, _timed(getattr(owner, method_name), stage, timings))
+
+        try:
+            self.run_command(engine)
+        finally:
+            for owner, method_name, original in originals:
+                setattr(owner, method_name, original)
+
+        # Opening the ODB means parsing a JSON file in the stubs, so it is moved out of the extraction stage.
+        stub_odb = timings.pop('stub_odb', 0.0)
+        timings['model_building'] = timings['simulation'] - timings['stub_abaqus'] - timings['modify_element_type']
+        timings[f'extraction_{engine}'] = timings.pop('extraction') - stub_odb
+        timings['stub_abaqus'] += stub_odb
+        return timings
+
+    def benchmark(self, engines=('session', 'odbAccess'), repeat=5):
+        samples = defaultdict(list)
+        for engine in engines:
+            for _ in range(repeat):
+                for stage, seconds in self._timed_run(engine).items():
+                    samples[stage].append(seconds)
+
+        return {
+            'settings': {
+                'engines': list(engines),
+                'repeat': repeat,
+                'batch_size': self.batch_size,
+                'python': sys.version.split()[0],
+            },
+            'stages': dict(
+                (stage, {'median': statistics.median(values), 'min': min(values), 'n': len(values)})
+                for stage, values in samples.items()
+            ),
+            'api_calls': dict(self.recorder.counts()),
+        }
+
+    @staticmethod
+    def compare(results, baseline, tolerance=0.2):
+        # Best-of-n times are compared, they are far less noisy than the medians.
+        regressions = []
+        print(f"{'stage':>22} {'median [ms]':>12} {'best [ms]':>10} {'baseline best':>14} {'ratio':>7}")
+        for stage, stats in sorted(results['stages'].items()):
+            reference = baseline.get('stages', {}).get(stage)
+            if reference is None or reference['min'] <= 0:
+                print(f"{stage:>22} {1e3 * stats['median']:12.2f} {1e3 * stats['min']:10.2f} {'-':>14} {'-':>7}")
+                continue
+
+            ratio = stats['min'] / reference['min']
+            flagged = (stage in TRACKED_STAGES and ratio > 1.0 + tolerance
+                       and stats['min'] - reference['min'] > NOISE_FLOOR)
+            print(f"{stage:>22} {1e3 * stats['median']:12.2f} {1e3 * stats['min']:10.2f} {1e3 * reference['min']:14.2f} "
+                  f"{ratio:7.2f}{'  SLOWER' if flagged else ''}")
+            if flagged:
+                regressions.append(stage)
+
+        return regressions
@@ -0,0 +1,61 @@
+import json
+import os
+
+import numpy as np
+
+from backend.profile_paths import average_to_nodes, resolve_point_paths, sample_path
+
+
+def load_snapshot(snapshot_path):
+    with np.load(snapshot_path) as archive:
+        snapshot = {key: archive[key] for key in archive.files}
+
+    mesh_path = os.path.join(os.path.dirname(snapshot_path), str(snapshot['mesh_file']))
+    with np.load(mesh_path) as archive:
+        snapshot['mesh'] = {key: archive[key] for key in archive.files}
+
+    return snapshot
+
+
+def nodal_component(snapshot, field_name, component):
+    component_labels = [str(c) for c in snapshot[field_name + '/componentLabels']]
+    data = snapshot[field_name + '/data']
+    values = data[:, component_labels.index(component)] if data.ndim > 1 else data
+
+    labels, nodal_values = average_to_nodes(snapshot[field_name + '/nodeLabels'], values)
+
+    mesh = snapshot['mesh']
+    node_index = {label: i for i, label in enumerate(mesh['nodeLabels'])}
+    coordinates = mesh['coordinates'][[node_index[label] for label in labels]]
+
+    return coordinates, nodal_values
+
+
+def path_profile(snapshot, field_name, component, start, end, tolerance=1e-4):
+    coordinates, nodal_values = nodal_component(snapshot, field_name, component)
+    return np.array(sample_path(coordinates, nodal_values, start, end, tolerance))
+
+
+def standard_profiles(snapshot, odb_config, field_name='S', component='S11', tolerance=1e-4):
+    geometry = json.loads(str(snapshot['mesh']['geometry']))
+    y_offset = float(snapshot['mesh']['yOffset']) if 'yOffset' in snapshot['mesh'] else 0.0
+    paths = resolve_point_paths(odb_config, geometry, y_offset)
+
+    return {
+        path_name: path_profile(snapshot, field_name, component, start, end, tolerance)
+        for path_name, (start, end) in paths.items()
+    }
+
+
+def compressive_layer_depth(depth_profile):
+    depth_profile = np.asarray(depth_profile)
+    depths, stresses = depth_profile[:, 0], depth_profile[:, 1]
+
+    tensile = np.nonzero(stresses >= 0.0)[0]
+    if len(tensile) == 0:
+        return float(depths[-1])
+    if tensile[0] == 0:
+        return 0.0
+
+    i = tensile[0]
+    return float(np.interp(0.0, [stresses[i - 1], stresses[i]], [depths[i - 1], depths[i]]))